@@ -0,0 +1,80 @@
+"""Cost of loading the configuration at startup: parsing every file twice with the pure Python YAML parser (before) vs.
+one pass with libyaml, a warm start (cache on disk) and an in-app reload (cache in memory).
+
+Usage: python benchmarks/config_benchmark.py [--widgets 50] [--runs 20]
+
+Uses base.yaml and copies of the shipped widget configurations.
+"""
+import argparse
+import itertools
+import pathlib
+import shutil
+import statistics
+import tempfile
+import time
+import typing
+import yaml
+from twidgets.core.base import ConfigCache, ConfigLoader
+
+CONFIG_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent / 'twidgets' / 'config'
+
+
+def measure(func: typing.Callable[[], typing.Any], runs: int) -> float:
+    """Median in ms"""
+    durations: list[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--widgets', type=int, default=50, help='Widget configurations')
+    parser.add_argument('--runs', type=int, default=20, help='Runs per measurement')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths: list[pathlib.Path] = [pathlib.Path(directory) / 'base.yaml']
+        shutil.copy(CONFIG_DIR / 'base.yaml', paths[0])
+        shipped: typing.Iterator[pathlib.Path] = itertools.cycle(sorted((CONFIG_DIR / 'widgets').glob('*.yaml')))
+        for i in range(args.widgets):
+            paths.append(pathlib.Path(directory) / f'widget{i:02}.yaml')
+            shutil.copy(next(shipped), paths[-1])
+        cache_path: pathlib.Path = pathlib.Path(directory) / 'configs.pickle'
+
+        def before() -> None:
+            # ConfigScanner and WidgetContainer / WidgetLoader each parsed every file
+            for path in paths * 2:
+                with open(path, 'r', encoding='utf-8') as f:
+                    yaml.load(f, Loader=yaml.SafeLoader)
+
+        def cold_start() -> None:
+            cache_path.unlink(missing_ok=True)
+            cache: ConfigCache = ConfigCache(cache_path)
+            for path in paths:
+                cache.load(path, ConfigLoader.parse_yaml)
+            cache.save()
+
+        def warm_start() -> None:
+            cache: ConfigCache = ConfigCache(cache_path)
+            for path in paths:
+                cache.load(path, ConfigLoader.parse_yaml)
+
+        shared: ConfigCache = ConfigCache(cache_path)
+
+        def reload() -> None:
+            for path in paths:
+                shared.load(path, ConfigLoader.parse_yaml)
+
+        print(f'{len(paths)} configuration files ({ConfigLoader.YAML_LOADER.__name__}), median of {args.runs} runs:')
+        for name, func in (
+                ('before (parsed twice)', before), ('cold start', cold_start), ('warm start', warm_start),
+                ('reload', reload)
+        ):
+            print(f'  {name:>21}: {measure(func, args.runs):7.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Per-sample cost of the resources widget's system metrics: /proc fast path vs. psutil.
+
+Usage: python benchmarks/metrics_benchmark.py [--rate 10] [--seconds 10]
+
+Samples at the given rate (like the resources widget with sample_rate: 10) and reports the time spent per sample and
+the share of one CPU core that goes into sampling.
+"""
+import argparse
+import statistics
+import sys
+import time
+from twidgets.core.metrics import SystemMetrics, LinuxSystemMetrics, PsutilSystemMetrics
+
+
+def sample(system_metrics: SystemMetrics) -> None:
+    system_metrics.cpu_percent()
+    system_metrics.memory()
+    system_metrics.disk_usage('/')
+    system_metrics.network()
+
+
+def run(system_metrics: SystemMetrics, rate: float, seconds: float) -> list[float]:
+    durations: list[float] = []
+    interval: float = 1 / rate
+    next_sample: float = time.monotonic()
+    end: float = next_sample + seconds
+    while next_sample < end:
+        start: float = time.process_time()
+        sample(system_metrics)
+        durations.append(time.process_time() - start)
+        next_sample += interval
+        time.sleep(max(0.0, next_sample - time.monotonic()))
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=10, help='Samples per second')
+    parser.add_argument('--seconds', type=float, default=10, help='Duration per provider')
+    args = parser.parse_args()
+
+    providers: list[tuple[str, SystemMetrics]] = [('psutil', PsutilSystemMetrics())]
+    if sys.platform.startswith('linux'):
+        providers.append(('/proc (pread)', LinuxSystemMetrics()))
+
+    for name, system_metrics in providers:
+        durations: list[float] = run(system_metrics, args.rate, args.seconds)
+        system_metrics.close()
+        mean_us: float = statistics.mean(durations) * 1e6
+        p95_us: float = sorted(durations)[int(len(durations) * 0.95)] * 1e6
+        cpu_share: float = mean_us * args.rate / 1e6 * 100
+        print(
+            f'{name:>14}: {len(durations)} samples, mean {mean_us:.0f} µs, p95 {p95_us:.0f} µs, '
+            f'{cpu_share:.3f}% of one core at {args.rate:g} Hz'
+        )
+
+
+if __name__ == '__main__':
+    main()
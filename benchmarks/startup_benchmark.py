@@ -0,0 +1,139 @@
+"""Startup cost of loading widgets: importing & building every widget vs. only the enabled ones.
+
+Usage: python benchmarks/startup_benchmark.py [--widgets 50] [--enabled 5] [--runs 5]
+
+Generates a configuration with the given amount of widgets in a temporary home directory. Every widget module imports
+two modules of its own (like requests / feedparser / psutil in the shipped widgets); in the second scenario, the
+disabled widgets import twidgets.core.http & twidgets.core.metrics (requests / psutil) instead, like disabled news /
+weather / resources / processes widgets. Every measurement runs in a new interpreter, so imports are cold (with
+bytecode caches, like a normal start), and includes importing twidgets.core.base.
+"""
+import argparse
+import importlib.util
+import os
+import pathlib
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+import unittest.mock
+
+MODES: list[str] = ['all', 'enabled']
+SCENARIOS: dict[str, str] = {
+    'stdlib': 'every widget imports two other modules',
+    'requests': 'disabled widgets import requests / psutil',
+}
+
+IMPORTS: list[str] = [
+    'feedparser', 'xml.dom.minidom', 'email.mime.multipart', 'http.server', 'decimal', 'statistics', 'csv', 'zipfile',
+    'tarfile', 'smtplib', 'imaplib', 'argparse', 'difflib', 'pydoc', 'unittest', 'xmlrpc.client', 'logging.handlers',
+    'multiprocessing.pool', 'ssl', 'uuid', 'sqlite3', 'mailbox', 'plistlib', 'tomllib', 'calendar', 'doctest', 'pdb',
+    'ftplib', 'wave', 'ipaddress', 'fractions', 'gettext', 'shelve', 'configparser', 'cProfile', 'pstats', 'timeit',
+    'trace', 'asyncio.subprocess', 'concurrent.futures.process', 'html.parser', 'urllib.robotparser',
+    'wsgiref.simple_server',
+]
+
+WIDGET_SOURCE: str = '''import {first_import}
+import {second_import}
+from twidgets.core.base import Widget, WidgetContainer, Config, CursesWindowType
+
+
+def draw(widget: Widget, widget_container: WidgetContainer) -> None:
+    widget_container.draw_widget(widget)
+
+
+def build(stdscr: CursesWindowType, config: Config) -> Widget:
+    return Widget(config.name, config.title, config, draw, config.interval, config.dimensions, stdscr)
+'''
+
+WIDGET_CONFIG: str = '''name: '{name}'
+title: ' {name} '
+enabled: {enabled}
+interval: 0
+height: 3
+width: 10
+y: 0
+x: 0
+z: 0
+'''
+
+
+def create_home(home: pathlib.Path, widgets: int, enabled: int, scenario: str) -> None:
+    config_dir: pathlib.Path = home / '.config' / 'twidgets'
+    (config_dir / 'widgets').mkdir(parents=True)
+    (config_dir / 'py_widgets').mkdir()
+    shutil.copy(pathlib.Path(__file__).resolve().parent.parent / 'twidgets' / 'config' / 'base.yaml', config_dir)
+
+    every: int = max(widgets // max(enabled, 1), 1)  # Spread the enabled widgets
+    imports: list[str] = [name for name in IMPORTS if importlib.util.find_spec(name.split('.')[0]) is not None]
+    for i in range(widgets):
+        name: str = f'generated{i:02}'
+        is_enabled: bool = i % every == 0 and i // every < enabled
+        first_import: str = imports[(2 * i) % len(imports)]
+        second_import: str = imports[(2 * i + 1) % len(imports)]
+        if scenario == 'requests' and not is_enabled:
+            first_import, second_import = 'twidgets.core.http', 'twidgets.core.metrics'
+        (config_dir / 'py_widgets' / f'{name}_widget.py').write_text(WIDGET_SOURCE.format(
+            first_import=first_import, second_import=second_import
+        ))
+        (config_dir / 'widgets' / f'{name}.yaml').write_text(WIDGET_CONFIG.format(name=name, enabled=is_enabled))
+
+
+def load_widgets(mode: str) -> float:
+    """Runs in the child interpreter, returns the seconds spent importing twidgets.core.base & loading widgets"""
+    start: float = time.perf_counter()
+    from twidgets.core.base import WidgetContainer, Config, Widget
+    import_duration: float = time.perf_counter() - start
+
+    stdscr: typing.Any = unittest.mock.MagicMock()
+    widget_container: WidgetContainer = WidgetContainer(stdscr, test_env=False)
+    loader = widget_container.widget_loader
+
+    start = time.perf_counter()
+    if mode == 'enabled':
+        widget_container.build_widgets()
+    else:
+        # Before: every widget is imported & built, add_widget_list() drops the disabled ones afterwards
+        configs: dict[str, Config] = loader.load_widget_configs(widget_container)
+        widgets: list[Widget] = loader.build_widgets(widget_container, loader.load_custom_widget_modules(), configs)
+        widget_container.add_widget_list(widgets)
+    return import_duration + time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--widgets', type=int, default=50, help='Widget files')
+    parser.add_argument('--enabled', type=int, default=5, help='Enabled widgets')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per mode')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(load_widgets(args.child))
+        return
+
+    print(f'{args.widgets} widgets, {args.enabled} enabled, median of {args.runs} runs:')
+    for scenario, description in SCENARIOS.items():
+        with tempfile.TemporaryDirectory() as home:
+            create_home(pathlib.Path(home), args.widgets, args.enabled, scenario)
+            repository: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent
+            env: dict[str, str] = dict(os.environ, HOME=home, PYTHONPATH=str(repository))
+
+            def run(mode: str) -> float:
+                output: str = subprocess.run(
+                    [sys.executable, __file__, '--child', mode], env=env, check=True, capture_output=True, text=True
+                ).stdout
+                return float(output.strip().splitlines()[-1])
+
+            run('all')  # Writes the bytecode caches
+            print(f'  {description}:')
+            for mode in MODES:
+                median_ms: float = statistics.median(run(mode) for _ in range(args.runs)) * 1e3
+                print(f'    {mode:>7}: {median_ms:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Per-frame cost of the to-do widget with many to-dos: JSON (in memory) vs. SQLite backend.
+
+Usage: python benchmarks/todo_benchmark.py [--todos 100000] [--frames 2000] [--rows 7]
+
+Creates a save file with the given amount of to-dos in a temporary directory, then measures what the widget does per
+frame (the visible rows around the selection), per arrow key press, per added / removed to-do and per search keystroke.
+"""
+import argparse
+import json
+import pathlib
+import random
+import statistics
+import tempfile
+import time
+import typing
+from twidgets.config.py_widgets.todo_widget import (
+    TodoStore, JsonTodoStore, SqliteTodoStore, SearchResults, render_todos
+)
+
+
+def measure(func: typing.Callable[[], typing.Any], repeat: int) -> tuple[float, float]:
+    """Mean & p95 in µs"""
+    durations: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return statistics.mean(durations) * 1e6, durations[int(len(durations) * 0.95)] * 1e6
+
+
+def run(name: str, store: TodoStore, todos: int, frames: int, rows: int) -> None:
+    start: float = time.perf_counter()
+    store.refresh()
+    print(f'{name}: loaded in {(time.perf_counter() - start) * 1e3:.0f} ms')
+
+    selections: list[int] = [random.randint(1, todos) for _ in range(frames)]
+    frame: typing.Iterator[int] = iter(selections * 2)
+    results: list[tuple[str, tuple[float, float]]] = [
+        ('frame', measure(lambda: render_todos(store, next(frame), rows), frames)),
+        ('arrow key', measure(lambda: store.rows_from(next(frame) + 1, 1), frames)),
+    ]
+
+    added: list[int] = []
+    results.append(('add', measure(lambda: added.append(store.add('benchmark')), 100)))
+    results.append(('remove', measure(lambda: store.remove(added.pop()), 100)))
+
+    # Typing 'todo 4242' into the search prompt, one keystroke at a time
+    query: str = 'todo 4242'
+    search: SearchResults | None = None
+    for length in range(1, len(query) + 1):
+        start = time.perf_counter()
+        search = SearchResults.find(store, query[:length], search)
+        duration_us: float = (time.perf_counter() - start) * 1e6
+        results.append((f'search {query[:length]!r} ({len(search.ids)} found)', (duration_us, 0)))
+    if search is not None:
+        results.append(('frame (searching)', measure(lambda: render_todos(search, None, rows), frames)))
+
+    for label, (mean_us, p95_us) in results:
+        print(f'  {label:>32}: mean {mean_us:8.1f} µs' + (f', p95 {p95_us:8.1f} µs' if p95_us else ''))
+    store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--todos', type=int, default=100_000, help='Amount of to-dos')
+    parser.add_argument('--frames', type=int, default=2000, help='Frames to draw per backend')
+    parser.add_argument('--rows', type=int, default=7, help='Visible rows (max_rendering)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        save_path: pathlib.Path = pathlib.Path(directory) / 'todo_save_file.txt'
+        save_path.write_text(json.dumps({str(i): f'({i}) todo {i}' for i in range(1, args.todos + 1)}))
+
+        run('json', JsonTodoStore(save_path, 1000), args.todos, args.frames, args.rows)
+        sqlite_store: SqliteTodoStore = SqliteTodoStore(pathlib.Path(directory) / 'todo.sqlite3', save_path)
+        run('sqlite', sqlite_store, args.todos, args.frames, args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import curses
+import unittest
+from twidgets.core.base import Compositor, MemoryOutput, VirtualWindow, CursesError
+
+
+class TestCompositor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.output: MemoryOutput = MemoryOutput()
+        self.compositor: Compositor = Compositor(self.output)
+        self.compositor.resize(4, 10)
+        self.windows: list[VirtualWindow] = []
+        self.compositor.windows_source = lambda: self.windows
+
+    def test_z_order(self) -> None:
+        bottom: VirtualWindow = self.compositor.subwin(2, 7, 0, 0)
+        top: VirtualWindow = self.compositor.subwin(2, 5, 1, 3)
+        self.windows = [bottom, top]
+        bottom.addstr(0, 0, 'aaaaaa')
+        bottom.addstr(1, 0, 'bbbbbb')
+        top.addstr(0, 0, 'TTTT')
+        self.compositor.present()
+        self.assertEqual(self.output.lines(), ['aaaaaa    ', 'bbbTTTT   ', '          ', '          '])
+
+        self.windows = [top, bottom]  # Layout change, bottom is on top now
+        self.compositor.present()
+        self.assertEqual(self.output.lines()[1], 'bbbbbb    ')
+
+    def test_only_changes_are_written(self) -> None:
+        win: VirtualWindow = self.compositor.subwin(1, 10, 0, 0)
+        self.windows = [win]
+        win.addstr(0, 0, '12:00:00')
+        self.compositor.present()
+        writes: int = self.output.writes
+        cells_written: int = self.output.cells_written
+
+        win.erase()
+        win.addstr(0, 0, '12:00:01')
+        self.compositor.present()
+        self.assertEqual(self.output.writes - writes, 1)
+        self.assertEqual(self.output.cells_written - cells_written, 1)
+
+        self.compositor.present()  # Nothing touched
+        self.assertEqual(self.output.writes - writes, 1)
+
+    def test_border(self) -> None:
+        win: VirtualWindow = self.compositor.subwin(3, 4, 0, 0)
+        self.windows = [win]
+        win.border()
+        self.compositor.present()
+        self.assertEqual(self.output.lines()[:3], ['lqqk      ', 'x  x      ', 'mqqj      '])
+        self.assertTrue(self.output.attrs[0][0] & curses.A_ALTCHARSET)
+
+    def test_wide_characters(self) -> None:
+        bottom: VirtualWindow = self.compositor.subwin(1, 7, 0, 0)
+        top: VirtualWindow = self.compositor.subwin(2, 2, 0, 2)
+        self.windows = [bottom, top]
+        bottom.addstr(0, 0, '日本語')
+        top.addstr(0, 0, 'ab')
+        self.compositor.present()
+        self.assertEqual(self.compositor.lines()[0][:4], '日ab語')
+
+        bottom.addstr(0, 1, 'x')  # Overwrites the second half of 日
+        self.compositor.present()
+        self.assertEqual(self.output.lines()[0][:2], ' x')
+
+    def test_subwin_has_to_fit(self) -> None:
+        with self.assertRaises(CursesError):
+            self.compositor.subwin(5, 5, 0, 0)
+        win: VirtualWindow = self.compositor.subwin(1, 3, 0, 0)
+        with self.assertRaises(CursesError):
+            win.addstr(0, 0, 'four')  # Runs past the bottom right corner
+        self.assertEqual(win.chars[0], ['f', 'o', 'u'])
@@ -1,6 +1,6 @@
 import unittest
 import unittest.mock
-from twidgets.core.base import Config
+from twidgets.core.base import Config, BaseConfig, LogMessages
 
 
 class TestConfig(unittest.TestCase):
@@ -8,3 +8,18 @@ class TestConfig(unittest.TestCase):
         widget_container: unittest.mock.MagicMock = unittest.mock.MagicMock()
         _ = Config('file_name', widget_container, True, 'UnitTest')
         widget_container.log_messages.add_log_message.assert_called()
+
+    def test_invalid_update_timeout_is_ignored(self) -> None:
+        widget_container: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        config: Config = Config('file_name', widget_container, True, 'UnitTest', update_timeout=2.5)
+        self.assertEqual(config.update_timeout, 2.5)
+        config = Config('file_name', widget_container, True, 'UnitTest', update_timeout=-1)
+        self.assertIsNone(config.update_timeout)
+
+
+class TestBaseConfig(unittest.TestCase):
+    def test_invalid_max_update_workers_falls_back(self) -> None:
+        log_messages: LogMessages = LogMessages()
+        base_config: BaseConfig = BaseConfig(log_messages, True, 'UnitTest', max_update_workers=0)
+        self.assertEqual(base_config.max_update_workers, 4)
+        self.assertTrue(log_messages.contains_error())
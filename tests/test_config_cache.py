@@ -0,0 +1,77 @@
+import os
+import pathlib
+import tempfile
+import typing
+import unittest
+import unittest.mock
+from twidgets.core.base import ConfigCache, ConfigLoader, Config, WidgetContainer, LogMessages, LogErrorFoundBy
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.config_path: pathlib.Path = pathlib.Path(self.directory.name) / 'clock.yaml'
+        self.config_path.write_text("name: 'clock'\nlines: [1, 2]\n")
+        self.cache_path: pathlib.Path = pathlib.Path(self.directory.name) / 'configs.pickle'
+        self.parse: unittest.mock.MagicMock = unittest.mock.MagicMock(side_effect=ConfigLoader.parse_yaml)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_parsed_once(self) -> None:
+        cache: ConfigCache = ConfigCache(self.cache_path)
+        first: dict[typing.Any, typing.Any] = cache.load(self.config_path, self.parse)
+        first['lines'].append(3)  # Callers can't change the cached configuration
+        self.assertEqual(cache.load(self.config_path, self.parse), {'name': 'clock', 'lines': [1, 2]})
+        self.assertEqual(self.parse.call_count, 1)
+
+        cache.save()
+        warm_start: ConfigCache = ConfigCache(self.cache_path)
+        self.assertEqual(warm_start.load(self.config_path, self.parse), {'name': 'clock', 'lines': [1, 2]})
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        cache: ConfigCache = ConfigCache(self.cache_path)
+        cache.load(self.config_path, self.parse)
+        self.config_path.write_text("name: 'clock'\nlines: [1, 2, 3]\n")
+        os.utime(self.config_path, ns=(0, 0))  # Mtime may not have changed within the filesystem's resolution
+        self.assertEqual(cache.load(self.config_path, self.parse)['lines'], [1, 2, 3])
+        self.assertEqual(self.parse.call_count, 2)
+
+    def test_broken_cache_file(self) -> None:
+        self.cache_path.write_bytes(b'not a pickle')
+        self.assertEqual(ConfigCache(self.cache_path).load(self.config_path, self.parse)['name'], 'clock')
+
+
+class TestConfigLoader(unittest.TestCase):
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def test_configs_are_shared(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        stdscr: typing.Any = mock_initscr()
+        container: WidgetContainer = WidgetContainer(stdscr, test_env=True)
+        with unittest.mock.patch.object(ConfigLoader, 'parse_yaml', side_effect=ConfigLoader.parse_yaml) as parse:
+            container.scan_config()
+            configs: dict[str, Config] = container.widget_loader.load_widget_configs(container)
+            container.build_widgets()  # Uses the same configs
+            widget_configs: dict[str, Config] = {
+                str(widget.name): widget.config for widget in container.return_widgets()
+            }
+            self.assertIs(widget_configs['clock'], configs['clock_widget'])
+            self.assertEqual(parse.call_count, len(configs))  # Every widget config parsed once
+
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def test_base_config_messages_are_labelled_by_caller(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        stdscr: typing.Any = mock_initscr()
+        container: WidgetContainer = WidgetContainer(stdscr, test_env=True)  # Validates base config at runtime
+        log_messages: LogMessages = LogMessages()
+        container.config_loader.load_base_config(log_messages, LogErrorFoundBy.CONFIG_SCANNER.value)
+        self.assertTrue(log_messages.log_messages)
+        self.assertEqual(
+            {log_message.error_found_by for log_message in log_messages}, {LogErrorFoundBy.CONFIG_SCANNER.value}
+        )
+        self.assertEqual(
+            {log_message.error_found_by for log_message in container.log_messages}, {LogErrorFoundBy.RUNTIME.value}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,3 +14,18 @@ class TestDimensions(unittest.TestCase):
     def test_within_borders_false(self) -> None:
         dim: Dimensions = Dimensions(10, 10, 5, 5, 0)
         self.assertFalse(dim.within_borders(10, 10))
+
+    def test_overlaps(self) -> None:
+        dim: Dimensions = Dimensions(5, 5, 0, 0, 0)
+        self.assertTrue(dim.overlaps(Dimensions(5, 5, 4, 4, 1)))
+        self.assertFalse(dim.overlaps(Dimensions(5, 5, 5, 0, 1)))
+
+    def test_subtract(self) -> None:
+        dim: Dimensions = Dimensions(4, 4, 0, 0, 0)
+        self.assertEqual(dim.subtract(Dimensions(2, 2, 10, 10, 1)), [dim])
+        self.assertEqual(dim.subtract(Dimensions(6, 6, -1, -1, 1)), [])
+        pieces: list[Dimensions] = dim.subtract(Dimensions(2, 2, 1, 1, 1))  # Hole in the middle
+        self.assertEqual(
+            [piece.formatted() for piece in pieces], [[1, 4, 0, 0], [1, 4, 3, 0], [2, 1, 1, 0], [2, 1, 1, 3]]
+        )
+        self.assertEqual(sum(piece.current_height * piece.current_width for piece in pieces), 16 - 4)
@@ -0,0 +1,128 @@
+import http.server
+import pathlib
+import tempfile
+import threading
+import typing
+import unittest
+import unittest.mock
+import requests
+from twidgets.core.base import WidgetContainer
+from twidgets.core.http import HttpClient, HttpCache
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+
+    requests_seen: list[str] = []
+
+    def do_GET(self) -> None:
+        body: bytes = b'hello'
+        _Handler.requests_seen.append(self.path)
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server: http.server.ThreadingHTTPServer = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url: str = f'http://127.0.0.1:{self.server.server_address[1]}/'
+        _Handler.requests_seen = []
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self) -> None:
+        url: str = self.url
+        http_client: HttpClient = HttpClient()
+        try:
+            for _ in range(3):
+                self.assertEqual(http_client.get(url).text, 'hello')
+
+            self.assertEqual(http_client.requests_sent, 3)
+            self.assertEqual(http_client.bytes_received, 15)
+            self.assertEqual(http_client.connections_opened(), 1)
+            self.assertEqual(http_client.reused_connections(), 2)
+        finally:
+            http_client.close()
+
+    def test_session_per_thread(self) -> None:
+        http_client: HttpClient = HttpClient()
+        sessions: list[requests.Session] = []
+
+        def get() -> None:
+            self.assertEqual(http_client.get(self.url).text, 'hello')
+            sessions.append(http_client.session)
+
+        try:
+            get()
+            thread: threading.Thread = threading.Thread(target=get)
+            thread.start()
+            thread.join()
+            get()
+
+            self.assertIs(sessions[0], sessions[2])
+            self.assertIsNot(sessions[0], sessions[1])
+            self.assertEqual(http_client.connections_opened(), 1)  # The connection pools are shared
+        finally:
+            http_client.close()
+
+    def test_conditional_get(self) -> None:
+        http_client: HttpClient = HttpClient()
+        with tempfile.TemporaryDirectory() as directory:
+            http_client.cache = HttpCache(pathlib.Path(directory), ttl=0, max_size=1024)
+            first = http_client.get_cached(self.url)
+            second = http_client.get_cached(self.url)  # Revalidated, 304 Not Modified
+            self.assertFalse(first.from_cache)
+            self.assertTrue(second.from_cache)
+            self.assertEqual(second.text, 'hello')
+            self.assertEqual(first.digest, second.digest)
+            self.assertEqual(http_client.cache_hits, 1)
+
+            # Persistent, a new cache in the same directory serves it while fresh (no request at all)
+            http_client.cache = HttpCache(pathlib.Path(directory), ttl=60, max_size=1024)
+            self.assertTrue(http_client.get_cached(self.url).from_cache)
+            self.assertEqual(len(_Handler.requests_seen), 2)
+        http_client.close()
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        http_client: HttpClient = HttpClient()
+        with tempfile.TemporaryDirectory() as directory:
+            http_client.cache = HttpCache(pathlib.Path(directory), ttl=60, max_size=10)  # Two bodies
+            for path in ('a', 'b', 'a', 'c'):
+                http_client.get_cached(self.url + path)
+            self.assertIsNotNone(http_client.cache.lookup(self.url + 'a'))
+            self.assertIsNone(http_client.cache.lookup(self.url + 'b'))
+            self.assertEqual(len(list(pathlib.Path(directory).glob('*'))), 3)  # 2 bodies + index
+        http_client.close()
+
+    def test_shared_instance(self) -> None:
+        self.assertIs(HttpClient.shared(), HttpClient.shared())
+
+    def test_configure_cache(self) -> None:
+        http_client: HttpClient = HttpClient()
+        with tempfile.TemporaryDirectory() as directory:
+            http_client.configure_cache(pathlib.Path(directory), ttl=60, max_size=1024)
+            cache: HttpCache = typing.cast(HttpCache, http_client.cache)
+            self.assertEqual((cache.directory, cache.ttl, cache.max_size), (pathlib.Path(directory), 60, 1024))
+            http_client.configure_cache(pathlib.Path(directory), ttl=60, max_size=1024)
+            self.assertIs(http_client.cache, cache)  # Unchanged settings keep the cache
+            http_client.configure_cache(pathlib.Path(directory), ttl=120, max_size=1024)  # Reloaded
+            self.assertEqual(typing.cast(HttpCache, http_client.cache).ttl, 120)
+        http_client.close()
+
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def test_container_client(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        widget_container: WidgetContainer = WidgetContainer(mock_initscr(), test_env=True)
+        self.assertIs(widget_container.http, HttpClient.shared())
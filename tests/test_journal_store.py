@@ -0,0 +1,50 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+from twidgets.core.base import JournalStore
+
+
+class TestJournalStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.path: pathlib.Path = pathlib.Path(self.directory.name) / 'todos.json'
+        self.path.write_text(json.dumps({'1': '(1) a', '2': '(2) b'}))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_changes_are_journaled(self) -> None:
+        store: JournalStore = JournalStore(self.path)
+        self.assertTrue(store.refresh())
+        self.assertFalse(store.refresh())  # Unchanged on disk, not read again
+        store.set('3', '(3) c')
+        store.delete('1')
+        self.assertEqual(json.loads(self.path.read_text()), {'1': '(1) a', '2': '(2) b'})  # Untouched
+        self.assertEqual(len(store.journal_path.read_text().splitlines()), 2)
+        self.assertFalse(store.refresh())  # Own changes
+
+        reopened: JournalStore = JournalStore(self.path)
+        reopened.refresh()
+        self.assertEqual(reopened.data, {'2': '(2) b', '3': '(3) c'})
+
+    def test_compaction(self) -> None:
+        store: JournalStore = JournalStore(self.path, compact_after=2)
+        store.refresh()
+        for key in ('3', '4', '5'):
+            store.set(key, key)
+        self.assertEqual(json.loads(self.path.read_text()), {'1': '(1) a', '2': '(2) b', '3': '3', '4': '4', '5': '5'})
+        self.assertFalse(store.journal_path.exists())
+        self.assertFalse(store.refresh())
+
+    def test_external_change_and_broken_journal(self) -> None:
+        store: JournalStore = JournalStore(self.path)
+        store.refresh()
+        with open(store.journal_path, 'a') as file:
+            file.write('["set","3","(3) c"]\n["set","4"')  # Interrupted write
+        os.utime(store.journal_path, ns=(0, 0))
+        self.assertTrue(store.refresh())
+        self.assertEqual(store.data, {'1': '(1) a', '2': '(2) b', '3': '(3) c'})
+        self.assertFalse(store.journal_path.exists())  # Rewritten without the broken line
+        self.assertEqual(json.loads(self.path.read_text()), store.data)
@@ -15,3 +15,31 @@ class TestLogMessages(unittest.TestCase):
         with unittest.mock.patch('builtins.print') as mock_print:
             logs.print_log_messages('Heading\n')
             mock_print.assert_called()  # Check that print was called
+
+    def test_repeated_messages_are_counted(self) -> None:
+        logs: LogMessages = LogMessages()
+        first: LogMessage = LogMessage('Timeout', LogLevels.ERROR.key)
+        logs.add_log_message(first)
+        logs.add_log_message(first)  # Adding means another occurrence, whether or not it's the same instance
+        logs.add_log_message(LogMessage('Timeout', LogLevels.ERROR.key))
+        self.assertEqual(len(logs), 1)
+        self.assertEqual(logs.log_messages[0].count, 3)
+        self.assertEqual(first.count, 1)  # Only the stored copy is counted
+        self.assertIn(LogMessage('Timeout', LogLevels.ERROR.key), logs)
+        self.assertNotIn(LogMessage('Timeout', LogLevels.WARNING.key), logs)
+
+    def test_adding_logs_leaves_them_unchanged(self) -> None:
+        a: LogMessages = LogMessages([LogMessage('Timeout', LogLevels.ERROR.key)])
+        b: LogMessages = LogMessages([LogMessage('Timeout', LogLevels.ERROR.key)])
+        combined: LogMessages = a + b
+        combined += b
+        self.assertEqual(combined.log_messages[0].count, 3)
+        self.assertEqual(a.log_messages[0].count, 1)
+        self.assertEqual(b.log_messages[0].count, 1)
+
+    def test_least_recently_seen_is_evicted(self) -> None:
+        logs: LogMessages = LogMessages(max_log_messages=2)
+        for message in ('a', 'b', 'a', 'c'):
+            logs.add_log_message(LogMessage(message, LogLevels.WARNING.key))
+        self.assertEqual([log_message.message for log_message in logs], ['a', 'c'])
+        self.assertEqual(logs.evicted, 1)
@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+import unittest
+import unittest.mock
+from twidgets.core.metrics import (
+    RingBuffer,
+    MetricsSampler,
+    sparkline,
+    SystemMetrics,
+    LinuxSystemMetrics,
+    PsutilSystemMetrics,
+    MemoryUsage,
+    online_cpus,
+    ProcessScanner,
+    ProcessSample
+)
+
+
+class TestMetrics(unittest.TestCase):
+    def test_ring_buffer(self) -> None:
+        buffer: RingBuffer = RingBuffer(3)
+        self.assertEqual(buffer.values(), [])
+        for value in range(5):
+            buffer.append(value)
+        self.assertEqual(buffer.values(), [2.0, 3.0, 4.0])
+        self.assertEqual(buffer.values(last=2), [3.0, 4.0])
+        self.assertEqual(buffer.latest(), 4.0)
+        self.assertEqual(len(buffer), 3)
+
+    def test_sparkline(self) -> None:
+        self.assertEqual(sparkline([0, 4, 8], 3, maximum=8), ' ▄█')
+        self.assertEqual(sparkline([8], 3), '  █')  # Right-aligned
+        self.assertEqual(sparkline([0, 8, 0, 0], 2), '█ ')  # Downsampled, peaks stay visible
+        self.assertEqual(sparkline([], 2), '  ')
+
+    def test_counters_are_rates_over_real_time(self) -> None:
+        samples: list[tuple[dict[str, float], dict[str, float]]] = [
+            ({'cpu': 10.0}, {'bytes': 0.0}),
+            ({'cpu': 20.0}, {'bytes': 1000.0}),
+        ]
+        sampler: MetricsSampler = MetricsSampler(lambda: samples.pop(0), rate=1, capacity=10)
+        with unittest.mock.patch('time.monotonic', side_effect=[100.0, 102.0]):  # 2s apart, not 1s
+            sampler.sample()
+            sampler.sample()
+        self.assertEqual(sampler.history('cpu'), [10.0, 20.0])
+        self.assertEqual(sampler.history('bytes'), [500.0])
+        self.assertEqual(sampler.latest('missing', default=-1), -1)
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'Reads /proc')
+    def test_linux_system_metrics_match_psutil(self) -> None:
+        linux: SystemMetrics = LinuxSystemMetrics()
+        fallback: SystemMetrics = PsutilSystemMetrics()
+        try:
+            memory: MemoryUsage = linux.memory()
+            self.assertEqual(memory.total, fallback.memory().total)
+            self.assertEqual(memory.swap_total, fallback.memory().swap_total)
+            self.assertLessEqual(memory.available, memory.total)
+            self.assertLessEqual(linux.network()[1], fallback.network()[1])  # Counters only grow
+
+            self.assertEqual(set(linux.network_interfaces()), set(fallback.network_interfaces()))
+
+            no_sample: tuple[float, dict[int, float]] = (0.0, dict.fromkeys(fallback.cpu_percents()[1], 0.0))
+            self.assertEqual(linux.cpu_percents(), no_sample)  # No previous sample
+            total, cores = linux.cpu_percents()
+            self.assertEqual(sorted(cores), online_cpus())
+            self.assertTrue(all(0.0 <= percent <= 100.0 for percent in [total, *cores.values()]))
+        finally:
+            linux.close()
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'Reads /proc')
+    def test_cores_are_keyed_by_number(self) -> None:
+        linux: LinuxSystemMetrics = LinuxSystemMetrics()
+        stats: list[bytes] = [
+            b'cpu  30 0 0 30 0 0 0 0 0 0\ncpu0 10 0 0 10 0 0 0 0 0 0\ncpu1 10 0 0 10 0 0 0 0 0 0\n'
+            b'cpu3 10 0 0 10 0 0 0 0 0 0\nintr 1 2 3\n',
+            # cpu1 went offline, cpu2 came online
+            b'cpu  60 0 0 60 0 0 0 0 0 0\ncpu0 20 0 0 20 0 0 0 0 0 0\ncpu2 10 0 0 10 0 0 0 0 0 0\n'
+            b'cpu3 30 0 0 10 0 0 0 0 0 0\nintr 1 2 3\n',
+        ]
+        try:
+            with unittest.mock.patch.object(linux, '_read', side_effect=lambda path, until=None: stats.pop(0)):
+                self.assertEqual(linux.cpu_percents(), (0.0, {0: 0.0, 1: 0.0, 3: 0.0}))
+                self.assertEqual(linux.cpu_percents(), (50.0, {0: 50.0, 2: 0.0, 3: 100.0}))
+        finally:
+            linux.close()
+
+        with unittest.mock.patch('psutil.cpu_percent', side_effect=[40.0, [10.0, 20.0, 30.0]]), \
+                unittest.mock.patch('builtins.open', unittest.mock.mock_open(read_data='0-1,3\n')):
+            self.assertEqual(PsutilSystemMetrics().cpu_percents(), (40.0, {0: 10.0, 1: 20.0, 3: 30.0}))
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'Reads /proc')
+    def test_linux_system_metrics_grow_buffers(self) -> None:
+        linux: LinuxSystemMetrics = LinuxSystemMetrics()
+        linux._buffers['/proc/meminfo'] = bytearray(16)
+        try:
+            self.assertGreater(linux.memory().total, 0)
+            self.assertGreater(len(linux._buffers['/proc/meminfo']), 16)
+        finally:
+            linux.close()
+
+    def test_process_scanner_spreads_scan(self) -> None:
+        scanner: ProcessScanner = ProcessScanner(top=3, sort='memory', scan_steps=2)
+        with unittest.mock.patch.object(scanner, '_read', side_effect=lambda pid: ProcessSample(
+                pid, 'user', f'command {pid}', 0.0, pid * 1024
+        )):
+            with unittest.mock.patch('os.listdir', return_value=['1', '2', '3', '4', 'self']), \
+                    unittest.mock.patch('psutil.pids', return_value=[1, 2, 3, 4]):
+                scanner.step()
+                self.assertEqual(len(scanner._samples), 2)  # Half of the processes per step
+                top: list[ProcessSample] = scanner.step()
+                self.assertEqual([process.pid for process in top], [4, 3, 2])
+
+            with unittest.mock.patch('os.listdir', return_value=['1', '2']), \
+                    unittest.mock.patch('psutil.pids', return_value=[1, 2]):
+                top = scanner.step()  # New scan, exited processes are dropped
+                self.assertEqual([process.pid for process in top], [2, 1])
+
+    def test_process_scanner_cpu_usage(self) -> None:
+        scanner: ProcessScanner = ProcessScanner(top=1000)
+        scanner.step()
+        end: float = time.process_time() + 0.2
+        while time.process_time() < end:
+            pass  # Busy
+        samples: dict[int, ProcessSample] = {process.pid: process for process in scanner.step()}
+        self.assertIn(os.getpid(), samples)
+        self.assertGreater(samples[os.getpid()].cpu_percent, 0.0)
+        self.assertGreater(samples[os.getpid()].rss, 0)
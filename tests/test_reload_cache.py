@@ -0,0 +1,51 @@
+import os
+import pathlib
+import tempfile
+import types
+import unittest
+from twidgets.core.base import Widget, ReloadCache
+from tests.widget_factory import build_widget
+
+
+class TestReloadCache(unittest.TestCase):
+    def test_unchanged_modules_are_reused(self) -> None:
+        reload_cache: ReloadCache = ReloadCache()
+        with tempfile.TemporaryDirectory() as directory:
+            path: pathlib.Path = pathlib.Path(directory) / 'weather_widget.py'
+            path.write_text('x = 1\n')
+            module: types.ModuleType = types.ModuleType('weather_widget')
+            self.assertIsNone(reload_cache.module(path))
+            reload_cache.store_module(path, module)
+            self.assertIs(reload_cache.module(path), module)
+
+            path.write_text('x = 22\n')
+            os.utime(path, ns=(0, 0))
+            self.assertIsNone(reload_cache.module(path))  # Edited
+
+    def test_widget_state_is_carried_over(self) -> None:
+        reload_cache: ReloadCache = ReloadCache()
+        module: types.ModuleType = types.ModuleType('weather_widget')
+        widget: Widget = build_widget('weather', config_hash='a')
+        widget.module = module
+        widget.publish(['Sunny'])
+        widget.internal_data['key'] = 'value'
+        widget.last_updated = 123.0
+
+        reload_cache.save_widgets([widget], 'secrets')
+        reloaded: Widget = build_widget('weather', config_hash='a')
+        reloaded.module = module
+        self.assertEqual(reload_cache.restore_widgets([reloaded], 'secrets'), [reloaded])
+        self.assertEqual(reloaded.draw_data, ['Sunny'])
+        self.assertEqual(reloaded.internal_data, {'key': 'value'})
+        self.assertEqual(reloaded.last_updated, 123.0)
+
+        for config_hash, changed_module, secrets in (
+                ('b', module, 'secrets'),  # Configuration edited
+                ('a', types.ModuleType('weather_widget'), 'secrets'),  # Source edited
+                ('a', module, 'other secrets')
+        ):
+            changed: Widget = build_widget('weather', config_hash=config_hash)
+            changed.module = changed_module
+            reload_cache.save_widgets([widget], 'secrets')
+            self.assertEqual(reload_cache.restore_widgets([changed], secrets), [])
+            self.assertEqual(changed.draw_data, [])
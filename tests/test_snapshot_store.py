@@ -0,0 +1,59 @@
+import pathlib
+import tempfile
+import threading
+import unittest
+from twidgets.core.base import Widget, SnapshotStore, LogMessages
+from tests.widget_factory import build_widget
+
+
+class TestSnapshotStore(unittest.TestCase):
+    def test_restore_stale_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: pathlib.Path = pathlib.Path(directory) / 'snapshots.pickle'
+            widget: Widget = build_widget('news', config_hash='a', persistent_keys=['entries'])
+            widget.publish(['Success'])
+            widget.internal_data.update({'entries': [1, 2], 'selected_line': 3})
+            SnapshotStore(path).save([widget])
+
+            restored: Widget = build_widget('news', config_hash='a', persistent_keys=['entries'])
+            store: SnapshotStore = SnapshotStore(path)
+            store.restore([restored])
+            self.assertTrue(restored.snapshot.stale)
+            self.assertEqual(restored.draw_data, ['Success'])
+            self.assertEqual(restored.internal_data, {'entries': [1, 2]})  # Only persistent_keys
+            self.assertTrue(restored.needs_redraw(0))
+
+            restored.publish(['Updated'])
+            self.assertFalse(restored.snapshot.stale)
+
+            changed_config: Widget = build_widget('news', config_hash='b', persistent_keys=['entries'])
+            store.restore([changed_config])
+            self.assertFalse(changed_config.snapshot.stale)
+            self.assertEqual(changed_config.draw_data, [])
+
+    def test_unreadable_file_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: pathlib.Path = pathlib.Path(directory) / 'snapshots.pickle'
+            path.write_bytes(b'not a pickle')
+            widget: Widget = build_widget('news', config_hash='a', persistent_keys=['entries'])
+            SnapshotStore(path).restore([widget])
+            self.assertFalse(widget.snapshot.stale)
+
+    def test_unpicklable_entry_is_dropped(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: pathlib.Path = pathlib.Path(directory) / 'snapshots.pickle'
+            broken: Widget = build_widget('broken', config_hash='a', persistent_keys=['entries'])
+            broken.publish(['Broken'])
+            broken.internal_data['entries'] = threading.Lock()  # Can't be pickled
+            working: Widget = build_widget('news', config_hash='a', persistent_keys=['entries'])
+            working.publish(['Success'])
+            log_messages: LogMessages = LogMessages()
+            SnapshotStore(path).save([broken, working], log_messages)
+            self.assertEqual(len(log_messages), 1)
+            self.assertEqual([file.name for file in pathlib.Path(directory).iterdir()], ['snapshots.pickle'])
+
+            restored: list[Widget] = [
+                build_widget(name, config_hash='a', persistent_keys=['entries']) for name in ('broken', 'news')
+            ]
+            SnapshotStore(path).restore(restored)
+            self.assertEqual([widget.snapshot.stale for widget in restored], [False, True])
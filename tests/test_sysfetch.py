@@ -0,0 +1,117 @@
+import json
+import pathlib
+import tempfile
+import typing
+import unittest
+import unittest.mock
+from twidgets.config.py_widgets import sysfetch_widget
+from twidgets.config.py_widgets.sysfetch_widget import (
+    first_line_containing,
+    get_dpkg_packages,
+    collect_static_facts,
+    load_static_facts
+)
+
+DPKG_STATUS: str = '''Package: adduser
+Status: install ok installed
+Priority: important
+Description: add and remove users and groups
+ Package: not a package, part of the description
+
+Package: apt
+Status: install ok installed
+Priority: required
+
+Package: zlib1g
+Status: install ok installed
+Priority: optional
+'''
+
+
+class TestSysfetch(unittest.TestCase):
+    def test_first_line_containing(self) -> None:
+        text: str = 'vendor_id\t: GenuineIntel\nmodel name\t: Intel(R) Core(TM)\nModel Name\t: second\n'
+        self.assertEqual(first_line_containing(text, 'MODEL NAME'), 'model name\t: Intel(R) Core(TM)')
+        self.assertEqual(first_line_containing(text, 'missing', 'vendor'), 'vendor_id\t: GenuineIntel')
+        self.assertIsNone(first_line_containing(text, 'missing'))
+        self.assertIsNone(first_line_containing(None, 'model name'))
+
+    def test_dpkg_packages(self) -> None:
+        with unittest.mock.patch.object(sysfetch_widget, 'read_file', return_value=DPKG_STATUS):
+            self.assertEqual(get_dpkg_packages(), '3')
+        with unittest.mock.patch.object(sysfetch_widget, 'read_file', return_value=None):
+            self.assertEqual(get_dpkg_packages(), 'Unknown')
+
+    def test_collect_static_facts(self) -> None:
+        probes: dict[str, dict[str, unittest.mock.MagicMock]] = {
+            'test': {
+                'os': unittest.mock.MagicMock(return_value='TestOS'),
+                'cpu': unittest.mock.MagicMock(return_value='CPU'),
+            }
+        }
+        with unittest.mock.patch.dict(sysfetch_widget.STATIC_PROBES, probes), \
+                unittest.mock.patch('psutil.boot_time', return_value=1000.0), \
+                unittest.mock.patch('platform.node', return_value='host'), \
+                unittest.mock.patch('platform.release', return_value='6.1'):
+            facts: dict[str, str] = collect_static_facts('test')
+        self.assertEqual(
+            facts, {'os': 'TestOS', 'cpu': 'CPU', 'hostname': 'host', 'kernel': '6.1', 'boot_time': '1000.0'}
+        )
+        for probe in probes['test'].values():
+            probe.assert_called_once_with()
+
+
+class TestStaticFactsCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.widget_container: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        self.widget_container.test_env = False
+        self.widget_container.ROOT_CACHE_DIR = pathlib.Path(self.directory.name)
+        self.cache_path: pathlib.Path = pathlib.Path(self.directory.name) / 'sysfetch.json'
+        self.collect: unittest.mock.MagicMock = unittest.mock.MagicMock(return_value={'os': 'TestOS'})
+        self.patches: list[typing.Any] = [
+            unittest.mock.patch.object(sysfetch_widget, 'collect_static_facts', self.collect),
+            unittest.mock.patch.object(sysfetch_widget, 'boot_id', return_value='boot'),
+            unittest.mock.patch.dict('os.environ', {'SHELL': '/bin/sh', 'DISPLAY': ''}),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        self.directory.cleanup()
+
+    @staticmethod
+    def build_widget() -> unittest.mock.MagicMock:
+        widget: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        widget.internal_data = {}
+        return widget
+
+    def test_cache_hit(self) -> None:
+        self.assertEqual(load_static_facts(self.build_widget(), self.widget_container, 'linux'), {'os': 'TestOS'})
+        self.assertEqual(json.loads(self.cache_path.read_text())['facts'], {'os': 'TestOS'})
+
+        widget: unittest.mock.MagicMock = self.build_widget()  # New start, read from disk
+        self.assertEqual(load_static_facts(widget, self.widget_container, 'linux'), {'os': 'TestOS'})
+        self.cache_path.unlink()
+        self.assertEqual(load_static_facts(widget, self.widget_container, 'linux'), {'os': 'TestOS'})  # In memory
+        self.assertEqual(self.collect.call_count, 1)
+
+    def test_cache_miss_on_different_key(self) -> None:
+        load_static_facts(self.build_widget(), self.widget_container, 'linux')
+        with unittest.mock.patch.object(sysfetch_widget, 'boot_id', return_value='next boot'):
+            load_static_facts(self.build_widget(), self.widget_container, 'linux')
+        load_static_facts(self.build_widget(), self.widget_container, 'raspbian')
+        self.assertEqual(self.collect.call_count, 3)
+        self.assertTrue(json.loads(self.cache_path.read_text())['key'].startswith('boot|raspbian|'))
+
+    def test_unreadable_cache_file(self) -> None:
+        self.cache_path.write_text('{not json')
+        self.assertEqual(load_static_facts(self.build_widget(), self.widget_container, 'linux'), {'os': 'TestOS'})
+        self.assertEqual(self.collect.call_count, 1)
+        self.assertEqual(json.loads(self.cache_path.read_text())['facts'], {'os': 'TestOS'})  # Replaced
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import pathlib
+import tempfile
+import unittest
+from twidgets.config.py_widgets.todo_widget import (
+    TodoStore,
+    JsonTodoStore,
+    SqliteTodoStore,
+    SearchResults,
+    Row,
+    render_todos
+)
+
+
+class TestTodoStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.save_path: pathlib.Path = pathlib.Path(self.directory.name) / 'todo_save_file.txt'
+        self.save_path.write_text(json.dumps({str(i): f'({i}) todo {i}' for i in range(1, 11)}))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def stores(self) -> list[TodoStore]:
+        return [
+            JsonTodoStore(self.save_path, 1000),
+            SqliteTodoStore(pathlib.Path(self.directory.name) / 'todo.sqlite3', import_path=self.save_path)
+        ]
+
+    def test_rows_around_an_id(self) -> None:
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                store.refresh()
+                self.assertEqual([row[0] for row in store.rows_from(None, 3)], [1, 2, 3])
+                self.assertEqual([row[0] for row in store.rows_from(9, 3)], [9, 10])
+                self.assertEqual([row[0] for row in store.rows_before(4, 2)], [2, 3])
+                self.assertEqual([row[0] for row in store.rows_before(None, 2)], [9, 10])
+                self.assertEqual(store.rows_from(5, 1), [(5, '(5) todo 5')])
+                store.close()
+
+    def test_add_and_remove(self) -> None:
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                store.refresh()
+                self.assertEqual(store.add('new'), 11)
+                store.remove(5)
+                self.assertEqual(store.rows_from(4, 3), [(4, '(4) todo 4'), (6, '(6) todo 6'), (7, '(7) todo 7')])
+                self.assertEqual(store.rows_before(None, 1), [(11, '(11) new')])
+                store.close()
+
+        reopened: JsonTodoStore = JsonTodoStore(self.save_path, 1000)  # Changes are saved
+        reopened.refresh()
+        self.assertEqual(reopened.rows_before(None, 1), [(11, '(11) new')])
+
+    def test_save_file_is_imported_once(self) -> None:
+        database_path: pathlib.Path = pathlib.Path(self.directory.name) / 'todo.sqlite3'
+        store: SqliteTodoStore = SqliteTodoStore(database_path, import_path=self.save_path)
+        for todo_id in range(1, 11):
+            store.remove(todo_id)
+        store.close()
+
+        reopened: SqliteTodoStore = SqliteTodoStore(database_path, import_path=self.save_path)
+        self.assertEqual(reopened.rows_from(None, 1), [])  # Removed to-dos don't come back
+        reopened.close()
+
+    def test_incremental_search(self) -> None:
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                store.refresh()
+                results: SearchResults = SearchResults.find(store, 'TODO 1')
+                self.assertEqual(results.ids, [1, 10])
+                narrowed: SearchResults = SearchResults.find(store, 'todo 10', results)
+                self.assertEqual(narrowed.ids, [10])
+                self.assertEqual(narrowed.rows_from(None, 5), [(10, '(10) todo 10')])
+                self.assertEqual(SearchResults.find(store, 'todo', narrowed).ids, list(range(1, 11)))  # Not narrowed
+                store.close()
+
+    def test_search_folds_non_ascii(self) -> None:
+        self.save_path.write_text(json.dumps({'1': '(1) Äpfel kaufen', '2': '(2) Birnen', '3': '(3) ÉTÉ'}))
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                store.refresh()
+                self.assertEqual(SearchResults.find(store, 'ä').ids, [1])
+                self.assertEqual(SearchResults.find(store, 'été').ids, [3])
+                self.assertEqual(store.search('ä', within=[1, 2]), [1])
+                store.close()
+
+    def test_render_window(self) -> None:
+        store: JsonTodoStore = JsonTodoStore(self.save_path, 1000)
+        store.refresh()
+
+        rows: list[Row]
+        rows, rel_index, more = render_todos(store, None, 4)
+        self.assertEqual(([row[0] for row in rows], rel_index, more), ([1, 2, 3, 4], None, True))
+        rows, rel_index, more = render_todos(store, 6, 4)
+        self.assertEqual(([row[0] for row in rows], rel_index, more), ([4, 5, 6, 7], 2, True))
+        rows, rel_index, more = render_todos(store, 10, 4)  # The end of the list stays filled
+        self.assertEqual(([row[0] for row in rows], rel_index, more), ([7, 8, 9, 10], 3, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
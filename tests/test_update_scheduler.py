@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time as time_module
+import unittest
+import unittest.mock
+from twidgets.core.base import Widget, WidgetContainer, UpdateScheduler, LogMessages, BaseConfig, CircuitBreaker,\
+    CircuitState
+from tests.widget_factory import build_widget
+
+
+class TestUpdateScheduler(unittest.TestCase):
+    @staticmethod
+    def build_widget_container(max_update_workers: int) -> unittest.mock.MagicMock:
+        widget_container: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        widget_container.stop_event = threading.Event()
+        widget_container.base_config = BaseConfig(
+            LogMessages(), True, 'UnitTest', max_update_workers=max_update_workers
+        )
+        return widget_container
+
+    @staticmethod
+    def build_widget(name: str, interval: float, calls: list[str]) -> Widget:
+        def update(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+            calls.append(name)
+            return [name]
+
+        return build_widget(name, interval, update_func=update)
+
+    def test_runs_due_widgets_by_deadline(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(2)
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        calls: list[str] = []
+        fast: Widget = self.build_widget('fast', 0.02, calls)
+        slow: Widget = self.build_widget('slow', 60, calls)
+        scheduler.add_widget(fast)
+        scheduler.add_widget(slow)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.15)
+        scheduler.remove_widget(fast)
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(calls.count('slow'), 1)
+        self.assertGreater(calls.count('fast'), 2)
+        self.assertEqual(slow.draw_data, ['slow'])
+        self.assertEqual(scheduler.scheduled_widgets(), [slow])
+
+    def test_slow_update_does_not_block_others(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(2)
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        release: threading.Event = threading.Event()
+        calls: list[str] = []
+        slow: Widget = self.build_widget('slow', 60, calls)
+        slow._update_func = lambda _widget, _widget_container: [str(release.wait(1))]
+        fast: Widget = self.build_widget('fast', 60, calls)
+        scheduler.add_widget(slow)
+        scheduler.add_widget(fast)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.1)
+        self.assertEqual(fast.draw_data, ['fast'])  # Finished while the slow update is still running
+        self.assertEqual(slow.draw_data, [])
+        release.set()
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+
+    def test_reactivated_widget_is_not_updated_twice_at_once(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(2)
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        release: threading.Event = threading.Event()
+        running: list[int] = [0]
+        overlapping: list[bool] = []
+        slow: Widget = self.build_widget('slow', 0.01, [])
+
+        def update(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+            running[0] += 1
+            overlapping.append(running[0] > 1)
+            release.wait(1)
+            running[0] -= 1
+            return ['slow']
+
+        slow._update_func = update
+        scheduler.add_widget(slow)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.05)
+        scheduler.remove_widget(slow)  # Deactivated & reactivated while its update is running
+        scheduler.add_widget(slow)
+        self.assertEqual(scheduler.scheduled_widgets(), [])
+        time_module.sleep(0.05)
+        release.set()
+        time_module.sleep(0.05)
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+
+        self.assertGreater(len(overlapping), 1)  # Rescheduled once the running update finished
+        self.assertNotIn(True, overlapping)
+
+    def test_async_updates_share_the_event_loop(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(1)
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        cancelled: list[str] = []
+
+        def build_async_widget(name: str, delay: float) -> Widget:
+            async def update(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+                return [name]
+
+            widget: Widget = self.build_widget(name, 60, [])
+            widget._update_func = update
+            return widget
+
+        first: Widget = build_async_widget('first', 0.05)
+        second: Widget = build_async_widget('second', 0.05)
+        hanging: Widget = build_async_widget('hanging', 60)
+        for widget in (first, second, hanging):
+            self.assertTrue(widget.has_async_update())
+            scheduler.add_widget(widget)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.2)
+        # Both finished although there is only one worker thread, the hanging update blocks nothing
+        self.assertEqual(first.draw_data, ['first'])
+        self.assertEqual(second.draw_data, ['second'])
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(cancelled, ['hanging'])
+        self.assertEqual(hanging.draw_data, [])
+
+    def test_overrunning_updates_time_out(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(1)
+        widget_container.log_messages = LogMessages()
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        release: threading.Event = threading.Event()
+        calls: list[str] = []
+        hanging: Widget = self.build_widget('hanging', 60, calls)
+        hanging.config.update_timeout = 0.05
+        hanging._update_func = lambda _widget, _widget_container: [str(release.wait(5))]
+
+        async def hanging_async(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+            await asyncio.sleep(5)
+            return []
+
+        hanging_coroutine: Widget = self.build_widget('hanging_coroutine', 60, calls)
+        hanging_coroutine.config.update_timeout = 0.05
+        hanging_coroutine._update_func = hanging_async
+        fast: Widget = self.build_widget('fast', 0.05, calls)
+        for widget in (hanging, hanging_coroutine, fast):
+            scheduler.add_widget(widget)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.3)
+        # The only worker is stuck, but got replaced once the update timed out
+        self.assertGreater(calls.count('fast'), 1)
+        self.assertEqual(hanging.error_data['__error__'], 'Update timed out after 0.05s')
+        self.assertEqual(hanging_coroutine.error_data['__error__'], 'Update timed out after 0.05s')
+        stalled: list[str] = [log_message.message for log_message in widget_container.log_messages]
+        self.assertEqual(len(stalled), 2)
+        self.assertIn('release.wait(5)', ''.join(stalled))  # Stack of the stuck worker
+        self.assertIn('asyncio.sleep(5)', ''.join(stalled))  # Await chain of the coroutine
+        release.set()
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+
+    def test_abandoned_update_is_not_rescheduled_until_it_returned(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(1)
+        widget_container.log_messages = LogMessages()
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        release: threading.Event = threading.Event()
+        running: list[int] = [0]
+        overlapping: list[bool] = []
+        hanging: Widget = self.build_widget('hanging', 0.01, [])
+        hanging.config.update_timeout = 0.05
+
+        def update(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+            running[0] += 1
+            overlapping.append(running[0] > 1)
+            release.wait(1)
+            running[0] -= 1
+            return ['hanging']
+
+        hanging._update_func = update
+        scheduler.add_widget(hanging)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.2)
+        self.assertEqual(hanging.error_data['__error__'], 'Update timed out after 0.05s')
+        self.assertEqual(overlapping, [False])  # Timed out long ago, but the call is still running
+        self.assertEqual(scheduler.scheduled_widgets(), [])
+        release.set()
+        time_module.sleep(0.05)
+        self.assertEqual(scheduler.scheduled_widgets(), [hanging])  # Retried once the call returned
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+        self.assertEqual(overlapping, [False])
+
+    def test_failing_updates_back_off(self) -> None:
+        widget_container: unittest.mock.MagicMock = self.build_widget_container(1)
+        scheduler: UpdateScheduler = UpdateScheduler(widget_container)
+
+        calls: list[str] = []
+        failing: Widget = self.build_widget('failing', 0.01, calls)
+
+        def fail(_widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+            calls.append('failing')
+            raise ValueError('API unreachable')
+
+        failing._update_func = fail
+        scheduler.add_widget(failing)
+
+        thread: threading.Thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        time_module.sleep(0.1)
+        widget_container.stop_event.set()
+        scheduler.wake_up()
+        thread.join(timeout=1)
+
+        self.assertEqual(calls, ['failing'])  # Retried after update_retry_delay, not after the 0.01s interval
+        self.assertEqual(failing.error_data['__error__'], 'API unreachable')
+        self.assertIn('Failed 1x, retrying at', failing.error_data['__retry__'])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_backoff_and_circuit(self) -> None:
+        base_config: BaseConfig = BaseConfig(
+            LogMessages(), True, 'UnitTest',
+            update_retry_delay=2, update_retry_max_delay=5, circuit_breaker_threshold=4, circuit_breaker_cooldown=100
+        )
+        circuit_breaker: CircuitBreaker = CircuitBreaker()
+
+        delays: list[float] = [circuit_breaker.record_failure(base_config) for _ in range(3)]
+        for delay, maximum in zip(delays, (2, 4, 5)):
+            self.assertTrue(maximum / 2 <= delay <= maximum)  # Jittered
+        self.assertIs(circuit_breaker.state, CircuitState.CLOSED)
+
+        self.assertEqual(circuit_breaker.record_failure(base_config), 100)
+        self.assertIs(circuit_breaker.state, CircuitState.OPEN)
+        self.assertIn('Circuit open (4 failures), next probe at', circuit_breaker.status())
+
+        circuit_breaker.before_attempt()
+        self.assertIs(circuit_breaker.state, CircuitState.HALF_OPEN)
+        self.assertEqual(circuit_breaker.record_failure(base_config), 100)  # Failed probe
+        circuit_breaker.before_attempt()
+        circuit_breaker.record_success()
+        self.assertIs(circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual(circuit_breaker.status(), '')
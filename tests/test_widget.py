@@ -1,7 +1,7 @@
 import typing
 import unittest
 import unittest.mock
-from twidgets.core.base import Widget, Dimensions
+from twidgets.core.base import Widget, Dimensions, WidgetSnapshot
 
 
 class TestWidget(unittest.TestCase):
@@ -25,3 +25,40 @@ class TestWidget(unittest.TestCase):
         self.assertTrue(w.help_mode)
         w.toggle_help_mode()
         self.assertFalse(w.help_mode)
+
+    def test_redraw_tracking(self) -> None:
+        config: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        config.enabled = True
+        w: Widget = Widget(
+            'name', 'title', config, unittest.mock.MagicMock(), None, Dimensions(1, 1, 0, 0, 0),
+            unittest.mock.MagicMock(), redraw_interval=1
+        )
+        self.assertTrue(w.needs_redraw(10.5))
+        w.mark_clean(10.5)
+        self.assertFalse(w.needs_redraw(10.9))
+        self.assertTrue(w.needs_redraw(11.0))  # Aligned to the next full second
+        w.mark_clean(11.0)
+        w.toggle_help_mode()
+        self.assertTrue(w.needs_redraw(11.0))
+
+    def test_publish_snapshot(self) -> None:
+        config: unittest.mock.MagicMock = unittest.mock.MagicMock()
+        config.enabled = True
+        w: Widget = Widget(
+            'name', 'title', config, unittest.mock.MagicMock(), None, Dimensions(1, 1, 0, 0, 0),
+            unittest.mock.MagicMock()
+        )
+        w.mark_clean(0)
+        w.publish(['line'])
+        drawn: WidgetSnapshot = w.snapshot
+        self.assertEqual(drawn.lines, ('line',))
+        self.assertTrue(w.needs_redraw(0))
+
+        w.publish(drawn.lines, 'error', 'retrying')  # Published while the first snapshot was being drawn
+        w.mark_clean(0, drawn)
+        self.assertTrue(w.needs_redraw(0))
+        self.assertEqual(w.draw_data, ['line'])
+        self.assertEqual(w.error_data, {'__error__': 'error', '__retry__': 'retrying'})
+        self.assertEqual(drawn.error, None)  # Snapshots never change
+        w.mark_clean(0)
+        self.assertFalse(w.needs_redraw(0))
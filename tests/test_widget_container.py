@@ -1,7 +1,10 @@
+import os
+import threading
+import time
 import typing
 import unittest
 import unittest.mock
-from twidgets.core.base import Widget, Dimensions, WidgetContainer
+from twidgets.core.base import Widget, Dimensions, WidgetContainer, FloatingWidget
 
 
 class TestWidgetContainer(unittest.TestCase):
@@ -15,3 +18,137 @@ class TestWidgetContainer(unittest.TestCase):
         w: Widget = Widget('name', 'title', config, unittest.mock.MagicMock(), None, dim, stdscr)
         container.add_widget(w)
         self.assertIn(w, container.return_widgets())
+
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def test_render_order(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        stdscr: typing.Any = mock_initscr()
+        container: WidgetContainer = WidgetContainer(stdscr, test_env=True)
+        widgets: list[Widget] = []
+        for name, z_index in (('top', 2), ('bottom', 0), ('middle', 1), ('middle_loaded_last', 1)):
+            config: unittest.mock.MagicMock = unittest.mock.MagicMock()
+            config.enabled = True
+            widgets.append(Widget(
+                name, 'title', config, unittest.mock.MagicMock(), None, Dimensions(1, 1, 0, 0, z_index), stdscr
+            ))
+        top, bottom, middle, middle_loaded_last = widgets
+        container.add_widget_list(widgets)
+        floating_widget: FloatingWidget = FloatingWidget('warning', 'title', Dimensions(1, 1, 0, 0, 1000), [], stdscr)
+        container.add_floating_widget(floating_widget)
+
+        render_order: list[Widget | FloatingWidget] = container.return_render_order()
+        self.assertEqual(render_order, [bottom, middle, middle_loaded_last, top, floating_widget])
+        self.assertIs(container.return_render_order(), render_order)  # Cached
+
+        container.set_widget_z_index(bottom, 3)
+        self.assertEqual(container.return_render_order(), [middle, middle_loaded_last, top, bottom, floating_widget])
+        container.deactivate_widget(top)
+        container.remove_floating_widget(floating_widget)
+        self.assertEqual(container.return_render_order(), [middle, middle_loaded_last, bottom])
+        container.reactivate_all_widgets()
+        self.assertEqual(container.return_render_order(), [middle, middle_loaded_last, top, bottom])
+
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def test_visible_regions(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        stdscr: typing.Any = mock_initscr()
+        container: WidgetContainer = WidgetContainer(stdscr, test_env=True)
+        widgets: list[Widget] = []
+        for name, dimensions in (
+                ('covered', Dimensions(5, 5, 0, 0, 0)),
+                ('partly_covered', Dimensions(5, 10, 0, 0, 1)),
+                ('top', Dimensions(5, 5, 0, 0, 2))
+        ):
+            config: unittest.mock.MagicMock = unittest.mock.MagicMock()
+            config.enabled = True
+            widgets.append(Widget(name, 'title', config, unittest.mock.MagicMock(), None, dimensions, stdscr))
+        covered, partly_covered, top = widgets
+        container.add_widget_list(widgets)
+        container.return_render_order()
+
+        self.assertTrue(covered.hidden())
+        self.assertFalse(container.widget_requires_redraw(covered, 0))
+        self.assertFalse(partly_covered.hidden())
+        self.assertFalse(partly_covered.visible_at(0, 4))
+        self.assertTrue(partly_covered.visible_at(0, 5))
+        self.assertTrue(top.visible_at(0, 0))
+
+        container.deactivate_widget(top)
+        partly_covered.mark_clean(0)
+        container.return_render_order()
+        self.assertTrue(partly_covered.visible_at(0, 4))
+        self.assertFalse(partly_covered.needs_redraw(0))  # Its window already holds the uncovered parts
+        self.assertTrue(covered.hidden())  # Still covered by partly_covered
+
+        covered.mark_clean(0)
+        container.deactivate_widget(partly_covered)
+        container.return_render_order()
+        self.assertTrue(covered.needs_redraw(0))  # Wasn't drawn while hidden
+
+
+class TestEventLoop(unittest.TestCase):
+    @unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock())
+    def setUp(self, mock_initscr: unittest.mock.MagicMock) -> None:
+        stdscr: typing.Any = mock_initscr()
+        self.container: WidgetContainer = WidgetContainer(stdscr, test_env=True)
+
+    def tearDown(self) -> None:
+        self.container.close_event_loop()
+
+    def test_no_file_descriptors_until_opened(self) -> None:
+        open_fds: int = len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else -1
+        container: WidgetContainer = WidgetContainer(unittest.mock.MagicMock(), test_env=True)
+        if open_fds >= 0:
+            self.assertEqual(len(os.listdir('/proc/self/fd')), open_fds)
+        container.wake_up()  # Nothing to wake up, doesn't raise
+        container.close_event_loop()
+
+    def test_wake_up_interrupts_waiting(self) -> None:
+        self.container.open_event_loop()
+        threading.Timer(0.05, self.container.wake_up).start()
+        start: float = time.monotonic()
+        self.container.wait_for_events(5)
+        self.assertLess(time.monotonic() - start, 2)
+
+        start = time.monotonic()
+        self.container.wait_for_events(0.05)  # The wake-up was consumed, waits for the timeout
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_wake_ups_are_coalesced(self) -> None:
+        self.container.open_event_loop()
+        for _ in range(10000):  # More than the pipe holds, never blocks
+            self.container.wake_up()
+        self.container.wait_for_events(None)
+        start: float = time.monotonic()
+        self.container.wait_for_events(0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_closed_event_loop(self) -> None:
+        self.container.open_event_loop()
+        self.container.close_event_loop()
+        self.container.wake_up()  # After cleanup, e.g. from the scheduler thread
+        self.container.close_event_loop()  # Twice is fine
+
+    def test_closing_waits_for_a_running_wake_up(self) -> None:
+        # Otherwise a late wake_up() (e.g. from a worker outliving the cleanup) could write into a file reusing the
+        # closed self-pipe's fd number
+        self.container.open_event_loop()
+        writing: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+        write: typing.Callable[[int, bytes], int] = os.write
+
+        def blocking_write(fd: int, data: bytes) -> int:
+            writing.set()
+            release.wait(1)
+            return write(fd, data)
+
+        with unittest.mock.patch('os.write', side_effect=blocking_write):
+            waker: threading.Thread = threading.Thread(target=self.container.wake_up)
+            waker.start()
+            writing.wait(1)
+            closer: threading.Thread = threading.Thread(target=self.container.close_event_loop)
+            closer.start()
+            closer.join(0.05)
+            self.assertTrue(closer.is_alive())
+            release.set()
+            waker.join(1)
+            closer.join(1)
+        self.assertFalse(closer.is_alive())
@@ -0,0 +1,78 @@
+import pathlib
+import subprocess
+import sys
+import tempfile
+import typing
+import unittest
+import unittest.mock
+from twidgets.core.base import WidgetContainer, WidgetSourceFileException
+
+WIDGET_SOURCE: str = '''from twidgets.core.base import Widget, Config, CursesWindowType
+
+
+def draw(widget, widget_container):
+    widget_container.draw_widget(widget)
+
+
+def build(stdscr: CursesWindowType, config: Config) -> Widget:
+    return Widget(config.name, config.title, config, draw, config.interval, config.dimensions, stdscr)
+'''
+
+WIDGET_CONFIG: str = '''name: '{name}'
+title: ' {name} '
+enabled: {enabled}
+interval: 0
+height: 3
+width: 10
+y: 0
+x: 0
+z: 0
+'''
+
+
+class TestWidgetLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        root: pathlib.Path = pathlib.Path(self.directory.name)
+        (root / 'config' / 'widgets').mkdir(parents=True)
+        (root / 'py_widgets').mkdir()
+        for name, enabled, source in (
+                ('first', True, WIDGET_SOURCE),
+                ('second', True, WIDGET_SOURCE),
+                ('disabled', False, 'raise ImportError("Should not be imported")\n'),
+        ):
+            (root / 'py_widgets' / f'{name}_widget.py').write_text(source)
+            (root / 'config' / 'widgets' / f'{name}.yaml').write_text(WIDGET_CONFIG.format(name=name, enabled=enabled))
+
+        with unittest.mock.patch('curses.initscr', return_value=unittest.mock.MagicMock()) as mock_initscr:
+            stdscr: typing.Any = mock_initscr()
+        self.container: WidgetContainer = WidgetContainer(stdscr, test_env=True)
+        self.container.widget_loader.PY_WIDGET_DIR = root / 'py_widgets'
+        self.container.config_loader.SCRIPT_DIR = root
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        for module_name in ('first_widget', 'second_widget', 'disabled_widget'):
+            sys.modules.pop(module_name, None)
+
+    def test_disabled_widgets_are_not_imported(self) -> None:
+        self.container.build_widgets()
+        self.assertEqual(sorted(str(widget.name) for widget in self.container.return_widgets()), ['first', 'second'])
+        self.assertNotIn('disabled_widget', sys.modules)
+
+    def test_core_does_not_import_widget_dependencies(self) -> None:
+        # Only widgets using twidgets.core.http / twidgets.core.metrics import them, disabled ones never do
+        modules: str = subprocess.run(
+            [sys.executable, '-c', 'import sys, twidgets.core.base; print(*sorted(sys.modules))'],
+            check=True, capture_output=True, text=True
+        ).stdout
+        for module_name in ('requests', 'urllib3', 'psutil', 'twidgets.core.http', 'twidgets.core.metrics'):
+            self.assertNotIn(module_name, modules.split())
+
+    def test_import_errors_are_reported(self) -> None:
+        with self.assertRaises(WidgetSourceFileException):
+            self.container.widget_loader.load_custom_widget_modules()  # All widgets, including the broken one
+
+
+if __name__ == '__main__':
+    unittest.main()
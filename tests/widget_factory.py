@@ -0,0 +1,20 @@
+import unittest.mock
+from twidgets.core.base import Widget, Dimensions
+
+
+def build_widget(
+        name: str,
+        interval: float = 60,
+        config_hash: str = '',
+        update_func: Widget.UpdateFunction | None = None,
+        persistent_keys: list[str] | None = None
+) -> Widget:
+    """Enabled widget with a mocked config, draw function and window (update_func defaults to a MagicMock)"""
+    config: unittest.mock.MagicMock = unittest.mock.MagicMock()
+    config.enabled = True
+    config.update_timeout = None
+    config.config_hash = config_hash
+    return Widget(
+        name, 'title', config, unittest.mock.MagicMock(), interval, Dimensions(5, 5, 0, 0, 0), unittest.mock.MagicMock(),
+        update_func=update_func or unittest.mock.MagicMock(), persistent_keys=persistent_keys
+    )
@@ -53,5 +53,6 @@ def build(stdscr: CursesWindowType, config: Config) -> Widget:
         mouse_click_func=None,
         keyboard_func=None,
         init_func=None,
-        help_func=draw_help
+        help_func=draw_help,
+        redraw_interval=1
     )
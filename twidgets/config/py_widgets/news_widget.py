@@ -10,15 +10,15 @@ from twidgets.core.base import (
     CursesKeys,
     CursesColors, DebugException
 )
+from twidgets.core.http import CachedResponse
 
 
 def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
     feed_url: str | None = widget_container.config_loader.get_secret('NEWS_FEED_URL')
     feed_name: str | None = widget_container.config_loader.get_secret('NEWS_FEED_NAME')
 
-    widget.internal_data['feed_entries'] = None
-
     if feed_url is None:
+        widget.internal_data['feed_entries'] = None
         return [
             'News data not available.',
             '',
@@ -31,8 +31,13 @@ def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
     content: list[str] = []
 
     try:
-        response = requests.get(feed_url, timeout=5)
-        response.raise_for_status()  # Raises if status != 2xx
+        # Cached on disk; Raises if status != 2xx
+        response: CachedResponse = widget_container.http.get_cached(feed_url)
+
+        if response.digest == widget.internal_data.get('feed_digest') and widget.internal_data.get('feed_entries'):
+            return ['Success']  # Feed unchanged (304 Not Modified), no need to parse it again
+
+        widget.internal_data['feed_entries'] = None
 
         # Parse from content (string)
         feed = feedparser.parse(response.text)
@@ -45,6 +50,7 @@ def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
                 'Check your configuration.'
             ]
     except requests.exceptions.RequestException:
+        widget.internal_data['feed_entries'] = None
         return [
             'News data not available.',
             '',
@@ -61,6 +67,7 @@ def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
         ]
 
     widget.internal_data['feed_entries'] = feed_entries
+    widget.internal_data['feed_digest'] = response.digest
     return ['Success']
 
 
@@ -222,5 +229,6 @@ def build(stdscr: CursesWindowType, config: Config) -> Widget:
         mouse_click_func=mouse_click_action,
         keyboard_func=keyboard_press_action,
         init_func=None,
-        help_func=draw_help
+        help_func=draw_help,
+        persistent_keys=['feed_entries', 'feed_digest']  # Shown right away on the next start
     )
@@ -0,0 +1,168 @@
+import typing
+from twidgets.core.base import (
+    Widget,
+    WidgetContainer,
+    Config,
+    CursesWindowType,
+    CursesKeys,
+    CursesColors
+)
+from twidgets.core.metrics import ProcessScanner, ProcessSample
+
+
+def init(widget: Widget, _widget_container: WidgetContainer) -> None:
+    if widget.internal_data.get('scanner') is None:  # Kept when reloading (CPU usage needs previous samples)
+        widget.internal_data['scanner'] = ProcessScanner(
+            widget.config.top or 20,
+            widget.config.sort or 'cpu',
+            widget.config.scan_steps or 1
+        )
+
+
+def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
+    if widget.internal_data.get('scanner') is None:
+        init(widget, widget_container)
+    scanner: ProcessScanner = widget.internal_data['scanner']
+
+    widget.internal_data['processes'] = scanner.step()
+    return ['Success']
+
+
+def format_process(process: ProcessSample) -> str:
+    command: str = ' '.join(process.command.split())  # Command lines may contain newlines
+    rss_mib: float = process.rss / 1024 ** 2
+    return f'{process.pid:>7} {process.user[:10]:<10} {process.cpu_percent:>6.1f} {rss_mib:>8.1f} {command}'
+
+
+HEADER: str = f'{"PID":>7} {"USER":<10} {"CPU%":>6} {"RSS MiB":>8} COMMAND'
+
+
+def mouse_click_action(widget: Widget, _mx: int, my: int, _b_state: int, widget_container: WidgetContainer) -> None:
+    if widget.help_mode:
+        return
+
+    processes: list[ProcessSample] = widget.internal_data.get('processes') or []
+    if not processes or widget_container.ui_state.highlighted != widget:
+        widget.internal_data['selected_line'] = None
+        return
+
+    max_render: int = widget.dimensions.current_height - 3  # Border & header
+
+    # Click relative to the first table row
+    local_y: int = my - widget.dimensions.current_y - 2  # -2 for top border & header
+    if 0 <= local_y < min(len(processes), max_render):
+        # Compute which part of the table is currently visible
+        abs_index: int = widget.internal_data.get('selected_line', 0) or 0
+        start = max(abs_index - max_render // 2, 0)
+        if start + max_render > len(processes):
+            start = max(len(processes) - max_render, 0)
+
+        widget.internal_data['selected_line'] = min(start + local_y, len(processes) - 1)
+    else:
+        widget.internal_data['selected_line'] = None
+
+
+def keyboard_press_action(widget: Widget, key: int, _widget_container: WidgetContainer) -> None:
+    if widget.help_mode:
+        return
+
+    processes: list[ProcessSample] = widget.internal_data.get('processes') or []
+    if not processes:
+        return
+
+    selected: int = widget.internal_data.get('selected_line', 0)
+
+    if not isinstance(selected, int):
+        selected = 0
+
+    # Navigation
+    if key == CursesKeys.UP:
+        selected -= 1
+    elif key == CursesKeys.DOWN:
+        selected += 1
+
+    # Wrap around
+    if selected < 0:
+        selected = len(processes) - 1
+
+    if selected > (len(processes) - 1):
+        selected = 0
+
+    widget.internal_data['selected_line'] = selected
+
+
+def render_table(
+        processes: list[ProcessSample], highlighted_line: int | None, max_render: int
+) -> tuple[list[str], int | None]:
+    # Everything fits, no slicing needed
+    if len(processes) <= max_render:
+        return [format_process(process) for process in processes], highlighted_line
+
+    if highlighted_line is None:
+        # No highlight -> show the top processes
+        start = 0
+    else:
+        # Compute slice around highlighted line, without going past the list
+        start = max(highlighted_line - max_render // 2, 0)
+        if start + max_render > len(processes):
+            start = max(len(processes) - max_render, 0)
+
+    end: int = start + max_render
+    visible_rows: list[str] = [format_process(process) for process in processes[start:end]]
+
+    rel_index: int | None = None if highlighted_line is None else highlighted_line - start
+    return visible_rows, rel_index
+
+
+def draw(widget: Widget, widget_container: WidgetContainer, info: list[str]) -> None:
+    widget_container.draw_widget(widget)
+
+    if info and info != ['Success']:  # Display error if something went wrong
+        widget.add_widget_content(info)
+        return
+
+    if widget_container.ui_state.highlighted != widget:
+        widget.internal_data['selected_line'] = None
+
+    rows, rel_index = render_table(
+        typing.cast(list[ProcessSample], widget.internal_data.get('processes') or []),
+        widget.internal_data.get('selected_line'),
+        widget.dimensions.current_height - 3  # Border & header
+    )
+
+    width: int = widget.dimensions.current_width - 2
+    widget.safe_addstr(1, 1, HEADER[:width], [widget_container.base_config.SECONDARY_PAIR_NUMBER])
+    for i, row in enumerate(rows):
+        if rel_index is not None and i == rel_index:
+            widget.safe_addstr(
+                2 + i, 1, row[:width],
+                [widget_container.base_config.SECONDARY_PAIR_NUMBER], [CursesColors.REVERSE])
+        else:
+            widget.safe_addstr(2 + i, 1, row[:width])
+
+
+def draw_help(widget: Widget, widget_container: WidgetContainer) -> None:
+    widget_container.draw_widget(widget)
+
+    widget.add_widget_content(
+        [
+            f'Help page ({widget.name} widget)',
+            '',
+            'Keybinds: ',
+            'Arrow Keys - Navigation',
+            '',
+            'Displays the processes using the most CPU / memory.',
+            'CPU% is relative to one core.'
+        ]
+    )
+
+
+def build(stdscr: CursesWindowType, config: Config) -> Widget:
+    return Widget(
+        config.name, config.title, config, draw, config.interval, config.dimensions, stdscr,
+        update_func=update,
+        mouse_click_func=mouse_click_action,
+        keyboard_func=keyboard_press_action,
+        init_func=init,
+        help_func=draw_help
+    )
@@ -1,5 +1,5 @@
 import psutil
-import shutil
+import functools
 import typing
 from twidgets.core.base import (
     Widget,
@@ -7,10 +7,57 @@ from twidgets.core.base import (
     Config,
     CursesWindowType
 )
+from twidgets.core.metrics import MetricsSampler, SystemMetrics, sparkline
+
+
+def selection(value: typing.Any) -> list[typing.Any] | None:
+    """`cores` / `interfaces` config value: None for all, else the selected ones"""
+    if value is None or value == 'all':
+        return None
+    if value == 'none' or value is False:
+        return []
+    return list(value) if isinstance(value, list) else [value]
+
+
+def sample(
+        system_metrics: SystemMetrics, cores: list[int] | None, interfaces: list[str] | None
+) -> tuple[dict[str, float], dict[str, float]]:
+    # One read per source & tick; per-core & per-interface values come out of the same read as the totals
+    cpu_percent, core_percents = system_metrics.cpu_percents()  # Since the last sample
+    memory = system_metrics.memory()
+    disk_total, disk_used = system_metrics.disk_usage('/')
+    network: dict[str, tuple[int, int]] = system_metrics.network_interfaces()
+
+    gauges: dict[str, float] = {
+        'cpu': cpu_percent,
+        'memory_used': memory.total - memory.available,
+        'memory_total': memory.total,
+        'swap_used': memory.swap_used,
+        'swap_total': memory.swap_total,
+        'disk_used': disk_used,
+        'disk_total': disk_total,
+    }
+    counters: dict[str, float] = {
+        'bytes_sent': sum(sent for sent, _ in network.values()),
+        'bytes_recv': sum(recv for _, recv in network.values()),
+    }
+
+    for core, core_percent in core_percents.items():  # By core number, offline cores are missing
+        if cores is None or core in cores:
+            gauges[f'core:{core}'] = core_percent
 
+    for name, (bytes_sent, bytes_recv) in network.items():
+        if interfaces is None:
+            if name == 'lo' or not bytes_sent + bytes_recv:  # All = all in use, except loopback
+                continue
+        elif name not in interfaces:
+            continue
+        counters[f'bytes_sent:{name}'] = bytes_sent
+        counters[f'bytes_recv:{name}'] = bytes_recv
+    return gauges, counters
 
-def update(widget: Widget, _widget_container: WidgetContainer) -> list[str]:
-    cpu = psutil.cpu_percent()
+
+def cpu_description() -> str:
     cpu_cores = psutil.cpu_count(logical=False)
     max_freq_mhz = 0.0
     try:
@@ -25,68 +72,124 @@ def update(widget: Widget, _widget_container: WidgetContainer) -> list[str]:
                 max_freq_mhz = max_freq
     except Exception:
         pass
-    memory = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-    disk_usage = shutil.disk_usage('/')
-    network = psutil.net_io_counters()
-
-    old_bytes_sent: int = typing.cast(int, widget.internal_data.get('bytes_sent'))
-    old_bytes_recv: int = typing.cast(int, widget.internal_data.get('bytes_recv'))
-
-    new_bytes_sent: int = network.bytes_sent
-    new_bytes_recv: int = network.bytes_recv
-
-    difference_bytes_sent_mib: float = 0.0
-    difference_bytes_recv_mib: float = 0.0
-
-    if widget.config.interval is not None:
-        if old_bytes_sent is not None:
-            difference_bytes_sent_mib = round(((new_bytes_sent - old_bytes_sent) / widget.config.interval) /
-                                              (1024 ** 2), 2)
-        if old_bytes_recv is not None:
-            difference_bytes_recv_mib = round(((new_bytes_recv - old_bytes_recv) / widget.config.interval) /
-                                              (1024 ** 2), 2)
-
-    widget.internal_data = {
-        'bytes_sent': new_bytes_sent,
-        'bytes_recv': new_bytes_recv,
-    }
+    return f'{cpu_cores} Cores @ {max_freq_mhz} MHz'
 
-    # memory.used returns something else...
-    memory_used_mib: float = round((memory.total - memory.available) / (1024 ** 2), 2)
-    memory_total_mib: float = round(memory.total / (1024 ** 2), 2)
-    memory_percent: float = round(memory_used_mib * 100 / memory_total_mib, 2)
 
-    swap_used_mib: float = round(swap.used / (1024 ** 2), 2)
-    swap_total_mib: float = round(swap.total / (1024 ** 2), 2)
+def init(widget: Widget, widget_container: WidgetContainer) -> None:
+    sample_rate: float = widget.config.sample_rate or 1
+    history: float = widget.config.history or 120
 
-    try:
-        swap_percent: float = round(swap_used_mib * 100 / swap_total_mib, 2)
-    except ZeroDivisionError:
-        swap_percent = 0.0
+    sampler: MetricsSampler | None = widget.internal_data.get('sampler')
+    if sampler is None:  # Kept when reloading
+        sample_func = functools.partial(
+            sample, SystemMetrics.create(), selection(widget.config.cores), selection(widget.config.interfaces)
+        )
+        sampler = MetricsSampler(sample_func, sample_rate, int(history * sample_rate))
+        widget.internal_data['sampler'] = sampler
+        widget.internal_data['cpu_description'] = cpu_description()
+    sampler.start(widget_container.stop_event)
 
-    disk_used_gib: float = round(disk_usage.used / (1024 ** 3), 2)
-    disk_total_gib: float = round(disk_usage.total / (1024 ** 3), 2)
 
+def percent(used: float, total: float) -> float:
     try:
-        disk_percent: float = round(disk_used_gib * 100 / disk_total_gib, 2)
+        return round(used * 100 / total, 2)
     except ZeroDivisionError:
-        disk_percent = 0.0
+        return 0.0
+
+
+def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
+    sampler: MetricsSampler | None = widget.internal_data.get('sampler')
+    if sampler is None or not sampler.running():
+        init(widget, widget_container)
+        sampler = widget.internal_data['sampler']
+
+    cpu: float = sampler.latest('cpu')
+
+    memory_used_mib: float = round(sampler.latest('memory_used') / (1024 ** 2), 2)
+    memory_total_mib: float = round(sampler.latest('memory_total') / (1024 ** 2), 2)
+    memory_percent: float = percent(memory_used_mib, memory_total_mib)
 
-    return [
-        f'CPU: {cpu:04.1f}% ({cpu_cores} Cores @ {max_freq_mhz} MHz)',
+    swap_used_mib: float = round(sampler.latest('swap_used') / (1024 ** 2), 2)
+    swap_total_mib: float = round(sampler.latest('swap_total') / (1024 ** 2), 2)
+    swap_percent: float = percent(swap_used_mib, swap_total_mib)
+
+    disk_used_gib: float = round(sampler.latest('disk_used') / (1024 ** 3), 2)
+    disk_total_gib: float = round(sampler.latest('disk_total') / (1024 ** 3), 2)
+    disk_percent: float = percent(disk_used_gib, disk_total_gib)
+
+    # Rates over the real time between the last two samples
+    bytes_sent_mib: float = round(sampler.latest('bytes_sent') / (1024 ** 2), 2)
+    bytes_recv_mib: float = round(sampler.latest('bytes_recv') / (1024 ** 2), 2)
+
+    content: list[str] = [
+        f'CPU: {cpu:04.1f}% ({widget.internal_data["cpu_description"]})',
         f'Memory: {memory_used_mib} MiB / {memory_total_mib} MiB ({memory_percent}%)',
         f'Swap: {swap_used_mib} MiB / {swap_total_mib} MiB ({swap_percent}%)',
         f'Disk: {disk_used_gib} GiB / {disk_total_gib} GiB ({disk_percent}%)',
-        f'Network sent: {difference_bytes_sent_mib} MiB / s',
-        f'Network received: {difference_bytes_recv_mib} MiB / s',
+        f'Network sent: {bytes_sent_mib} MiB / s',
+        f'Network received: {bytes_recv_mib} MiB / s',
     ]
+    graphs: list[tuple[str, str | float | None]] = list(GRAPHS)
+
+    cores: list[str] = core_metrics(sampler)
+    if cores:
+        content.append(f'Cores ({len(cores)}):')
+        graphs.append(('cores', 100.0))
+
+    for metric in sorted(sampler.names('bytes_recv:')):
+        name: str = metric.split(':', 1)[1]
+        interface_sent_mib: float = round(sampler.latest(f'bytes_sent:{name}') / (1024 ** 2), 2)
+        interface_recv_mib: float = round(sampler.latest(metric) / (1024 ** 2), 2)
+        content.append(f'{name}: {interface_recv_mib} MiB / s received, {interface_sent_mib} MiB / s sent')
+        graphs.append((metric, None))
+
+    widget.internal_data['graphs'] = graphs
+    return content
+
+
+def core_metrics(sampler: MetricsSampler) -> list[str]:
+    return sorted(sampler.names('core:'), key=lambda metric: int(metric.split(':', 1)[1]))
+
+
+# History graph of every line: (metric, metric holding its maximum / fixed maximum / None for the largest value)
+# The cores line shows the latest value of every core instead
+GRAPHS: list[tuple[str, str | float | None]] = [
+    ('cpu', 100.0),
+    ('memory_used', 'memory_total'),
+    ('swap_used', 'swap_total'),
+    ('disk_used', 'disk_total'),
+    ('bytes_sent', None),
+    ('bytes_recv', None),
+]
 
 
 def draw(widget: Widget, widget_container: WidgetContainer, content: list[str]) -> None:
     widget_container.draw_widget(widget)
     widget.add_widget_content(content)
 
+    sampler: MetricsSampler | None = widget.internal_data.get('sampler')
+    if sampler is None:
+        return
+
+    # Graphs share a column right of the longest line
+    inner_width: int = widget.dimensions.current_width - 2
+    graph_x: int = max((len(line) for line in content), default=0) + 3
+    graph_width: int = min(inner_width - graph_x, sampler.capacity)
+    if graph_width < 4:
+        return
+
+    graphs: list[tuple[str, str | float | None]] = widget.internal_data.get('graphs', GRAPHS)
+    for i, (metric, maximum) in enumerate(graphs[:min(len(content), widget.dimensions.current_height - 2)]):
+        if isinstance(maximum, str):
+            maximum = sampler.latest(maximum) or None
+        if metric == 'cores':
+            # One bar per core; with more cores than columns, every bar is the busiest of its group
+            values: list[float] = [sampler.latest(core) for core in core_metrics(sampler)]
+        else:
+            values = sampler.history(metric)
+        graph: str = sparkline(values, graph_width, maximum)
+        widget.safe_addstr(1 + i, 1 + graph_x, graph, [widget_container.base_config.SECONDARY_PAIR_NUMBER])
+
 
 def draw_help(widget: Widget, widget_container: WidgetContainer) -> None:
     widget_container.draw_widget(widget)
@@ -95,7 +198,9 @@ def draw_help(widget: Widget, widget_container: WidgetContainer) -> None:
         [
             f'Help page ({widget.name} widget)',
             '',
-            'Displays resource usage of your computer.'
+            'Displays resource usage of your computer.',
+            'Graphs show the history of the last minutes,',
+            'the cores line the current usage of every core.'
         ]
     )
 
@@ -106,6 +211,6 @@ def build(stdscr: CursesWindowType, config: Config) -> Widget:
         update_func=update,
         mouse_click_func=None,
         keyboard_func=None,
-        init_func=None,
+        init_func=init,
         help_func=draw_help
     )
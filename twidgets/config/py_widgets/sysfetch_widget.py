@@ -1,4 +1,8 @@
+import concurrent.futures
 import datetime
+import json
+import pathlib
+import re
 import subprocess
 import psutil
 import locale
@@ -17,11 +21,11 @@ from twidgets.core.base import (
 )
 
 
-def run_cmd(cmd: str) -> str | None:
-    """Run a shell command and return output if successful, else None."""
+def run_cmd(args: list[str]) -> str | None:
+    """Run a command (without a shell) and return output if successful, else None."""
     try:
         result: subprocess.CompletedProcess[typing.Any] = subprocess.run(
-            cmd, shell=True, text=True, capture_output=True
+            args, text=True, capture_output=True, timeout=5
         )
         if result.returncode == 0:
             return str(result.stdout.strip())
@@ -30,9 +34,24 @@ def run_cmd(cmd: str) -> str | None:
     return None
 
 
-def get_uptime() -> str:
-    boot_time: datetime.datetime = datetime.datetime.fromtimestamp(psutil.boot_time())
-    uptime: datetime.timedelta = datetime.datetime.now() - boot_time
+def read_file(path: str) -> str | None:
+    try:
+        with open(path, 'r', errors='replace') as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def first_line_containing(text: str | None, *needles: str) -> str | None:
+    """First line of text containing any of the needles (case-insensitive), like grep -i | head -n 1"""
+    for line in (text or '').splitlines():
+        if any(needle.lower() in line.lower() for needle in needles):
+            return line.strip()
+    return None
+
+
+def get_uptime(boot_time: float) -> str:
+    uptime: datetime.timedelta = datetime.datetime.now() - datetime.datetime.fromtimestamp(boot_time)
     days: int = uptime.days
     hours: int
     remainder: int
@@ -45,16 +64,16 @@ def get_uptime() -> str:
 
 def get_shell_info() -> str:
     shell: str = os.environ.get('SHELL') or 'Unknown'
-    version: str | None = run_cmd(f'{shell} --version') if shell != 'Unknown' else None
-    final_shell: str = str(version or shell)
+    version: str | None = run_cmd([shell, '--version']) if shell != 'Unknown' else None
+    final_shell: str = version.splitlines()[0] if version else shell  # Only the version, not the license text
     return final_shell
 
 
 def get_cpu_info() -> str:
     cpu: str = platform.processor().strip() or ''
     if not cpu or cpu.lower() == 'unknown':
-        cpu_alt: str | None = run_cmd('grep "model name" /proc/cpuinfo | head -n 1 | cut -d: -f2')
-        cpu = cpu_alt.strip() if cpu_alt else 'Unknown CPU'
+        model_name: str | None = first_line_containing(read_file('/proc/cpuinfo'), 'model name')
+        cpu = model_name.split(':', 1)[1].strip() if model_name else 'Unknown CPU'
     try:
         cores: int | None = psutil.cpu_count(logical=False)
         freq_info: psutil._common.scpufreq | None = psutil.cpu_freq()
@@ -69,55 +88,155 @@ def get_cpu_info() -> str:
 def get_display_info_linux() -> str:
     display_info: str
     if os.environ.get('DISPLAY'):
-        display_info_tmp: str | None = run_cmd('xdpyinfo 2>/dev/null | grep "dimensions:" | awk "{print $2}"')
-        display_info = display_info_tmp or 'Display: Unknown'
+        dimensions: str | None = first_line_containing(run_cmd(['xdpyinfo']), 'dimensions:')
+        display_info = dimensions.split()[1] if dimensions else 'Display: Unknown'
     else:
         display_info = 'Display: Headless'
     return display_info
 
 
 def get_gpu_info_linux() -> str:
-    gpu_info: str = run_cmd('lspci | grep -i "vga\\|3d\\|display"') or 'Unknown GPU'
+    gpu_info: str = first_line_containing(run_cmd(['lspci']), 'vga', '3d', 'display') or 'Unknown GPU'
     return gpu_info.strip()
 
 
-def return_macos_info() -> list[str]:
+def get_dpkg_packages() -> str:
+    # Every package dpkg knows about has an entry (like dpkg --get-selections)
+    status: str | None = read_file('/var/lib/dpkg/status')
+    return str(status.count('\nPackage: ') + status.startswith('Package: ')) if status else 'Unknown'
+
+
+def get_macos_displays() -> str:
+    return run_cmd(['/usr/sbin/system_profiler', 'SPDisplaysDataType']) or ''
+
+
+def get_brew_packages() -> str:
+    packages: str | None = run_cmd(['brew', 'list'])
+    return str(len(packages.splitlines())) if packages is not None else 'Unknown'
+
+
+def get_raspi_gpu_info() -> str:
+    return first_line_containing(run_cmd(['vcgencmd', 'version']), 'version') or get_gpu_info_linux()
+
+
+def get_raspi_display_info() -> str:
+    match: re.Match[str] | None = re.search(r'[0-9]+x[0-9]+', run_cmd(['tvservice', '-s']) or '')
+    return match.group() if match else get_display_info_linux()
+
+
+# Facts that don't change while the system is running; Probed once (in parallel), then cached on disk per boot
+STATIC_PROBES: dict[str, dict[str, typing.Callable[[], str]]] = {
+    'macos': {
+        'shell': get_shell_info,
+        'terminal_font': lambda: (
+            run_cmd(['defaults', 'read', 'com.apple.Terminal', 'Default Window Settings']) or 'N/A'
+        ),
+        'cpu': lambda: run_cmd(['sysctl', '-n', 'machdep.cpu.brand_string']) or 'Unknown CPU',
+        'displays': get_macos_displays,
+        'packages': get_brew_packages,
+        'os_version': lambda: ' '.join(v for v in platform.mac_ver() if isinstance(v, str)),
+        'host': lambda: str(run_cmd(['sysctl', '-n', 'hw.model'])),
+    },
+    'raspbian': {
+        'os': lambda: platform.platform().split('+')[0],
+        'host': lambda: (read_file('/sys/firmware/devicetree/base/model') or 'Unknown Model').replace('\x00', ''),
+        'packages': get_dpkg_packages,
+        'shell': get_shell_info,
+        'cpu': get_cpu_info,
+        'gpu': get_raspi_gpu_info,
+        'display': get_raspi_display_info,
+    },
+    'linux': {
+        'os': platform.platform,
+        'shell': get_shell_info,
+        'cpu': get_cpu_info,
+        'gpu': get_gpu_info_linux,
+        'display': get_display_info_linux,
+    },
+}
+
+
+def boot_id() -> str:
+    """Changes with every boot of the system"""
+    return (read_file('/proc/sys/kernel/random/boot_id') or '').strip() or str(psutil.boot_time())
+
+
+def collect_static_facts(system_type: str) -> dict[str, str]:
+    probes: dict[str, typing.Callable[[], str]] = STATIC_PROBES[system_type]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures: dict[str, concurrent.futures.Future[str]] = {
+            name: executor.submit(probe) for name, probe in probes.items()
+        }
+        facts: dict[str, str] = {name: future.result() for name, future in futures.items()}
+    facts['hostname'] = platform.node()
+    facts['kernel'] = platform.release()
+    facts['boot_time'] = str(psutil.boot_time())
+    return facts
+
+
+def load_static_facts(widget: Widget, widget_container: WidgetContainer, system_type: str) -> dict[str, str]:
+    # Shell & display probes depend on the environment, a different one gets its own facts
+    key: str = '|'.join((boot_id(), system_type, os.environ.get('SHELL', ''), os.environ.get('DISPLAY', '')))
+
+    cached: dict[str, typing.Any] | None = widget.internal_data.get('static_facts')  # Kept when reloading
+    if cached is not None and cached['key'] == key:
+        return typing.cast(dict[str, str], cached['facts'])
+
+    cache_path: pathlib.Path = widget_container.ROOT_CACHE_DIR / 'sysfetch.json'
+    if not widget_container.test_env:
+        try:
+            with open(cache_path, 'r') as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            cached = None
+
+    if cached is None or cached.get('key') != key:
+        cached = {'key': key, 'facts': collect_static_facts(system_type)}
+        if not widget_container.test_env:
+            temporary_path: pathlib.Path = cache_path.with_suffix('.tmp')
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temporary_path, 'w') as file:
+                    json.dump(cached, file)
+                os.replace(temporary_path, cache_path)
+            except OSError:
+                pass  # Probed again next start
+
+    widget.internal_data['static_facts'] = cached
+    return typing.cast(dict[str, str], cached['facts'])
+
+
+def get_terminal() -> str:
+    return (os.environ.get('TERM_PROGRAM') or os.environ.get('TERM') or os.environ.get('COLORTERM') or
+            ('SSH' if os.environ.get('SSH_TTY') else 'Unknown'))
+
+
+def return_macos_info(facts: dict[str, str]) -> list[str]:
     user_name: str = os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown'
-    hostname: str = platform.node()
-    uptime_string: str = get_uptime()
-    shell: str = get_shell_info()
+    hostname: str = facts['hostname']
+    uptime_string: str = get_uptime(float(facts['boot_time']))
+    shell: str = facts['shell']
     system_lang: str = locale.getlocale()[0] or 'Unknown'
     encoding: str = locale.getpreferredencoding() or 'UTF-8'
     terminal: str | None = os.environ.get('TERM_PROGRAM')
-    terminal_font: str = run_cmd('defaults read com.apple.Terminal "Default Window Settings"') or 'N/A'
-    cpu_info: str = run_cmd('sysctl -n machdep.cpu.brand_string') or 'Unknown CPU'
+    terminal_font: str = facts['terminal_font']
+    cpu_info: str = facts['cpu']
 
-    gpu_info: str = 'Unknown'
-    try:
-        gpu_output: str | None = run_cmd('/usr/sbin/system_profiler SPDisplaysDataType')
-        if gpu_output:
-            lines: list[str] = gpu_output.splitlines()
-            for line in lines:
-                if 'Chipset Model:' in line:
-                    gpu_info = line.split('Chipset Model:')[1].strip()
-                    break
-    except Exception:
-        pass
+    # Both from one system_profiler run
+    chipset_model: str | None = first_line_containing(facts['displays'], 'Chipset Model:')
+    gpu_info: str = chipset_model.split('Chipset Model:')[1].strip() if chipset_model else 'Unknown'
+    display_info: str = first_line_containing(facts['displays'], 'Resolution') or 'Resolution: Unknown'
+    brew_packages: str = facts['packages']
 
-    display_info: str = run_cmd(
-        '/usr/sbin/system_profiler SPDisplaysDataType | grep Resolution'
-    ) or 'Resolution: Unknown'
-    brew_packages: str = run_cmd('brew list | wc -l') or 'Unknown'
-
-    os_version: str = ' '.join(v for v in platform.mac_ver() if isinstance(v, str))
-    host_version: str | None = run_cmd('sysctl -n hw.model')
+    os_version: str = facts['os_version']
+    host_version: str = facts['host']
 
     return [
         f'                    \'c.          {user_name}@{hostname}',
         f'                 ,xNMM.          -------------------- ',
         f'               .OMMMMo           OS: macOS {os_version}',
         f'               OMMM0,            Host: {host_version}',
-        f'     .;loddo:\' loolloddol;.      Kernel: {platform.release()}',
+        f'     .;loddo:\' loolloddol;.      Kernel: {facts["kernel"]}',
         f'   cKMMMMMMMMMMNWMMMMMMMMMM0:    Uptime: {uptime_string}',
         f' .KMMMMMMMMMMMMMMMMMMMMMMMWd.    Packages: {brew_packages} (brew)',
         f' XMMMMMMMMMMMMMMMMMMMMMMMX.      Shell: {shell}',
@@ -133,33 +252,24 @@ def return_macos_info() -> list[str]:
     ]
 
 
-def return_raspi_info() -> list[str]:
-    boot_time: datetime.datetime = datetime.datetime.fromtimestamp(psutil.boot_time())
-    uptime: datetime.timedelta = datetime.datetime.now() - boot_time
-    days: int = uptime.days
-    hours: int
-    remainder: int
-    hours, remainder = divmod(uptime.seconds, 3600)
-    minutes: int
-    minutes, _ = divmod(remainder, 60)
-    uptime_string: str = f'{days} days, {hours} hours, {minutes} mins'
+def return_raspi_info(facts: dict[str, str]) -> list[str]:
+    uptime_string: str = get_uptime(float(facts['boot_time']))
 
     user_name: str = os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown'
-    hostname: str = platform.node()
-    os_info: str = platform.platform().split('+')[0]
-    host_version: str = (run_cmd('cat /sys/firmware/devicetree/base/model') or 'Unknown Model').replace('\x00', '')
-    kernel: str = platform.release()
+    hostname: str = facts['hostname']
+    os_info: str = facts['os']
+    host_version: str = facts['host']
+    kernel: str = facts['kernel']
 
-    terminal: str = (os.environ.get('TERM_PROGRAM') or os.environ.get('TERM') or os.environ.get('COLORTERM') or
-                     ('SSH' if os.environ.get('SSH_TTY') else 'Unknown'))
+    terminal: str = get_terminal()
     terminal_font: str = 'N/A'
 
-    pkg_packages: str = run_cmd('dpkg --get-selections | wc -l') or 'Unknown'
+    pkg_packages: str = facts['packages']
 
-    shell: str = get_shell_info()
-    cpu_info: str = get_cpu_info()
-    gpu_info: str = (run_cmd('vcgencmd version | grep version') or get_gpu_info_linux()).strip()
-    display_info: str = run_cmd('tvservice -s | grep -o "[0-9]*x[0-9]*"') or get_display_info_linux()
+    shell: str = facts['shell']
+    cpu_info: str = facts['cpu']
+    gpu_info: str = facts['gpu']
+    display_info: str = facts['display']
     system_lang: str = locale.getlocale()[0] or 'Unknown'
     encoding: str = locale.getpreferredencoding() or 'UTF-8'
 
@@ -184,21 +294,20 @@ def return_raspi_info() -> list[str]:
     ]
 
 
-def return_linux_info() -> list[str]:
+def return_linux_info(facts: dict[str, str]) -> list[str]:
     user_name: str = os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown'
-    hostname: str = platform.node()
-    uptime_string: str = get_uptime()
-    shell: str = get_shell_info()
-    cpu_info: str = get_cpu_info()
-    gpu_info: str = get_gpu_info_linux()
-    display_info: str = get_display_info_linux()
-    terminal: str = (os.environ.get('TERM_PROGRAM') or os.environ.get('TERM') or os.environ.get('COLORTERM') or
-                     ('SSH' if os.environ.get('SSH_TTY') else 'Unknown'))
+    hostname: str = facts['hostname']
+    uptime_string: str = get_uptime(float(facts['boot_time']))
+    shell: str = facts['shell']
+    cpu_info: str = facts['cpu']
+    gpu_info: str = facts['gpu']
+    display_info: str = facts['display']
+    terminal: str = get_terminal()
     terminal_font: str = 'N/A'
     system_lang: str = locale.getlocale()[0] or 'Unknown'
     encoding: str = locale.getpreferredencoding() or 'UTF-8'
-    os_info: str = platform.platform()
-    kernel: str = platform.release()
+    os_info: str = facts['os']
+    kernel: str = facts['kernel']
 
     return [
         f'',
@@ -222,7 +331,7 @@ def return_linux_info() -> list[str]:
     ]
 
 
-def update(widget: Widget, _widget_container: WidgetContainer) -> list[str]:
+def update(widget: Widget, widget_container: WidgetContainer) -> list[str]:
     system_type: str | None = widget.config.system_type
 
     if not system_type:
@@ -230,17 +339,19 @@ def update(widget: Widget, _widget_container: WidgetContainer) -> list[str]:
             f'Configuration for system_type is missing / incorrect ("{widget.name}" widget)',
             LogLevels.ERROR.key)]))
 
-    if system_type == 'macos':
-        return return_macos_info()
-    elif system_type == 'raspbian':
-        return return_raspi_info()
-    elif system_type == 'linux':
-        return return_linux_info()
-    else:
+    if system_type not in STATIC_PROBES:
         return [
             f'Invalid system_type "{system_type}" not supported.'
         ]
 
+    facts: dict[str, str] = load_static_facts(widget, widget_container, system_type)
+    if system_type == 'macos':
+        return return_macos_info(facts)
+    elif system_type == 'raspbian':
+        return return_raspi_info(facts)
+    else:
+        return return_linux_info(facts)
+
 
 def draw(widget: Widget, widget_container: WidgetContainer, lines: list[str]) -> None:
     widget_container.draw_widget(widget)
@@ -1,5 +1,10 @@
+from __future__ import annotations  # Allows forward references in type hints
+import abc
+import bisect
 import json
 import pathlib
+import sqlite3
+import typing
 from twidgets.core.base import (
     Widget,
     WidgetContainer,
@@ -8,65 +13,296 @@ from twidgets.core.base import (
     CursesColors,
     CursesKeys,
     ConfigSpecificException,
+    JournalStore,
     LogMessages,
     LogMessage,
     LogLevels
 )
 
+Row = tuple[int, str]  # To-do id, text
 
-def add_todo(widget: Widget, title: str) -> None:
-    if 'todos' in widget.internal_data:
-        widget.internal_data['todos'][widget.internal_data['todo_count']] = f'({widget.internal_data["todo_count"]}) {title}'
-        widget.internal_data['todo_count'] += 1
-    else:
-        widget.internal_data['todos'] = {1: f'(1) {title}'}
-        widget.internal_data['todo_count'] = 2
-    save_todos(widget)  # auto-save
 
+class TodoView(abc.ABC):
+    """Rows ordered by id, as shown & navigated by the widget: all to-dos (TodoStore) or the matches of a search
+    (SearchResults). The widget only ever asks for the rows around the selected one, so drawing & navigating doesn't
+    depend on the amount of to-dos"""
+    @abc.abstractmethod
+    def remove(self, todo_id: int) -> None:
+        pass
 
-def remove_todo(widget: Widget, line: int) -> None:
-    if 'todos' in widget.internal_data:
-        keys = list(widget.internal_data['todos'].keys())
-        todo_id = keys[line]
-        widget.internal_data['todos'].pop(todo_id, None)
-    save_todos(widget)  # auto-save
+    @abc.abstractmethod
+    def rows_from(self, todo_id: int | None, limit: int) -> list[Row]:
+        """Up to limit rows with id >= todo_id (None: the first rows)"""
 
+    @abc.abstractmethod
+    def rows_before(self, todo_id: int | None, limit: int) -> list[Row]:
+        """Up to limit rows with id < todo_id (None: the last rows), in order"""
 
-def save_todos(widget: Widget) -> None:
-    # If file doesn't exist, this will create it
 
-    if widget.config.save_path:
-        file_path = pathlib.Path(widget.config.save_path).expanduser()
-        with open(file_path, 'w') as file:
-            if 'todos' in widget.internal_data:
-                json.dump(widget.internal_data['todos'], file)
-            else:
-                json.dump({}, file)
-    else:
-        raise ConfigSpecificException(LogMessages([LogMessage(
-            f'Configuration for save_path is missing / incorrect ("{widget.name}" widget)',
-            LogLevels.ERROR.key)]))
+class TodoStore(TodoView):
+    """All to-dos (see JsonTodoStore / SqliteTodoStore)"""
+    @abc.abstractmethod
+    def refresh(self) -> bool:
+        """Reload if changed outside of this store, returns whether anything changed"""
 
+    @abc.abstractmethod
+    def add(self, title: str) -> int:
+        pass
 
-def load_todos(widget: Widget) -> None:
-    # If file doesn't exist, set todos = {}
-    if widget.config.save_path:
+    @abc.abstractmethod
+    def search(self, query: str, within: list[int] | None = None) -> list[int]:
+        """Ids of the to-dos containing query (case-insensitive), optionally only out of `within`"""
+
+    def close(self) -> None:
+        pass
+
+
+class JsonTodoStore(TodoStore):
+    """The save file (a JSON object, id -> text) in memory, changes are journaled (see JournalStore)"""
+    def __init__(self, path: pathlib.Path, compact_after: int) -> None:
+        self.journal_store: JournalStore = JournalStore(path, compact_after)
+        self.ids: list[int] = []  # Sorted
+
+    def refresh(self) -> bool:
+        if not self.journal_store.refresh():
+            return False
+        self.ids = sorted(int(key) for key in self.journal_store.data.keys())
+        return True
+
+    def add(self, title: str) -> int:
+        todo_id: int = self.ids[-1] + 1 if self.ids else 1
+        self.journal_store.set(str(todo_id), f'({todo_id}) {title}')
+        self.ids.append(todo_id)
+        return todo_id
+
+    def remove(self, todo_id: int) -> None:
+        index: int = bisect.bisect_left(self.ids, todo_id)
+        if index < len(self.ids) and self.ids[index] == todo_id:
+            del self.ids[index]
+        self.journal_store.delete(str(todo_id))
+
+    def _rows(self, ids: list[int]) -> list[Row]:
+        return [(todo_id, self.journal_store.data[str(todo_id)]) for todo_id in ids]
+
+    def rows_from(self, todo_id: int | None, limit: int) -> list[Row]:
+        start: int = 0 if todo_id is None else bisect.bisect_left(self.ids, todo_id)
+        return self._rows(self.ids[start:start + limit])
+
+    def rows_before(self, todo_id: int | None, limit: int) -> list[Row]:
+        end: int = len(self.ids) if todo_id is None else bisect.bisect_left(self.ids, todo_id)
+        return self._rows(self.ids[max(end - limit, 0):end])
+
+    def search(self, query: str, within: list[int] | None = None) -> list[int]:
+        data: dict[str, typing.Any] = self.journal_store.data
+        return [
+            todo_id for todo_id in (self.ids if within is None else within)
+            if query in str(data.get(str(todo_id), '')).lower()
+        ]
+
+
+class SqliteTodoStore(TodoStore):
+    """To-dos in an SQLite database (WAL mode). The id is the primary key (the table's B-tree), so adding, removing
+    and finding the rows around an id is O(log n). A new database imports the JSON save file once (recorded in its
+    user_version, so removing every to-do doesn't bring the imported ones back)."""
+    IMPORTED_VERSION: int = 1  # PRAGMA user_version once the JSON save file was imported
+
+    def __init__(self, path: pathlib.Path, import_path: pathlib.Path | None = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Widget callbacks may run on other threads (e.g. after a reload), access is never concurrent
+        self.connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')  # Durable at checkpoints, never corrupt
+        # SQLite's lower() only folds ASCII, searches fold like JsonTodoStore (str.lower)
+        self.connection.create_function('py_lower', 1, str.lower, deterministic=True)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS todos (id INTEGER PRIMARY KEY, title TEXT NOT NULL)')
+        self._data_version: int | None = None
+
+        if import_path is not None and \
+                self.connection.execute('PRAGMA user_version').fetchone()[0] < self.IMPORTED_VERSION:
+            self._import(import_path)
+
+    def _import(self, import_path: pathlib.Path) -> None:
+        rows: list[Row]
         try:
-            file_path = pathlib.Path(widget.config.save_path).expanduser()
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-            data = {int(k): v for k, v in data.items()}
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
-    else:
+            with open(import_path, 'r') as file:
+                data: typing.Any = json.load(file)
+            rows = [(int(key), str(value)) for key, value in data.items()]
+        except FileNotFoundError:
+            rows = []  # Nothing to import
+        except (OSError, ValueError, AttributeError):
+            return  # Unreadable for now, tried again next time
+
+        try:
+            self.connection.execute('BEGIN IMMEDIATE')
+            # Databases created before imports were recorded may have been imported into already
+            if self.connection.execute('SELECT 1 FROM todos LIMIT 1').fetchone() is None:
+                self.connection.executemany('INSERT INTO todos (id, title) VALUES (?, ?)', rows)
+            self.connection.execute(f'PRAGMA user_version = {self.IMPORTED_VERSION}')
+            self.connection.execute('COMMIT')
+        except sqlite3.Error:
+            if self.connection.in_transaction:
+                self.connection.execute('ROLLBACK')
+
+    def refresh(self) -> bool:
+        # Changes whenever another connection commits
+        data_version: int = self.connection.execute('PRAGMA data_version').fetchone()[0]
+        changed: bool = data_version != self._data_version
+        self._data_version = data_version
+        return changed
+
+    def add(self, title: str) -> int:
+        todo_id: int = (self.connection.execute('SELECT MAX(id) FROM todos').fetchone()[0] or 0) + 1
+        self.connection.execute('INSERT INTO todos (id, title) VALUES (?, ?)', (todo_id, f'({todo_id}) {title}'))
+        return todo_id
+
+    def remove(self, todo_id: int) -> None:
+        self.connection.execute('DELETE FROM todos WHERE id = ?', (todo_id,))
+
+    def rows_from(self, todo_id: int | None, limit: int) -> list[Row]:
+        return self.connection.execute(
+            'SELECT id, title FROM todos WHERE id >= ? ORDER BY id LIMIT ?',
+            (todo_id if todo_id is not None else -2 ** 63, limit)
+        ).fetchall()
+
+    def rows_before(self, todo_id: int | None, limit: int) -> list[Row]:
+        rows: list[Row] = self.connection.execute(
+            'SELECT id, title FROM todos WHERE id < ? ORDER BY id DESC LIMIT ?',
+            (todo_id if todo_id is not None else 2 ** 63 - 1, limit)
+        ).fetchall()
+        rows.reverse()
+        return rows
+
+    def search(self, query: str, within: list[int] | None = None) -> list[int]:
+        if within is None or len(within) > 2000:  # Faster to scan the whole table than to look up this many ids
+            wanted: set[int] | None = set(within) if within is not None else None
+            return [row[0] for row in self.connection.execute(
+                'SELECT id FROM todos WHERE instr(py_lower(title), ?) > 0 ORDER BY id', (query,)
+            ) if wanted is None or row[0] in wanted]
+        matches: list[int] = []
+        for start in range(0, len(within), 500):  # Below SQLite's parameter limit
+            chunk: list[int] = within[start:start + 500]
+            matches.extend(row[0] for row in self.connection.execute(
+                f'SELECT id FROM todos WHERE id IN ({",".join("?" * len(chunk))}) AND instr(py_lower(title), ?) > 0 '
+                f'ORDER BY id', (*chunk, query)
+            ))
+        return matches
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class SearchResults(TodoView):
+    """Matches of a search, navigated like the store itself"""
+    def __init__(self, store: TodoStore, query: str, ids: list[int]) -> None:
+        self.store: TodoStore = store
+        self.query: str = query
+        self.ids: list[int] = ids  # Sorted
+
+    @staticmethod
+    def find(store: TodoStore, query: str, previous: SearchResults | None = None) -> SearchResults:
+        """Only the previous matches are searched again if query extends the previous query (incremental search)"""
+        query = query.lower()
+        within: list[int] | None = previous.ids if previous is not None and query.startswith(previous.query) else None
+        return SearchResults(store, query, store.search(query, within))
+
+    def _rows(self, ids: list[int]) -> list[Row]:
+        # Only the visible matches are looked up, one O(log n) lookup each
+        return [row for todo_id in ids for row in self.store.rows_from(todo_id, 1) if row[0] == todo_id]
+
+    def rows_from(self, todo_id: int | None, limit: int) -> list[Row]:
+        start: int = 0 if todo_id is None else bisect.bisect_left(self.ids, todo_id)
+        return self._rows(self.ids[start:start + limit])
+
+    def rows_before(self, todo_id: int | None, limit: int) -> list[Row]:
+        end: int = len(self.ids) if todo_id is None else bisect.bisect_left(self.ids, todo_id)
+        return self._rows(self.ids[max(end - limit, 0):end])
+
+    def remove(self, todo_id: int) -> None:
+        index: int = bisect.bisect_left(self.ids, todo_id)
+        if index < len(self.ids) and self.ids[index] == todo_id:
+            del self.ids[index]
+
+
+def todo_store(widget: Widget) -> TodoStore:
+    if not widget.config.save_path:
         raise ConfigSpecificException(LogMessages([LogMessage(
             f'Configuration for save_path is missing / incorrect ("{widget.name}" widget)',
             LogLevels.ERROR.key)]))
+    save_path: pathlib.Path = pathlib.Path(widget.config.save_path).expanduser()
+    backend: str = widget.config.backend or 'json'
+
+    store_key: tuple[str, str, str | None] = (backend, str(save_path), widget.config.sqlite_path)
+    store: TodoStore | None = widget.internal_data.get('store')
+    if store is not None and widget.internal_data.get('store_key') == store_key:
+        return store  # Kept when reloading
+    if store is not None:
+        store.close()
+
+    if backend == 'sqlite':
+        if not widget.config.sqlite_path:
+            raise ConfigSpecificException(LogMessages([LogMessage(
+                f'Configuration for sqlite_path is missing / incorrect ("{widget.name}" widget)',
+                LogLevels.ERROR.key)]))
+        store = SqliteTodoStore(pathlib.Path(widget.config.sqlite_path).expanduser(), import_path=save_path)
+    elif backend == 'json':
+        store = JsonTodoStore(save_path, widget.config.journal_compact_after or 1000)
+    else:
+        raise ConfigSpecificException(LogMessages([LogMessage(
+            f'Configuration for backend is missing / incorrect ("{widget.name}" widget)',
+            LogLevels.ERROR.key)]))
+
+    widget.internal_data['store'] = store
+    widget.internal_data['store_key'] = store_key
+    widget.internal_data.pop('search', None)
+    return store
+
+
+def load_todos(widget: Widget) -> None:
+    # Only re-reads the to-dos if they changed outside of this widget
+    store: TodoStore = todo_store(widget)
+    if store.refresh():
+        search: SearchResults | None = widget.internal_data.get('search')
+        if search is not None:
+            widget.internal_data['search'] = SearchResults.find(store, search.query)
 
-    data = {int(k): v for k, v in data.items()}
 
-    widget.internal_data['todos'] = data
-    widget.internal_data['todo_count'] = max(data.keys(), default=0) + 1
+def todo_view(widget: Widget) -> TodoView:
+    """The store, or the search results if searching"""
+    search: SearchResults | None = widget.internal_data.get('search')
+    return search if search is not None else todo_store(widget)
+
+
+def add_todo(widget: Widget, title: str) -> None:
+    widget.internal_data['selected_id'] = todo_store(widget).add(title)  # auto-save
+    widget.internal_data.pop('search', None)  # Show the new to-do
+
+
+def remove_todo(widget: Widget, todo_id: int) -> None:
+    view: TodoView = todo_view(widget)
+    # Select the next one (or the last one, if the last to-do was deleted)
+    following: list[Row] = view.rows_from(todo_id + 1, 1) or view.rows_before(todo_id, 1)
+    widget.internal_data['selected_id'] = following[0][0] if following else None
+
+    todo_store(widget).remove(todo_id)  # auto-save
+    if view is not todo_store(widget):
+        view.remove(todo_id)
+
+
+def search_todos(widget: Widget, widget_container: WidgetContainer) -> None:
+    store: TodoStore = todo_store(widget)
+
+    def on_change(query: str) -> None:
+        # Results are shown while typing, every keystroke narrows the previous results
+        if query.strip():
+            widget.internal_data['search'] = SearchResults.find(store, query, widget.internal_data.get('search'))
+        else:
+            widget.internal_data.pop('search', None)
+        widget.internal_data['selected_id'] = None
+        draw(widget, widget_container)
+
+    query: str = widget.prompt_user_input('Search: ', on_change=on_change)
+    if not query.strip():
+        widget.internal_data.pop('search', None)  # Cancelled / cleared
 
 
 def mouse_click_action(widget: Widget, _mx: int, my: int, _b_state: int, widget_container: WidgetContainer) -> None:
@@ -75,59 +311,44 @@ def mouse_click_action(widget: Widget, _mx: int, my: int, _b_state: int, widget_
     if widget.help_mode:
         return
 
-    todos = list(widget.internal_data.get('todos', {}).values())
-    if not todos or widget_container.ui_state.highlighted != widget:
-        widget.internal_data['selected_line'] = None
+    if widget_container.ui_state.highlighted != widget:
+        widget.internal_data['selected_id'] = None
         return
 
+    # The rows shown by the last draw
+    visible_ids: list[int] = widget.internal_data.get('visible_ids', [])
+
     # Click relative to widget border
     local_y: int = my - widget.dimensions.current_y - 1  # -1 for top border
-    if 0 <= local_y < min(len(todos), widget.dimensions.current_height - 2):
-        # Compute which part of todos is currently visible
-        abs_index = widget.internal_data.get('selected_line', 0) or 0
-        start = max(abs_index - (widget.dimensions.current_height - 2)//2, 0)
-        if start + (widget.dimensions.current_height - 2) > len(todos):
-            start = max(len(todos) - (widget.dimensions.current_height - 2), 0)
-
-        # Absolute index of clicked line
-        clicked_index = start + local_y
-        if clicked_index >= len(todos):
-            clicked_index = len(todos) - 1
-
-        widget.internal_data['selected_line'] = clicked_index
+    if 0 <= local_y < len(visible_ids):
+        widget.internal_data['selected_id'] = visible_ids[local_y]
     else:
-        widget.internal_data['selected_line'] = None
+        widget.internal_data['selected_id'] = None
 
 
-def keyboard_press_action(widget: Widget, key: int, _widget_container: WidgetContainer) -> None:
+def keyboard_press_action(widget: Widget, key: int, widget_container: WidgetContainer) -> None:
     load_todos(widget)
 
     if widget.help_mode:
         return
 
-    if 'todos' not in widget.internal_data:
-        return
-
-    len_todos = len(widget.internal_data['todos'])
-    selected = widget.internal_data.get('selected_line', 0)
+    view: TodoView = todo_view(widget)
+    selected: int | None = widget.internal_data.get('selected_id')
+    selected_row: list[Row] = view.rows_from(selected, 1) if selected is not None else []
+    if not selected_row or selected_row[0][0] != selected:
+        selected = None  # Deleted meanwhile
 
-    if not isinstance(selected, int):
-        selected = 0
-
-    # Navigation
+    # Navigation (wraps around)
+    following: list[Row]
     if key == CursesKeys.UP:
-        selected -= 1
+        following = (view.rows_before(selected, 1) if selected is not None else []) or view.rows_before(None, 1)
     elif key == CursesKeys.DOWN:
-        selected += 1
-
-    # Wrap around
-    if selected < 0:
-        selected = len_todos - 1
-
-    if selected > (len_todos - 1):  # If you delete the last to-do, this will wrap around to 0
-        selected = 0
+        following = (view.rows_from(selected + 1, 1) if selected is not None else []) or view.rows_from(None, 1)
+    else:
+        following = selected_row if selected is not None else view.rows_from(None, 1)
+    selected = following[0][0] if following else None
 
-    widget.internal_data['selected_line'] = selected
+    widget.internal_data['selected_id'] = selected
 
     # Add new to_do
     if key in (CursesKeys.ENTER, 10, 13):
@@ -137,44 +358,39 @@ def keyboard_press_action(widget: Widget, key: int, _widget_container: WidgetCon
 
     # Delete to_do
     elif key in (CursesKeys.BACKSPACE, 127, 8):  # Backspace
-        if len_todos > 0:
+        if selected is not None:
             confirm = widget.prompt_user_input('Confirm deletion (y): ')
             if confirm.lower().strip() in ['y']:
-                remove_todo(widget, widget.internal_data['selected_line'])
+                remove_todo(widget, selected)
 
+    # Search
+    elif key == ord('/'):
+        search_todos(widget, widget_container)
 
-def render_todos(todos: list[str], highlighted_line: int | None, max_render: int) -> tuple[list[str], int | None]:
-    # Everything fits, no slicing needed
-    if len(todos) <= max_render:
-        return todos.copy(), highlighted_line
-
-    if highlighted_line is None:
-        # No highlight -> show first items
-        start = 0
-    else:
-        radius = max_render // 2
-        # Compute slice around highlighted line
-        start = max(highlighted_line - radius, 0)
-
-        # Make sure we don't go past the list
-        if start + max_render > len(todos):
-            start = max(len(todos) - max_render, 0)
 
-    end: int = start + max_render
-    visible_todos: list[str] = todos[start:end]
+def render_todos(view: TodoView, highlighted_id: int | None, max_render: int) -> tuple[list[Row], int | None, bool]:
+    """Visible rows around the highlighted to-do, index of the highlighted one, whether there are more below.
 
-    if highlighted_line is None:
-        rel_index: int | None = None
+    Only the visible rows are looked up (O(log n + max_render)), the amount of to-dos is never needed.
+    """
+    if highlighted_id is None:
+        # No highlight -> show first items
+        rows: list[Row] = view.rows_from(None, max_render + 1)
     else:
-        rel_index = highlighted_line - start
+        # Rows around the highlighted line (+ 1 to know if there are more)
+        after: list[Row] = view.rows_from(highlighted_id, max_render + 1)
+        # Make sure we don't go past the end of the list
+        before: list[Row] = view.rows_before(highlighted_id, max(max_render // 2, max_render - len(after)))
+        rows = before + after
 
-    # Ellipsis if needed
-    if end < len(todos):
-        visible_todos.append('...')
-        if rel_index is not None and rel_index >= max_render:
-            rel_index = max_render - 1  # highlight the last visible line
+    more: bool = len(rows) > max_render
+    rows = rows[:max_render]
 
-    return visible_todos, rel_index
+    rel_index: int | None = None
+    for i, (todo_id, _title) in enumerate(rows):
+        if todo_id == highlighted_id:
+            rel_index = i
+    return rows, rel_index, more
 
 
 def init(widget: Widget, _widget_container: WidgetContainer) -> None:
@@ -185,15 +401,22 @@ def draw(widget: Widget, widget_container: WidgetContainer) -> None:
     widget_container.draw_widget(widget)
 
     if widget_container.ui_state.highlighted != widget:
-        widget.internal_data['selected_line'] = None
+        widget.internal_data['selected_id'] = None
 
-    todos, rel_index = render_todos(
-        list(widget.internal_data.get('todos', {}).values()),
-        widget.internal_data.get('selected_line'),
+    search: SearchResults | None = widget.internal_data.get('search')
+    if search is not None:
+        widget.title = f'{widget.config.title}[/{search.query}: {len(search.ids)} found] '
+    else:
+        widget.title = widget.config.title
+
+    rows, rel_index, more = render_todos(
+        todo_view(widget),
+        widget.internal_data.get('selected_id'),
         widget.config.max_rendering if widget.config.max_rendering else 3
     )
+    widget.internal_data['visible_ids'] = [todo_id for todo_id, _title in rows]
 
-    for i, todo in enumerate(todos):
+    for i, (_todo_id, todo) in enumerate(rows):
         if rel_index is not None and i == rel_index:
             widget.safe_addstr(
                 1 + i, 1, todo[:widget.dimensions.current_width - 2],
@@ -201,6 +424,10 @@ def draw(widget: Widget, widget_container: WidgetContainer) -> None:
         else:
             widget.safe_addstr(1 + i, 1, todo[:widget.dimensions.current_width - 2])
 
+    # Ellipsis if needed
+    if more:
+        widget.safe_addstr(1 + len(rows), 1, '...')
+
 
 def draw_help(widget: Widget, widget_container: WidgetContainer) -> None:
     widget_container.draw_widget(widget)
@@ -212,6 +439,7 @@ def draw_help(widget: Widget, widget_container: WidgetContainer) -> None:
             'Keybinds: ',
             'Enter - New Todo',
             'Backspace - Delete Todo',
+            '/ - Search (empty to show all)',
             'Arrow Keys - Navigation',
             '',
             'Displays todos.'
@@ -22,7 +22,7 @@ def update(_widget: Widget, widget_container: WidgetContainer) -> list[str]:
 
     url: str = f'https://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units={units}'
     try:
-        response = requests.get(url, timeout=5)
+        response = widget_container.http.get(url)
         data = response.json()
     except requests.exceptions.RequestException:
         return [
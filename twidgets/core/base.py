@@ -1,4 +1,5 @@
 from __future__ import annotations  # Allows forward references in type hints
+import abc
 import enum
 import pathlib
 import yaml
@@ -6,10 +7,25 @@ import yaml.parser
 import yaml.scanner
 import dotenv
 import os
+import selectors
+import signal
+import shutil
 import curses
 import _curses
 import typing
 import collections
+import copy
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import heapq
+import inspect
+import itertools
+import json
+import pickle
+import queue
+import random
 import threading
 import time as time_module
 import types
@@ -17,8 +33,12 @@ import importlib
 import importlib.util
 import sys
 import traceback
+import unicodedata
 import datetime
 
+if typing.TYPE_CHECKING:
+    from twidgets.core.http import HttpClient  # Imported on first use (see WidgetContainer.http)
+
 
 # region Widget & essentials
 
@@ -41,6 +61,49 @@ class Dimensions:
                 (self.current_x + self.current_width) < min_width
         )
 
+    def overlaps(self, other: Dimensions) -> bool:
+        return (
+                self.current_y < other.current_y + other.current_height and
+                other.current_y < self.current_y + self.current_height and
+                self.current_x < other.current_x + other.current_width and
+                other.current_x < self.current_x + self.current_width
+        )
+
+    def contains(self, y: int, x: int) -> bool:
+        return (
+                self.current_y <= y < self.current_y + self.current_height and
+                self.current_x <= x < self.current_x + self.current_width
+        )
+
+    def subtract(self, other: Dimensions) -> list[Dimensions]:
+        """Parts of this rectangle not covered by other (at most 4: above, below, left and right of it)"""
+        if not self.overlaps(other):
+            return [self]
+
+        top: int = max(self.current_y, other.current_y)
+        bottom: int = min(self.current_y + self.current_height, other.current_y + other.current_height)
+        left: int = max(self.current_x, other.current_x)
+        right: int = min(self.current_x + self.current_width, other.current_x + other.current_width)
+        pieces: list[Dimensions] = [
+            Dimensions(top - self.current_y, self.current_width, self.current_y, self.current_x, self.z_index),
+            Dimensions(
+                self.current_y + self.current_height - bottom, self.current_width, bottom, self.current_x, self.z_index
+            ),
+            Dimensions(bottom - top, left - self.current_x, top, self.current_x, self.z_index),
+            Dimensions(bottom - top, self.current_x + self.current_width - right, top, right, self.z_index),
+        ]
+        return [piece for piece in pieces if piece.current_height > 0 and piece.current_width > 0]
+
+
+class WidgetSnapshot(typing.NamedTuple):
+    """Everything the renderer needs from an update, published as a whole (see Widget.publish)"""
+    lines: tuple[str, ...]  # Result of the last successful update
+    error: LogMessages | str | None  # Error of the last update, None if it succeeded
+    retry_status: str  # See CircuitBreaker.status()
+    generation: int  # Increases with every published snapshot
+    timestamp: float  # time.time() of publishing
+    stale: bool = False  # Restored from the last run (see SnapshotStore), until the first update finishes
+
 
 class Widget:
     DrawFunction = typing.Callable[
@@ -53,6 +116,7 @@ class Widget:
         ['Widget', 'WidgetContainer'], None
     ]
     UpdateFunction = typing.Callable[['Widget', 'WidgetContainer'], list[str]]
+    AsyncUpdateFunction = typing.Callable[['Widget', 'WidgetContainer'], typing.Awaitable[list[str]]]
     MouseClickUpdateFunction = typing.Callable[['Widget', int, int, int, 'WidgetContainer'], None]
     KeyBoardUpdateFunction = typing.Callable[['Widget', int, 'WidgetContainer'], None]
     InitializeFunction = typing.Callable[['Widget', 'WidgetContainer'], None]
@@ -65,12 +129,14 @@ class Widget:
             draw_func: DrawFunction | DrawFunctionWithDrawData,
             interval: int | float | None,
             dimensions: Dimensions,
-            stdscr: CursesWindowType,
-            update_func: UpdateFunction | None = None,
+            stdscr: CursesWindowType | Compositor,
+            update_func: UpdateFunction | AsyncUpdateFunction | None = None,
             mouse_click_func: MouseClickUpdateFunction | None = None,
             keyboard_func: KeyBoardUpdateFunction | None = None,
             init_func: InitializeFunction | None = None,
-            help_func: HelpFunction | None = None
+            help_func: HelpFunction | None = None,
+            redraw_interval: int | float | None = None,
+            persistent_keys: list[str] | None = None
     ) -> None:
         self.name = name
         self.title = title
@@ -82,18 +148,29 @@ class Widget:
         self._draw_func = draw_func
         self._init_func = init_func
         self._help_func = help_func
-        self.last_updated: int | float | None = 0
+        self.last_updated: int | float | None = 0  # time.monotonic() of the last successful update
         self.dimensions = dimensions
         try:
-            self.win: CursesWindowType | None = stdscr.subwin(*self.dimensions.formatted())
+            self.win: CursesWindowType | VirtualWindow | None = stdscr.subwin(*self.dimensions.formatted())
         except CursesError:
             self.win = None
         self.help_mode: bool = False
-        self.draw_data: list[str] = []  # data used for drawing
-        self.error_data: dict[str, LogMessages | str] = {}  # data used for holding errors
+        # Data used for drawing / holding errors; Only replaced as a whole, so it can be read without a lock
+        self.snapshot: WidgetSnapshot = WidgetSnapshot((), None, '', 0, 0.0)
         self.internal_data: dict[typing.Any, typing.Any] = {}  # internal data stored by widgets
+        self.persistent_keys: list[str] = persistent_keys or []  # internal_data kept for the next run (picklable)
+        self.module: types.ModuleType | None = None  # Module the widget was built from (set by the WidgetLoader)
+
+        # Redraw tracking (the main loop skips widgets that are not dirty)
+        self.redraw_interval: int | float | None = redraw_interval  # Time-based redraws, e.g. every second
+        self.dirty: bool = True
+        self.next_redraw: float | None = None
+        self.drawn_generation: int = 0  # Generation of the last drawn snapshot
+        # Parts not covered by widgets above (see WidgetContainer.update_visible_regions), empty if fully covered
+        self.visible_regions: list[Dimensions] = [dimensions]
 
-        self.lock: threading.Lock = threading.Lock()
+        self.circuit_breaker: CircuitBreaker = CircuitBreaker()  # Backoff state of failing updates
+        self.lock: threading.Lock = threading.Lock()  # Free for widget functions, snapshots don't need it
 
     def noutrefresh(self) -> None:
         if not self.win:
@@ -123,10 +200,70 @@ class Widget:
         except Exception:
             raise  # Re-Raise, catch in main.py
 
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    def mark_clean(self, now: float, drawn_snapshot: WidgetSnapshot | None = None) -> None:
+        self.dirty = False
+        self.drawn_generation = (drawn_snapshot or self.snapshot).generation
+        if self.redraw_interval:
+            # Align to the next interval boundary (e.g. the next full second for a clock)
+            self.next_redraw = (now // self.redraw_interval + 1) * self.redraw_interval
+
+    def needs_redraw(self, now: float) -> bool:
+        if self.dirty or self.snapshot.generation != self.drawn_generation:
+            return True
+        return self.next_redraw is not None and now >= self.next_redraw
+
+    def hidden(self) -> bool:
+        return not self.visible_regions
+
+    def visible_at(self, y: int, x: int) -> bool:
+        """Whether the cell (relative to the widget, like win.addstr) is not covered by another widget"""
+        absolute_y: int = self.dimensions.current_y + y
+        absolute_x: int = self.dimensions.current_x + x
+        return any(region.contains(absolute_y, absolute_x) for region in self.visible_regions)
+
+    def publish(
+            self,
+            lines: typing.Iterable[str],
+            error: LogMessages | str | None = None,
+            retry_status: str = ''
+    ) -> None:
+        """Swap in a new snapshot with a single reference assignment (called by the scheduler only)"""
+        self.snapshot = WidgetSnapshot(
+            tuple(lines), error, retry_status, self.snapshot.generation + 1, time_module.time()
+        )
+
+    @property
+    def draw_data(self) -> list[str]:
+        return list(self.snapshot.lines)
+
+    @draw_data.setter
+    def draw_data(self, lines: list[str]) -> None:
+        self.publish(lines, self.snapshot.error, self.snapshot.retry_status)
+
+    @property
+    def error_data(self) -> dict[str, LogMessages | str]:
+        if self.snapshot.error is None:
+            return {}
+        return {'__error__': self.snapshot.error, '__retry__': self.snapshot.retry_status}
+
+    @error_data.setter
+    def error_data(self, error_data: dict[str, LogMessages | str]) -> None:
+        retry_status: LogMessages | str = error_data.get('__retry__', '')
+        self.publish(
+            self.snapshot.lines, error_data.get('__error__'), retry_status if isinstance(retry_status, str) else ''
+        )
+
     def disable_help_mode(self) -> None:
+        if self.help_mode:
+            self.mark_dirty()
         self.help_mode = False
 
     def enable_help_mode(self) -> None:
+        if not self.help_mode:
+            self.mark_dirty()
         self.help_mode = True
 
     def toggle_help_mode(self) -> None:
@@ -135,9 +272,19 @@ class Widget:
         else:
             self.enable_help_mode()
 
+    def has_async_update(self) -> bool:
+        return inspect.iscoroutinefunction(self._update_func)
+
     def update(self, widget_container: WidgetContainer) -> list[str]:
         if self._update_func and self.config.enabled:
-            return self._update_func(self, widget_container)
+            if self.has_async_update():
+                return asyncio.run(self.update_async(widget_container))  # Outside the scheduler's event loop
+            return typing.cast(Widget.UpdateFunction, self._update_func)(self, widget_container)
+        raise WidgetNoUpdateFunction()
+
+    async def update_async(self, widget_container: WidgetContainer) -> list[str]:
+        if self._update_func and self.config.enabled and self.has_async_update():
+            return await typing.cast(Widget.AsyncUpdateFunction, self._update_func)(self, widget_container)
         raise WidgetNoUpdateFunction()
 
     def updatable(self) -> bool:
@@ -148,16 +295,19 @@ class Widget:
     def mouse_action(self, mx: int, my: int, b_state: int, widget_container: WidgetContainer) -> None:
         if self._mouse_click_func:
             self._mouse_click_func(self, mx, my, b_state, widget_container)
+            self.mark_dirty()
 
     def keyboard_action(self, key: int, widget_container: WidgetContainer) -> None:
         if self._keyboard_func:
             self._keyboard_func(self, key, widget_container)
+            self.mark_dirty()
 
     def reinit_window(self, widget_container: WidgetContainer) -> None:
         try:
-            self.win = widget_container.stdscr.subwin(*self.dimensions.formatted())
+            self.win = widget_container.compositor.subwin(*self.dimensions.formatted())
         except CursesError:
             self.win = None
+        self.mark_dirty()
 
     def draw_colored_border(self, color_pair: int, test_env: bool) -> None:
         if not self.win:
@@ -212,7 +362,8 @@ class Widget:
             if i < self.dimensions.current_height - 2:  # Keep inside border
                 self.win.addstr(1 + i, 1, line[:self.dimensions.current_width - 2])
 
-    def prompt_user_input(self, prompt: str) -> str:
+    def prompt_user_input(self, prompt: str, on_change: typing.Callable[[str], None] | None = None) -> str:
+        """Read a line of input at the bottom of the widget; on_change is called with the input after every edit"""
         if not self.win:
             return ''
 
@@ -236,7 +387,9 @@ class Widget:
         input_str: str = ''
         cursor_pos: int = 0
 
-        def redraw_input() -> None:
+        def redraw_input(changed: bool = True) -> None:
+            if changed and on_change is not None:
+                on_change(input_str)  # May redraw the widget, the input line is drawn on top
             win.move(input_y, left_margin)
             # Clear only the safe inner region (never touch border)
             win.addstr(' ' * usable_width)
@@ -248,7 +401,7 @@ class Widget:
             win.refresh()
 
         try:
-            redraw_input()
+            redraw_input(changed=False)
         except CursesError:
             return ''
 
@@ -317,6 +470,7 @@ class Config:
             y: int | None = None,
             x: int | None = None,
             z: int | None = None,
+            update_timeout: int | float | None = None,
             **kwargs: typing.Any  # Used for extra arguments, e.g. 'time_format' in clock_widget
     ) -> None:
         required_fields: list[tuple[str, object, type | tuple[type, ...]]] = [
@@ -359,6 +513,17 @@ class Config:
         self.interval: int | float | None = interval
         if interval == 0:
             self.interval = None
+        self.update_timeout: int | float | None = None  # Seconds, after which a running update is abandoned
+        if update_timeout is not None:
+            if isinstance(update_timeout, (int, float)) and not isinstance(update_timeout, bool) \
+                    and update_timeout > 0:
+                self.update_timeout = update_timeout
+            else:
+                widget_container.log_messages.add_log_message(LogMessage(
+                    f'Configuration for update_timeout is incorrect ("{file_name}" widget, updates won\'t time out)',
+                    LogLevels.WARNING.key,
+                    error_found_by
+                ))
         self.last_updated: int = 0
         self.dimensions: Dimensions = Dimensions(
             height=typing.cast(int, height),
@@ -372,6 +537,12 @@ class Config:
             if self.emoji_title is not None:
                 self.title = self.emoji_title
 
+        # Changes whenever the configuration changes (see SnapshotStore)
+        self.config_hash: str = hashlib.sha256(repr(sorted({
+            'name': name, 'title': self.title, 'enabled': enabled, 'interval': interval, 'height': height,
+            'width': width, 'y': y, 'x': x, 'z': z, **kwargs
+        }.items())).encode()).hexdigest()
+
         for key, value in kwargs.items():
             if test_env:
                 if key.startswith('test_env_'):
@@ -421,28 +592,35 @@ class FloatingWidget:
             title: str,
             dimensions: Dimensions,
             description: list[str],
-            stdscr: CursesWindowType
+            stdscr: CursesWindowType | Compositor
     ) -> None:
         self.name: str = name
         self.title: str = title
         self._dimensions: Dimensions = dimensions
         self._description: list[str] = description
+        self.dirty: bool = True
         try:
-            self.win: CursesWindowType | None = stdscr.subwin(*self._dimensions.formatted())
+            self.win: CursesWindowType | VirtualWindow | None = stdscr.subwin(*self._dimensions.formatted())
         except CursesError:
             self.win = None
 
+    @property
+    def dimensions(self) -> Dimensions:
+        return self._dimensions
+
     def noutrefresh(self) -> None:
         if self.win:
             self.win.noutrefresh()
 
     def reinit_window(self, widget_container: WidgetContainer) -> None:
         try:
-            self.win = widget_container.stdscr.subwin(*self._dimensions.formatted())
+            self.win = widget_container.compositor.subwin(*self._dimensions.formatted())
         except CursesError:
             self.win = None
+        self.dirty = True
 
     def draw(self, widget_container: WidgetContainer) -> None:
+        self.dirty = False
         if not self.win:
             return
 
@@ -481,7 +659,7 @@ class WarningWidget(FloatingWidget):
             warning_error: Exception,  # Instance, not a class
             description: list[str],
             dimensions: Dimensions,
-            stdscr: CursesWindowType
+            stdscr: CursesWindowType | Compositor
     ) -> None:
         super().__init__(name, title, dimensions, description, stdscr)
         self.name: str = name
@@ -490,6 +668,384 @@ class WarningWidget(FloatingWidget):
 
 # endregion WarningWidget
 
+# region Compositor
+
+def cell_width(char: str) -> int:
+    """Terminal cells taken by a character (east asian wide / fullwidth characters take 2)"""
+    if char < '\u1100':  # Fast path, no wide characters before U+1100
+        return 1
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+class VirtualWindow:
+    """In-memory replacement for a curses subwin: widgets draw into its cell grid, the Compositor puts it on screen.
+
+    Supports the curses window methods widgets use. Every cell holds a character and curses attributes; the second
+    cell of a wide character holds WIDE_CHAR_PLACEHOLDER. Like in curses, border() writes VT100 line drawing
+    characters with A_ALTCHARSET.
+    """
+    WIDE_CHAR_PLACEHOLDER: str = ''
+
+    def __init__(self, compositor: Compositor, height: int, width: int, y: int, x: int) -> None:
+        self._compositor: Compositor = compositor
+        self.height: int = height
+        self.width: int = width
+        self.y: int = y
+        self.x: int = x
+        self.chars: list[list[str]] = [[' '] * width for _ in range(height)]
+        self.attrs: list[list[int]] = [[0] * width for _ in range(height)]
+        self.touched: bool = True  # Changed since the compositor last presented it
+        self._attr: int = 0  # See attron / attroff
+        self._cursor_y: int = 0
+        self._cursor_x: int = 0
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    def getbegyx(self) -> tuple[int, int]:
+        return self.y, self.x
+
+    def getyx(self) -> tuple[int, int]:
+        return self._cursor_y, self._cursor_x
+
+    def move(self, y: int, x: int) -> None:
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise CursesError('move() returned ERR')
+        self._cursor_y, self._cursor_x = y, x
+
+    def attron(self, attr: int) -> None:
+        self._attr |= attr
+
+    def attroff(self, attr: int) -> None:
+        self._attr &= ~attr
+
+    def attrset(self, attr: int) -> None:
+        self._attr = attr
+
+    def erase(self) -> None:
+        for row in range(self.height):
+            self.chars[row] = [' '] * self.width
+            self.attrs[row] = [0] * self.width
+        self._cursor_y, self._cursor_x = 0, 0
+        self.touched = True
+
+    def clear(self) -> None:
+        self.erase()
+
+    def clrtoeol(self) -> None:
+        row: int = self._cursor_y
+        self.chars[row][self._cursor_x:] = [' '] * (self.width - self._cursor_x)
+        self.attrs[row][self._cursor_x:] = [0] * (self.width - self._cursor_x)
+        self.touched = True
+
+    def addstr(self, *args: typing.Any) -> None:
+        """addstr(text[, attr]) or addstr(y, x, text[, attr]), like curses"""
+        if isinstance(args[0], str):
+            self._write(self._cursor_y, self._cursor_x, args[0], args[1] if len(args) > 1 else 0)
+        else:
+            self._write(args[0], args[1], args[2], args[3] if len(args) > 3 else 0)
+
+    def addch(self, *args: typing.Any) -> None:
+        """addch(ch[, attr]) or addch(y, x, ch[, attr]), ch may be a str or a curses chtype (e.g. curses.ACS_HLINE)"""
+        if len(args) > 2:
+            y, x, char, attr = args[0], args[1], args[2], (args[3] if len(args) > 3 else 0)
+        else:
+            y, x, char, attr = self._cursor_y, self._cursor_x, args[0], (args[1] if len(args) > 1 else 0)
+        if isinstance(char, int):
+            attr |= char & curses.A_ATTRIBUTES
+            char = chr(char & curses.A_CHARTEXT)
+        self._write(y, x, char, attr)
+
+    def border(self) -> None:
+        # Same characters as curses' default border (ACS_VLINE, ACS_HLINE, ACS_ULCORNER, ...)
+        attr: int = self._attr | curses.A_ALTCHARSET
+        if self.height < 2 or self.width < 2:
+            return
+        for row in range(1, self.height - 1):
+            self._put(row, 0, 'x', attr)
+            self._put(row, self.width - 1, 'x', attr)
+        for column in range(1, self.width - 1):
+            self._put(0, column, 'q', attr)
+            self._put(self.height - 1, column, 'q', attr)
+        self._put(0, 0, 'l', attr)
+        self._put(0, self.width - 1, 'k', attr)
+        self._put(self.height - 1, 0, 'm', attr)
+        self._put(self.height - 1, self.width - 1, 'j', attr)
+        self.touched = True
+
+    def box(self) -> None:
+        self.border()
+
+    def keypad(self, _flag: bool) -> None:
+        pass  # Keys are read through the compositor's output (see get_wch)
+
+    def noutrefresh(self) -> None:
+        pass  # The compositor picks up every touched window in present()
+
+    def refresh(self) -> None:
+        self._compositor.present(cursor_window=self)
+
+    def get_wch(self) -> int | str:
+        self._compositor.present(cursor_window=self)
+        return self._compositor.output.get_wch(self._cursor_y + self.y, self._cursor_x + self.x)
+
+    def _write(self, y: int, x: int, text: str, attr: int) -> None:
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise CursesError('addwstr() returned ERR')
+        attr |= self._attr
+        self.touched = True
+        for char in text:
+            if char == '\n':
+                self.chars[y][x:] = [' '] * (self.width - x)
+                self.attrs[y][x:] = [0] * (self.width - x)
+                y, x = y + 1, 0
+            else:
+                width: int = cell_width(char)
+                if x + width > self.width:  # Wrap like curses
+                    y, x = y + 1, 0
+                if y < self.height:
+                    self._put(y, x, char, attr)
+                    if width == 2:
+                        self._put(y, x + 1, self.WIDE_CHAR_PLACEHOLDER, attr)
+                    x += width
+                    if x >= self.width:
+                        y, x = y + 1, 0
+            if y >= self.height:
+                self._cursor_y, self._cursor_x = self.height - 1, self.width - 1
+                raise CursesError('addwstr() returned ERR')  # Ran past the bottom right corner
+        self._cursor_y, self._cursor_x = y, x
+
+    def _put(self, y: int, x: int, char: str, attr: int) -> None:
+        chars: list[str] = self.chars[y]
+        # Never leave half of a wide character behind
+        if chars[x] == self.WIDE_CHAR_PLACEHOLDER:
+            if x > 0 and char != self.WIDE_CHAR_PLACEHOLDER:
+                chars[x - 1] = ' '
+        elif x + 1 < self.width and chars[x + 1] == self.WIDE_CHAR_PLACEHOLDER:
+            chars[x + 1] = ' '
+        chars[x] = char
+        self.attrs[y][x] = attr
+
+
+class CompositorOutput(abc.ABC):
+    """Where the Compositor sends changed cells"""
+    def resize(self, height: int, width: int) -> None:
+        pass
+
+    @abc.abstractmethod
+    def write(self, y: int, x: int, text: str, attr: int) -> None:
+        pass
+
+    def flush(self, cursor: tuple[int, int] | None) -> None:
+        pass
+
+    @abc.abstractmethod
+    def get_wch(self, y: int, x: int) -> int | str:
+        pass
+
+
+class CursesOutput(CompositorOutput):
+    def __init__(self, stdscr: CursesWindowType) -> None:
+        self.stdscr: CursesWindowType = stdscr
+
+    def write(self, y: int, x: int, text: str, attr: int) -> None:
+        try:
+            self.stdscr.addstr(y, x, text, attr)
+        except CursesError:
+            pass  # Writing the bottom right cell moves the cursor off screen, the cell is written anyway
+
+    def flush(self, cursor: tuple[int, int] | None) -> None:
+        if cursor is not None:
+            try:
+                self.stdscr.move(*cursor)
+            except CursesError:
+                pass
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def get_wch(self, y: int, x: int) -> int | str:
+        self.stdscr.nodelay(False)  # Block until the key arrives, like a curses subwin would
+        try:
+            self.stdscr.move(y, x)
+            return self.stdscr.get_wch()
+        finally:
+            self.stdscr.nodelay(True)
+
+
+class MemoryOutput(CompositorOutput):
+    """Screen without a terminal (tests & benchmarks); keys for get_wch() are taken from self.keys"""
+    def __init__(self, keys: list[int | str] | None = None) -> None:
+        self.chars: list[list[str]] = []
+        self.attrs: list[list[int]] = []
+        self.keys: list[int | str] = keys if keys is not None else []
+        self.writes: int = 0
+        self.cells_written: int = 0
+
+    def resize(self, height: int, width: int) -> None:
+        self.chars = [[' '] * width for _ in range(height)]
+        self.attrs = [[0] * width for _ in range(height)]
+
+    def write(self, y: int, x: int, text: str, attr: int) -> None:
+        self.writes += 1
+        for char in text:
+            if x >= len(self.chars[y]):
+                break
+            self.chars[y][x] = char
+            self.attrs[y][x] = attr
+            x += cell_width(char)
+            self.cells_written += 1
+
+    def get_wch(self, y: int, x: int) -> int | str:
+        if not self.keys:
+            raise CursesError('no input')
+        return self.keys.pop(0)
+
+    def lines(self) -> list[str]:
+        return [''.join(row) for row in self.chars]
+
+
+class Compositor:
+    """Puts VirtualWindows on screen: composites them by z-index into a cell grid, diffs it against what the output
+    already shows and only writes changed cells, merged into runs of equal attributes.
+
+    Only rows covered by windows that changed since the last present() are composited again (everything after a
+    layout change). Also acts as the `stdscr` widgets are built with, see subwin().
+    """
+    MAX_RUN_GAP: int = 4  # Unchanged cells rewritten to merge two runs (cheaper than moving the cursor)
+
+    def __init__(self, output: CompositorOutput) -> None:
+        self.output: CompositorOutput = output
+        self.height: int = 0
+        self.width: int = 0
+        self._chars: list[list[str]] = []  # Composited frame
+        self._attrs: list[list[int]] = []
+        self._screen_chars: list[list[str | None]] = []  # What the output shows, None if unknown
+        self._screen_attrs: list[list[int]] = []
+        self._layout: list[tuple[int, int, int, int, int]] = []
+        # Windows to composite, lowest z-index first (set by the WidgetContainer)
+        self.windows_source: typing.Callable[[], list[VirtualWindow]] = lambda: []
+        self.runs_written: int = 0
+        self.cells_written: int = 0
+
+    def resize(self, height: int, width: int) -> None:
+        self.height, self.width = height, width
+        self._chars = [[' '] * width for _ in range(height)]
+        self._attrs = [[0] * width for _ in range(height)]
+        self._screen_chars = [[None] * width for _ in range(height)]  # Repaint everything
+        self._screen_attrs = [[0] * width for _ in range(height)]
+        self._layout = []
+        self.output.resize(height, width)
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    def subwin(self, height: int, width: int, y: int, x: int) -> VirtualWindow:
+        if height <= 0 or width <= 0 or y < 0 or x < 0 or y + height > self.height or x + width > self.width:
+            raise CursesError('subwin() returned NULL')  # Like curses, windows have to fit on the screen
+        return VirtualWindow(self, height, width, y, x)
+
+    def present(self, cursor_window: VirtualWindow | None = None) -> None:
+        windows: list[VirtualWindow] = self.windows_source()
+        layout: list[tuple[int, int, int, int, int]] = [
+            (id(window), window.y, window.x, window.height, window.width) for window in windows
+        ]
+
+        # Damaged columns per row
+        damage: dict[int, tuple[int, int]] = {}
+        if layout != self._layout:
+            self._layout = layout
+            damage = {y: (0, self.width) for y in range(self.height)}
+        else:
+            for window in windows:
+                if not window.touched:
+                    continue
+                for y in range(window.y, min(window.y + window.height, self.height)):
+                    left, right = damage.get(y, (window.x, window.x + window.width))
+                    damage[y] = (min(left, window.x), max(right, window.x + window.width))
+        for window in windows:
+            window.touched = False
+
+        for y, (left, right) in damage.items():
+            right = min(right, self.width)
+            self._composite_row(windows, y, left, right)
+            self._write_changes(y, left, right)
+
+        cursor: tuple[int, int] | None = None
+        if cursor_window is not None:
+            cursor_y, cursor_x = cursor_window.getyx()
+            cursor = (cursor_window.y + cursor_y, cursor_window.x + cursor_x)
+        self.output.flush(cursor)
+
+    def lines(self) -> list[str]:
+        """The composited frame as text (without attributes)"""
+        return [''.join(row) for row in self._chars]
+
+    def _composite_row(self, windows: list[VirtualWindow], y: int, left: int, right: int) -> None:
+        chars: list[str] = self._chars[y]
+        attrs: list[int] = self._attrs[y]
+        chars[left:right] = [' '] * (right - left)
+        attrs[left:right] = [0] * (right - left)
+        for window in windows:  # Lowest z-index first, higher windows overwrite
+            if not window.y <= y < window.y + window.height:
+                continue
+            start: int = max(left, window.x)
+            end: int = min(right, window.x + window.width)
+            if start < end:
+                row: int = y - window.y
+                chars[start:end] = window.chars[row][start - window.x:end - window.x]
+                attrs[start:end] = window.attrs[row][start - window.x:end - window.x]
+
+        # Wide characters cut in half by an overlapping window become blanks
+        placeholder: str = VirtualWindow.WIDE_CHAR_PLACEHOLDER
+        for x in range(max(left - 1, 0), min(right + 1, self.width)):
+            char: str = chars[x]
+            if char == placeholder:
+                if x == 0 or chars[x - 1] == placeholder or cell_width(chars[x - 1]) != 2:
+                    chars[x] = ' '
+            elif cell_width(char) == 2:
+                if x + 1 >= self.width or chars[x + 1] != placeholder:
+                    chars[x] = ' '
+
+    def _write_changes(self, y: int, left: int, right: int) -> None:
+        chars: list[str] = self._chars[y]
+        attrs: list[int] = self._attrs[y]
+        screen_chars: list[str | None] = self._screen_chars[y]
+        screen_attrs: list[int] = self._screen_attrs[y]
+        placeholder: str = VirtualWindow.WIDE_CHAR_PLACEHOLDER
+
+        x: int = left
+        while x < right:
+            if chars[x] == screen_chars[x] and attrs[x] == screen_attrs[x]:
+                x += 1
+                continue
+
+            # Run of cells with the same attributes, bridging short unchanged gaps
+            attr: int = attrs[x]
+            start: int = x
+            last_changed: int = x
+            end: int = x + 1
+            while end < right and attrs[end] == attr and end - last_changed <= self.MAX_RUN_GAP:
+                if chars[end] != screen_chars[end] or attrs[end] != screen_attrs[end]:
+                    last_changed = end
+                end += 1
+            end = last_changed + 1
+
+            if chars[start] == placeholder:
+                start -= 1  # Rewrite the whole wide character
+            if end < self.width and chars[end] == placeholder:
+                end += 1
+
+            self.output.write(y, start, ''.join(chars[start:end]), attrs[start])
+            screen_chars[start:end] = chars[start:end]
+            screen_attrs[start:end] = attrs[start:end]
+            self.runs_written += 1
+            self.cells_written += end - start
+            x = end
+
+
+# endregion Compositor
+
+
 # region WidgetContainer & essentials
 
 class WidgetContainer:
@@ -498,17 +1054,28 @@ class WidgetContainer:
         self.stdscr: CursesWindowType = stdscr
         self.ui_state: UIState = UIState()
 
+        # Widgets draw into virtual windows, the compositor only sends changed cells to stdscr
+        self.compositor: Compositor = Compositor(CursesOutput(stdscr))
+        self.compositor.windows_source = self.return_visible_windows
+
         # Logs (Warnings, Errors)
         self.log_messages: LogMessages = LogMessages()
 
+        self._http: HttpClient | None = None  # See http
+
         # Directories
         self.ROOT_CONFIG_DIR: pathlib.Path = pathlib.Path.home() / '.config' / 'twidgets'
         self.ROOT_PER_WIDGET_CONFIG_DIR: pathlib.Path = self.ROOT_CONFIG_DIR / 'widgets'
         self.ROOT_PY_WIDGET_DIR: pathlib.Path = self.ROOT_CONFIG_DIR / 'py_widgets'
+        self.ROOT_CACHE_DIR: pathlib.Path = self.ROOT_CONFIG_DIR / 'cache'
         self.SCRIPT_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent  # Test ENV
         self.SCRIPT_DIR_PY_WIDGET_DIR: pathlib.Path = self.SCRIPT_DIR / 'config' / 'py_widgets'
 
         # Widget Loader (after directories are generated)
+        self.reload_cache: ReloadCache = ReloadCache.shared() if not test_env else ReloadCache()
+        self.config_cache: ConfigCache = ConfigCache.shared(
+            self.ROOT_CACHE_DIR / 'configs.pickle'
+        ) if not test_env else ConfigCache()
         self.widget_loader: WidgetLoader = WidgetLoader(self)
 
         # Define config loader (Only loads secrets)
@@ -519,19 +1086,48 @@ class WidgetContainer:
         self.base_config: BaseConfig = self.config_loader.load_base_config(
             self.log_messages, LogErrorFoundBy.RUNTIME.value
         )
+        self.log_messages.max_log_messages = self.base_config.max_log_messages
+        # Last data of every widget, shown right away on the next start
+        self.snapshot_store: SnapshotStore = SnapshotStore(self.ROOT_CACHE_DIR / 'snapshots.pickle')
 
         # Reloader Thread
         self.stop_event: threading.Event = threading.Event()
+        self.update_scheduler: UpdateScheduler = UpdateScheduler(self)
         self.reloader_thread: threading.Thread = threading.Thread(
-            target=self.reload_widget_scheduler_function
+            target=self.update_scheduler.run
         )
         if self.test_env:
             self.reloader_thread.daemon = True  # Make tests exit when they are all executed
         threading.excepthook = self.crash_on_thread_exception
 
+        # Event loop (wakes up on input, new widget data or a SIGWINCH, instead of polling), see open_event_loop()
+        self._wakeup_fds: tuple[int, int] | None = None  # Self-pipe (read end, write end)
+        # Held while writing to / closing the self-pipe, so a late wake_up() never writes to a reused fd number.
+        # Reentrant: the SIGWINCH handler calls wake_up() on the main thread, possibly within close_event_loop()
+        self._wakeup_lock: threading.RLock = threading.RLock()
+        self._selector: selectors.BaseSelector | None = None
+        self._resize_pending: bool = False
+
         self._floating_widgets: list[FloatingWidget] = []
         self._all_widgets: list[Widget] = []
         self._widgets: list[Widget] = []
+        self._render_order: list[Widget | FloatingWidget] | None = None  # Cache, see return_render_order()
+
+    @property
+    def http(self) -> HttpClient:
+        """Pooled HTTP connections for widgets (outlives this container, see HttpClient.shared()).
+        Imported on first use, so requests is only loaded if an enabled widget sends requests."""
+        if self._http is None:
+            from twidgets.core.http import HttpClient
+            http: HttpClient = HttpClient.shared()
+            if not self.test_env:
+                http.configure_cache(
+                    self.ROOT_CACHE_DIR / 'http',
+                    self.base_config.http_cache_ttl,
+                    self.base_config.http_cache_max_size * 1024 * 1024
+                )
+            self._http = http
+        return self._http
 
     def add_widget(self, widget: Widget) -> None:
         if not widget.config.enabled:
@@ -543,6 +1139,8 @@ class WidgetContainer:
                 # raise DebugException(f'Widget "{widget.name}" is already defined')
                 return
             self._widgets.append(widget)
+            self.invalidate_render_order()
+            self.update_scheduler.add_widget(widget)
 
     def draw_widget(
             self,
@@ -563,7 +1161,7 @@ class WidgetContainer:
 
         if widget == self.ui_state.highlighted:
             widget.draw_colored_border(self.base_config.PRIMARY_PAIR_NUMBER, self.test_env)
-        elif loading:
+        elif loading or widget.snapshot.stale:  # Stale data is shown while the first update is still loading
             widget.draw_colored_border(self.base_config.LOADING_PAIR_NUMBER, self.test_env)
         elif error:
             widget.draw_colored_border(self.base_config.ERROR_PAIR_NUMBER, self.test_env)
@@ -580,12 +1178,15 @@ class WidgetContainer:
         if self.ui_state.highlighted == widget:
             self.ui_state.previously_highlighted = widget
             self.ui_state.highlighted = None
+            self.mark_all_widgets_dirty()
         self.remove_widget_content(widget)
         widget.disable_help_mode()
         widget.reinit_window(self)
         widget.noutrefresh()
         if widget in self._widgets:
             self._widgets.remove(widget)
+            self.invalidate_render_order()
+            self.update_scheduler.remove_widget(widget)
 
     def reactivate_all_widgets(self) -> None:
         for widget in self._all_widgets:
@@ -610,7 +1211,9 @@ class WidgetContainer:
 
     def return_widgets_ordered_by_z_index(self) -> dict[int, list[Widget]]:
         widgets_by_z_index: dict[int, list[Widget]] = {}
-        for widget in self._widgets:
+        for widget in self.return_render_order():
+            if not isinstance(widget, Widget):
+                continue
             z_index = widget.dimensions.z_index
             if z_index not in widgets_by_z_index.keys():
                 widgets_by_z_index[z_index] = [widget]
@@ -618,9 +1221,67 @@ class WidgetContainer:
                 widgets_by_z_index[z_index].append(widget)
         return widgets_by_z_index
 
+    def return_render_order(self) -> list[Widget | FloatingWidget]:
+        """Active widgets and floating widgets, sorted by z-index (equal z-indexes keep their loading order).
+
+        The list is cached until add_widget, deactivate_widget, reactivate_all_widgets, set_widget_z_index or
+        adding / removing a floating widget changes it; Don't modify it.
+        """
+        if self._render_order is None:
+            self._render_order = sorted(
+                [*self._widgets, *self._floating_widgets], key=lambda item: item.dimensions.z_index
+            )
+            self.update_visible_regions(self._render_order)
+        return self._render_order
+
+    def invalidate_render_order(self) -> None:
+        self._render_order = None
+
+    def update_visible_regions(self, render_order: list[Widget | FloatingWidget]) -> None:
+        """Store the parts of every widget that aren't covered by (floating) widgets above it, on the widget"""
+        for index, widget in enumerate(render_order):
+            if not isinstance(widget, Widget):
+                continue
+            visible_regions: list[Dimensions] = [widget.dimensions]
+            for above in render_order[index + 1:]:
+                if not visible_regions:
+                    break
+                if above.dimensions.overlaps(widget.dimensions):
+                    visible_regions = [
+                        piece for region in visible_regions for piece in region.subtract(above.dimensions)
+                    ]
+
+            if widget.hidden() and visible_regions:
+                widget.mark_dirty()  # Hidden widgets aren't drawn, its window is outdated
+                if self.base_config.skip_hidden_widget_updates:
+                    self.update_scheduler.update_now(widget)  # Its data wasn't updated while hidden
+            widget.visible_regions = visible_regions
+
+    def set_widget_z_index(self, widget: Widget, z_index: int) -> None:
+        widget.dimensions.z_index = z_index
+        self.invalidate_render_order()  # The compositor stacks the windows in the new order
+
     def return_all_widgets(self) -> list[Widget]:
         return self._all_widgets
 
+    def mark_all_widgets_dirty(self) -> None:
+        for widget in self._all_widgets:
+            widget.mark_dirty()
+
+    @staticmethod
+    def widget_requires_redraw(widget: Widget, now: float) -> bool:
+        if widget.hidden():
+            return False  # Fully covered, drawing it would be invisible work
+        # Every widget has its own virtual window, redrawing one never overwrites another (see Compositor)
+        return widget.needs_redraw(now)
+
+    def return_visible_windows(self) -> list[VirtualWindow]:
+        """Virtual windows to composite, lowest z-index first"""
+        return [
+            item.win for item in self.return_render_order()
+            if isinstance(item.win, VirtualWindow) and not (isinstance(item, Widget) and item.hidden())
+        ]
+
     def return_all_floating_windows(self) -> list[FloatingWidget]:
         return self._floating_widgets
 
@@ -654,6 +1315,7 @@ class WidgetContainer:
     def add_floating_widget(self, floating_widget: FloatingWidget) -> None:
         self.remove_floating_widget_by_name_title(floating_widget.name, floating_widget.title)
         self._floating_widgets.append(floating_widget)
+        self.invalidate_render_order()
 
     def remove_floating_widget_by_name_title(self, name: str, title: str) -> None:
         remove_floating_widgets: list[FloatingWidget] = []
@@ -671,6 +1333,7 @@ class WidgetContainer:
     def remove_floating_widget(self, floating_widget: FloatingWidget) -> None:
         if floating_widget in self._floating_widgets:
             self._floating_widgets.remove(floating_widget)
+            self.invalidate_render_order()
             if floating_widget.win:
                 floating_widget.win.erase()
 
@@ -688,19 +1351,52 @@ class WidgetContainer:
             raise ConfigScanFoundError(config_scan_results)  # type: ignore[arg-type]
 
     def build_widgets(self) -> None:
-        # Import all widget modules
-        custom_widget_modules: dict[str, types.ModuleType] = self.widget_loader.load_custom_widget_modules()
+        # Configs first: disabled widgets are neither imported nor built
+        configs: dict[str, Config] = self.widget_loader.load_widget_configs(self)
+        custom_widget_modules: dict[str, types.ModuleType] = self.widget_loader.load_custom_widget_modules(
+            [module_name for module_name, config in configs.items() if config.enabled]
+        )
 
-        widget_list: list[Widget] = self.widget_loader.build_widgets(self, custom_widget_modules)
+        widget_list: list[Widget] = self.widget_loader.build_widgets(self, custom_widget_modules, configs)
+        self.config_cache.save()  # Every configuration file is parsed by now
         self.add_widget_list(widget_list)
         if not widget_list:
             raise NoWidgetsFound(self.log_messages)
+        if not self.test_env:
+            # Reloaded: Unchanged widgets keep their data, the others show the data of the last run
+            reloaded: list[Widget] = self.reload_cache.restore_widgets(widget_list, self.config_loader.secrets_hash())
+            self.snapshot_store.restore([widget for widget in widget_list if widget not in reloaded])
         return None
 
     def start_reloader_thread(self) -> None:
         self.reloader_thread.start()
 
+    def open_event_loop(self) -> None:
+        """Create the self-pipe & selector wait_for_events() waits on, closed again by close_event_loop()"""
+        if self._selector is not None:
+            return
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(read_fd, selectors.EVENT_READ)
+        with self._wakeup_lock:
+            self._wakeup_fds = read_fd, write_fd
+
+    def close_event_loop(self) -> None:
+        selector: selectors.BaseSelector | None = self._selector
+        self._selector = None
+        if selector is not None:
+            selector.close()
+        with self._wakeup_lock:
+            wakeup_fds: tuple[int, int] | None = self._wakeup_fds
+            self._wakeup_fds = None  # wake_up() from other threads does nothing from now on
+            if wakeup_fds is not None:
+                for fd in wakeup_fds:
+                    os.close(fd)
+
     def init_curses_setup(self) -> None:
+        self.open_event_loop()
         curses.mousemask(curses.ALL_MOUSE_EVENTS)
         curses.curs_set(0)
         curses.mouseinterval(0)
@@ -710,17 +1406,80 @@ class WidgetContainer:
         self.stdscr.bkgd(' ', curses.color_pair(1))  # Activate standard color
         self.stdscr.clear()
         self.stdscr.refresh()
-        self.stdscr.timeout(100)
+        self.stdscr.nodelay(True)  # Input is awaited in wait_for_events()
+        self.compositor.resize(*self.stdscr.getmaxyx())
+
+        try:
+            if self._selector is not None:
+                self._selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+        except (KeyError, ValueError, AttributeError, OSError):
+            pass  # Already registered (or no stdin available)
+        # Replaces the curses SIGWINCH handler, so the resize also interrupts wait_for_events()
+        signal.signal(signal.SIGWINCH, self.handle_resize_signal)
+
+    def handle_resize_signal(self, _signal_number: int, _frame: types.FrameType | None) -> None:
+        self._resize_pending = True
+        self.wake_up()
+
+    def wake_up(self) -> None:
+        """Wake up the main loop (thread-safe), e.g. after new draw_data was published"""
+        with self._wakeup_lock:
+            wakeup_fds: tuple[int, int] | None = self._wakeup_fds
+            if wakeup_fds is None:
+                return  # No event loop (yet), or already closed
+            try:
+                os.write(wakeup_fds[1], b'\0')
+            except BlockingIOError:
+                pass  # Pipe is full, a wake-up is already pending
+
+    def wait_for_events(self, timeout: float | None) -> None:
+        """Block until a key is pressed, wake_up() is called or the timeout (seconds, None = forever) expired"""
+        self.open_event_loop()
+        selector: selectors.BaseSelector | None = self._selector
+        wakeup_fds: tuple[int, int] | None = self._wakeup_fds
+        if selector is None or wakeup_fds is None:
+            return
+        try:
+            selector.select(timeout)
+        except (OSError, ValueError):
+            return  # Selector closed during cleanup
+        try:
+            while os.read(wakeup_fds[0], 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def read_pending_keys(self) -> list[int]:
+        keys: list[int] = []
+        if self._resize_pending:
+            self._resize_pending = False
+            columns, lines = shutil.get_terminal_size()
+            try:
+                curses.resizeterm(lines, columns)
+            except CursesError:
+                pass
+            keys.append(curses.KEY_RESIZE)
+
+        key: int = self.stdscr.getch()
+        while key != -1:
+            if not (key == curses.KEY_RESIZE and curses.KEY_RESIZE in keys):  # resizeterm() may queue it again
+                keys.append(key)
+            key = self.stdscr.getch()
+        return keys
+
+    def next_redraw_timeout(self, now: float) -> float | None:
+        """Seconds until the next time-based redraw, None if no widget redraws based on time"""
+        deadlines: list[float] = [
+            widget.next_redraw for widget in self._widgets if widget.next_redraw is not None
+        ]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - now, 0.0)
 
     def loading_screen(self) -> None:
-        widgets_by_z: dict[int, list[Widget]] = self.return_widgets_ordered_by_z_index()
-        for widget in (
-                w
-                for z in sorted(widgets_by_z)
-                for w in widgets_by_z[z]
-        ):
-            if not widget.win:
-                continue
+        for widget in self.return_render_order():
+            if not isinstance(widget, Widget) or not widget.win or widget.snapshot.stale:
+                continue  # Stale widgets are drawn with their restored data instead
             self.draw_widget(widget, loading=True)
             widget.add_widget_content([' Loading... '])
             widget.win.refresh()
@@ -736,6 +1495,7 @@ class WidgetContainer:
         current_terminal_width: int
 
         current_terminal_height, current_terminal_width = self.stdscr.getmaxyx()
+        self.compositor.resize(current_terminal_height, current_terminal_width)
 
         self.reactivate_all_widgets()  # Allows for making the terminal bigger
 
@@ -746,6 +1506,7 @@ class WidgetContainer:
         self.reinit_all_widget_windows()  # Allows for making the terminal bigger
         self.reinit_all_floating_windows()  # Allows for making the terminal bigger
         self.redraw_all_warnings()
+        self.mark_all_widgets_dirty()
 
     def handle_mouse_input(self, key: int) -> None:
         if key == CursesKeys.MOUSE:
@@ -755,13 +1516,22 @@ class WidgetContainer:
                 # Bitwise and, check if button 1 is pressed
                 if b_state & CursesKeys.BUTTON1_PRESSED:
                     self.switch_windows(mx, my, b_state)
+                    self.mark_dirty_if_focus_changed()
                     if self.ui_state.highlighted is not None:
                         self.ui_state.highlighted.mouse_action(mx, my, b_state, self)
             except CursesError:
                 # Ignore invalid mouse events (like scroll in some terminals)
                 return
 
+    def mark_dirty_if_focus_changed(self) -> None:
+        # Borders, the mode widget and selections depend on the focus, so redraw everything
+        if self.ui_state.highlighted != self.ui_state.previously_highlighted:
+            self.mark_all_widgets_dirty()
+
     def handle_key_input(self, key: int) -> None:
+        if key == -1:
+            return  # No key pressed (getch timed out)
+
         highlighted_widget: Widget | None = self.ui_state.highlighted
 
         if key == CursesKeys.ESCAPE:
@@ -770,6 +1540,7 @@ class WidgetContainer:
                     highlighted_widget.disable_help_mode()
             self.ui_state.previously_highlighted = self.ui_state.highlighted
             self.ui_state.highlighted = None
+            self.mark_dirty_if_focus_changed()
 
         if key == curses.KEY_RESIZE:
             self.move_widgets_resize()
@@ -798,13 +1569,9 @@ class WidgetContainer:
         self.ui_state.previously_highlighted = self.ui_state.highlighted
         self.ui_state.highlighted = None
 
-        widgets_by_z: dict[int, list[Widget]] = self.return_widgets_ordered_by_z_index()
-
-        for widget in (
-                w
-                for z in sorted(widgets_by_z, reverse=True)  # Start at highest z-index
-                for w in widgets_by_z[z]
-        ):
+        for widget in reversed(self.return_render_order()):  # Start at highest z-index
+            if not isinstance(widget, Widget):
+                continue  # Floating widgets can't be highlighted
             y1 = widget.dimensions.current_y
             y2 = y1 + widget.dimensions.current_height
             x1 = widget.dimensions.current_x
@@ -887,7 +1654,7 @@ class WidgetContainer:
             warning_error,
             str(warning_error).split('\n'),
             warning_dimensions,
-            self.stdscr
+            self.compositor
         )
 
         self.add_floating_widget(warning)
@@ -942,7 +1709,13 @@ class WidgetContainer:
 
     def cleanup_curses_setup(self) -> None:
         self.stop_event.set()
+        self.update_scheduler.wake_up()
         self.reloader_thread.join(timeout=1)
+        if not self.test_env:
+            self.snapshot_store.save(self._all_widgets, self.log_messages)
+            self.reload_cache.save_widgets(self._all_widgets, self.config_loader.secrets_hash())
+        signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+        self.close_event_loop()
         try:
             curses.endwin()
         except CursesError:
@@ -952,44 +1725,14 @@ class WidgetContainer:
         self.draw_widget(widget, ' Error ', error=True)
         widget.add_widget_content(content)
 
-    def reload_widget_scheduler_function(self) -> None:
-        while not self.stop_event.is_set():
-            now = time_module.time()
-
-            # Calculate reloadable widgets every time every widget has reloaded
-            reloadable_widgets: list[Widget] = [w for w in self.return_widgets() if w.updatable()]
-            # Update widgets if their interval has passed
-            for widget in reloadable_widgets:
-                if self.stop_event.is_set():  # Check on every iteration as well
-                    break
-
-                if widget.last_updated is None:
-                    continue
-
-                # See widget.updatable(), types are safe.
-                if now - widget.last_updated >= widget.interval:  # type: ignore[operator]
-                    try:
-                        widget.draw_data = widget.update(self)
-                        widget.last_updated = now
-                    except WidgetNoUpdateFunction:
-                        pass
-                    except ConfigSpecificException as e:
-                        widget.error_data = {'__error__': e.log_messages}
-                    except Exception as e:
-                        widget.error_data = {'__error__': str(e)}
-
-            # Small sleep to avoid busy loop, tuned to a small value
-            time_module.sleep(0.06667)  # -> ~15 FPS
-
     @staticmethod
     def crash_on_thread_exception(args: typing.Any) -> None:
         print("Thread crashed:", args.exc_type.__name__, args.exc_value)
         traceback.print_tb(args.exc_traceback)
         sys.exit(1)
 
-    @staticmethod
-    def update_screen() -> None:
-        curses.doupdate()
+    def update_screen(self) -> None:
+        self.compositor.present()
 
 
 class BaseConfig:
@@ -1010,6 +1753,15 @@ class BaseConfig:
         help_key: str | None = None,
         use_emoji_titles: bool | None = None,
         reset_help_mode_after_escape: bool | None = None,
+        max_update_workers: int | None = None,
+        update_retry_delay: int | None = None,
+        update_retry_max_delay: int | None = None,
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: int | None = None,
+        skip_hidden_widget_updates: bool | None = None,
+        max_log_messages: int | None = None,
+        http_cache_ttl: int | None = None,
+        http_cache_max_size: int | None = None,
         **kwargs: typing.Any
     ) -> None:
 
@@ -1029,6 +1781,15 @@ class BaseConfig:
         self.help_key: str = base_cfg.help_key
         self.use_emoji_titles: bool = base_cfg.use_emoji_titles
         self.reset_help_mode_after_escape: bool = base_cfg.reset_help_mode_after_escape
+        self.max_update_workers: int = base_cfg.max_update_workers
+        self.update_retry_delay: int = base_cfg.update_retry_delay
+        self.update_retry_max_delay: int = base_cfg.update_retry_max_delay
+        self.circuit_breaker_threshold: int = base_cfg.circuit_breaker_threshold
+        self.circuit_breaker_cooldown: int = base_cfg.circuit_breaker_cooldown
+        self.skip_hidden_widget_updates: bool = base_cfg.skip_hidden_widget_updates
+        self.max_log_messages: int = base_cfg.max_log_messages
+        self.http_cache_ttl: int = base_cfg.http_cache_ttl
+        self.http_cache_max_size: int = base_cfg.http_cache_max_size
 
         def apply_color(field_name: str, value: dict[str, int] | None) -> RGBColor:
             if value is None:
@@ -1108,6 +1869,10 @@ class BaseConfig:
             'reset_help_mode_after_escape',
             reset_help_mode_after_escape
         )
+        self.skip_hidden_widget_updates = apply_bool(
+            'skip_hidden_widget_updates',
+            skip_hidden_widget_updates
+        )
 
         self.BACKGROUND_NUMBER: int = -1 if self.use_standard_terminal_background else 1
         if test_env:
@@ -1150,6 +1915,34 @@ class BaseConfig:
         self.reload_key = apply_key('reload_key', reload_key)
         self.help_key = apply_key('help_key', help_key)
 
+        def apply_positive_int(field: str, value: int | None) -> int:
+            if value is None:
+                log_messages.add_log_message(LogMessage(
+                    f'Configuration for {field} is missing (base.yaml, falling back to standard config)',
+                    LogLevels.WARNING.key,
+                    error_found_by
+                ))
+                return getattr(self, field)  # type: ignore[no-any-return]
+
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                log_messages.add_log_message(LogMessage(
+                    f'Configuration for {field} is invalid (not a whole number above 0)',
+                    LogLevels.ERROR.key,
+                    error_found_by
+                ))
+                return getattr(self, field)  # type: ignore[no-any-return]
+
+            return value
+
+        self.max_update_workers = apply_positive_int('max_update_workers', max_update_workers)
+        self.update_retry_delay = apply_positive_int('update_retry_delay', update_retry_delay)
+        self.update_retry_max_delay = apply_positive_int('update_retry_max_delay', update_retry_max_delay)
+        self.circuit_breaker_threshold = apply_positive_int('circuit_breaker_threshold', circuit_breaker_threshold)
+        self.circuit_breaker_cooldown = apply_positive_int('circuit_breaker_cooldown', circuit_breaker_cooldown)
+        self.max_log_messages = apply_positive_int('max_log_messages', max_log_messages)
+        self.http_cache_ttl = apply_positive_int('http_cache_ttl', http_cache_ttl)
+        self.http_cache_max_size = apply_positive_int('http_cache_max_size', http_cache_max_size)
+
         # Unknown config keys
         for key in kwargs:
             log_messages.add_log_message(LogMessage(
@@ -1192,6 +1985,15 @@ class BaseStandardFallBackConfig:
         self.help_key: str = 'h'
         self.use_emoji_titles: bool = False
         self.reset_help_mode_after_escape: bool = True
+        self.max_update_workers: int = 4
+        self.update_retry_delay: int = 5
+        self.update_retry_max_delay: int = 600
+        self.circuit_breaker_threshold: int = 5
+        self.circuit_breaker_cooldown: int = 1800
+        self.skip_hidden_widget_updates: bool = False
+        self.max_log_messages: int = 1000
+        self.http_cache_ttl: int = 60
+        self.http_cache_max_size: int = 10  # MiB
 
 
 class UIState:
@@ -1202,6 +2004,767 @@ class UIState:
 
 # endregion WidgetContainer & essentials
 
+# region Scheduler
+
+class UpdateWorkerPool(concurrent.futures.Executor):
+    """Bounded pool of daemon worker threads for plain (non-coroutine) update functions.
+
+    Unlike ThreadPoolExecutor, its workers never block interpreter exit (ThreadPoolExecutor joins its workers at exit,
+    so a single hung update would keep twidgets from quitting), and a worker stuck in an overrunning update can be
+    abandoned: it no longer counts towards max_workers (so a replacement is started) and exits once its call returns.
+    """
+    def __init__(self, max_workers: int | None = None, thread_name_prefix: str = '') -> None:
+        self._max_workers: int = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._thread_name_prefix: str = thread_name_prefix
+        self._work_queue: queue.SimpleQueue[
+            tuple[concurrent.futures.Future[typing.Any], typing.Callable[[], typing.Any]] | None
+        ] = queue.SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self._idle_semaphore: threading.Semaphore = threading.Semaphore(0)
+        self._workers: set[int] = set()  # Thread idents counting towards max_workers
+        self._abandoned_workers: set[int] = set()
+        self._threads: list[threading.Thread] = []
+        self._thread_numbers: typing.Iterator[int] = itertools.count()
+        self._shutdown: bool = False
+
+    def submit(
+            self,
+            fn: typing.Callable[..., typing.Any],
+            /,
+            *args: typing.Any,
+            **kwargs: typing.Any
+    ) -> concurrent.futures.Future[typing.Any]:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            future: concurrent.futures.Future[typing.Any] = concurrent.futures.Future()
+            self._work_queue.put((future, functools.partial(fn, *args, **kwargs)))
+            if not self._idle_semaphore.acquire(timeout=0):
+                self._start_worker()
+            return future
+
+    def abandon_worker(self, thread_ident: int) -> None:
+        """Stop counting a (stuck) worker towards max_workers, it exits after its current call"""
+        with self._lock:
+            if thread_ident not in self._workers:
+                return
+            self._workers.discard(thread_ident)
+            self._abandoned_workers.add(thread_ident)
+            if not self._shutdown and not self._work_queue.empty():
+                self._start_worker()
+
+    def abandoned_workers(self) -> list[int]:
+        with self._lock:
+            return list(self._abandoned_workers)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        work_item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if work_item is not None:
+                        work_item[0].cancel()
+            self._work_queue.put(None)  # Passed on from worker to worker
+        if wait:
+            for thread in list(self._threads):
+                thread.join()
+
+    def _start_worker(self) -> None:
+        """Must be called while holding self._lock"""
+        if len(self._workers) >= self._max_workers:
+            return
+        thread: threading.Thread = threading.Thread(
+            target=self._work, name=f'{self._thread_name_prefix}_{next(self._thread_numbers)}', daemon=True
+        )
+        thread.start()
+        self._threads.append(thread)
+        # Register right away, so concurrent submits see the new worker
+        if thread.ident is not None:
+            self._workers.add(thread.ident)
+
+    def _work(self) -> None:
+        thread_ident: int = threading.get_ident()
+        try:
+            while (work_item := self._work_queue.get()) is not None:
+                future, call = work_item
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(call())
+                    except BaseException as e:
+                        future.set_exception(e)
+                    del future, call, work_item
+
+                with self._lock:
+                    if thread_ident in self._abandoned_workers:
+                        return  # A replacement was started already
+                self._idle_semaphore.release()
+            self._work_queue.put(None)
+        finally:
+            with self._lock:
+                self._workers.discard(thread_ident)
+                self._abandoned_workers.discard(thread_ident)
+                self._threads = [thread for thread in self._threads if thread.ident != thread_ident]
+
+
+class UpdateRun:
+    """A single update of a widget, from being dispatched until it finished"""
+    def __init__(self, widget: Widget, started: float, timeout: int | float | None) -> None:
+        self.widget: Widget = widget
+        self.started: float = started  # time.monotonic()
+        self.timeout: int | float | None = timeout
+        self.future: concurrent.futures.Future[None] | None = None
+        self.task: asyncio.Future[list[str]] | None = None
+        self.call: concurrent.futures.Future[list[str]] | None = None  # Plain update function on the worker pool
+        self.thread_ident: int | None = None  # Worker running a plain update function
+        self.reported_stall: bool = False
+
+    def format_stack(self) -> str:
+        """Where the update currently is: the worker's stack, or the await chain of a coroutine update"""
+        frames: list[types.FrameType] = []
+        if self.thread_ident is not None:
+            frame: types.FrameType | None = sys._current_frames().get(self.thread_ident)
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+        elif isinstance(self.task, asyncio.Task):
+            awaitable: typing.Any = self.task.get_coro()
+            while awaitable is not None:
+                frame = getattr(awaitable, 'cr_frame', None) or getattr(awaitable, 'gi_frame', None)
+                if frame is None:
+                    break
+                frames.append(frame)
+                awaitable = getattr(awaitable, 'cr_await', None) or getattr(awaitable, 'gi_yieldfrom', None)
+        if not frames:
+            return '(stack unavailable)'
+        return ''.join(traceback.StackSummary.extract((frame, frame.f_lineno) for frame in frames).format())
+
+
+class CircuitState(enum.Enum):
+    CLOSED = 'closed'  # Updating normally
+    OPEN = 'open'  # Too many consecutive failures, waiting for the cooldown
+    HALF_OPEN = 'half-open'  # Cooldown passed, a single probe update is running
+
+
+class CircuitBreaker:
+    """Decides when a failing widget update is retried.
+
+    Retries back off exponentially (update_retry_delay doubling up to update_retry_max_delay, with jitter so widgets
+    sharing an API don't retry in lockstep). After circuit_breaker_threshold consecutive failures the circuit opens:
+    only a single probe is sent every circuit_breaker_cooldown seconds, until an update succeeds again.
+    """
+    def __init__(self) -> None:
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0  # Consecutive
+        self.next_retry: datetime.datetime | None = None
+
+    def before_attempt(self) -> None:
+        if self.state is CircuitState.OPEN:
+            self.state = CircuitState.HALF_OPEN
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.next_retry = None
+
+    def record_failure(self, base_config: BaseConfig) -> float:
+        """Returns the delay in seconds until the next attempt"""
+        self.failures += 1
+        delay: float
+        if self.state is CircuitState.HALF_OPEN or self.failures >= base_config.circuit_breaker_threshold:
+            self.state = CircuitState.OPEN
+            delay = base_config.circuit_breaker_cooldown
+        else:
+            delay = min(
+                base_config.update_retry_max_delay, base_config.update_retry_delay * 2 ** (self.failures - 1)
+            )
+            delay = random.uniform(delay / 2, delay)
+        self.next_retry = datetime.datetime.now() + datetime.timedelta(seconds=delay)
+        return delay
+
+    def status(self) -> str:
+        if self.next_retry is None:
+            return ''
+        next_retry: str = self.next_retry.strftime('%H:%M:%S')
+        if self.state is CircuitState.CLOSED:
+            return f'Failed {self.failures}x, retrying at {next_retry}'
+        return f'Circuit open ({self.failures} failures), next probe at {next_retry}'
+
+
+class UpdateScheduler:
+    """Calls widget update functions when their interval has passed.
+
+    Deadlines are monotonic and kept in a min-heap, so every (re-)schedule costs O(log n) and the scheduler thread
+    sleeps exactly until the next widget is due (or until it is woken up by added / removed widgets).
+    Due updates are dispatched to an asyncio event loop running in its own thread: coroutine update functions
+    (async def update(...)) are awaited there, plain ones run on a bounded worker pool (max_update_workers in
+    base.yaml). At most one update is in flight per widget: a widget is only put back into the heap once its running
+    update finished. Stopping the scheduler cancels all in-flight updates and closes the loop, a restarted
+    WidgetContainer starts a fresh one.
+    Updates overrunning the widget's update_timeout are cancelled (coroutines) or abandoned (plain functions, whose
+    worker gets replaced) and show a timeout error. An abandoned update still counts as in flight, the widget is only
+    rescheduled once its call actually returned. A watchdog logs the stack of every stalled update.
+    Failed updates are retried according to the widget's CircuitBreaker instead of the widget's interval.
+    """
+    STALL_THRESHOLD: float = 60  # Seconds, for widgets without update_timeout
+    WATCHDOG_INTERVAL: float = 1
+
+    def __init__(self, widget_container: WidgetContainer) -> None:
+        self._widget_container: WidgetContainer = widget_container
+        self._condition: threading.Condition = threading.Condition()
+        self._heap: list[tuple[float, int, Widget]] = []
+        # Sequence number of the valid heap entry per widget; other entries are stale and skipped (lazy deletion)
+        self._entries: dict[Widget, int] = {}
+        self._active_widgets: set[Widget] = set()
+        self._sequence: typing.Iterator[int] = itertools.count()
+        self._in_flight: dict[Widget, UpdateRun] = {}
+        self._pool: UpdateWorkerPool = UpdateWorkerPool()  # Replaced in run()
+
+    def add_widget(self, widget: Widget) -> None:
+        if not widget.updatable() or widget.last_updated is None:
+            return
+        with self._condition:
+            self._active_widgets.add(widget)
+            if widget in self._entries:
+                return  # Already scheduled, keep its deadline
+            if widget in self._in_flight:
+                return  # Still updating (e.g. deactivated & reactivated meanwhile), rescheduled once it finished
+            if not widget.last_updated:
+                self._push(widget, time_module.monotonic())  # Never updated, due immediately
+            else:
+                # See widget.updatable(), types are safe.
+                self._push(widget, widget.last_updated + widget.interval)  # type: ignore[operator]
+
+    def update_now(self, widget: Widget) -> None:
+        with self._condition:
+            if widget in self._active_widgets and widget not in self._in_flight:
+                self._push(widget, time_module.monotonic())
+
+    def remove_widget(self, widget: Widget) -> None:
+        with self._condition:
+            self._active_widgets.discard(widget)
+            if self._entries.pop(widget, None) is not None:
+                self._condition.notify()
+
+    def wake_up(self) -> None:
+        with self._condition:
+            self._condition.notify()
+
+    def scheduled_widgets(self) -> list[Widget]:
+        with self._condition:
+            return list(self._entries)
+
+    def _push(self, widget: Widget, deadline: float) -> None:
+        """Must be called while holding self._condition"""
+        sequence: int = next(self._sequence)
+        self._entries[widget] = sequence
+        heapq.heappush(self._heap, (deadline, sequence, widget))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            # Too many stale entries, rebuild the heap in O(n)
+            self._heap = [entry for entry in self._heap if self._entries.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+        self._condition.notify()
+
+    def _next_due_widget(self) -> Widget | None:
+        """Block until a widget is due, returns None if the scheduler was stopped"""
+        stop_event: threading.Event = self._widget_container.stop_event
+        with self._condition:
+            while not stop_event.is_set():
+                while self._heap and self._entries.get(self._heap[0][2]) != self._heap[0][1]:
+                    heapq.heappop(self._heap)  # Drop stale entry
+
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, _sequence, widget = self._heap[0]
+                timeout: float = deadline - time_module.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+                heapq.heappop(self._heap)
+                del self._entries[widget]
+                return widget
+        return None
+
+    def run(self) -> None:
+        self._pool = UpdateWorkerPool(
+            max_workers=self._widget_container.base_config.max_update_workers,
+            thread_name_prefix='twidgets-update'
+        )
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        loop_thread: threading.Thread = threading.Thread(
+            target=self._run_event_loop, args=(loop,), name='twidgets-asyncio', daemon=True
+        )
+        loop_thread.start()
+        watchdog_thread: threading.Thread = threading.Thread(
+            target=self._run_watchdog, name='twidgets-watchdog', daemon=True
+        )
+        watchdog_thread.start()
+        try:
+            while (widget := self._next_due_widget()) is not None:
+                if widget.hidden() and self._widget_container.base_config.skip_hidden_widget_updates:
+                    with self._condition:
+                        if widget in self._active_widgets:
+                            # See widget.updatable(), types are safe.
+                            self._push(widget, time_module.monotonic() + widget.interval)  # type: ignore[operator]
+                    continue
+                run: UpdateRun = UpdateRun(widget, time_module.monotonic(), widget.config.update_timeout)
+                with self._condition:
+                    if widget in self._in_flight:
+                        continue  # Never two updates of a widget at once
+                    self._in_flight[widget] = run
+                    run.future = asyncio.run_coroutine_threadsafe(self._run_update(run), loop)
+        finally:
+            with self._condition:
+                for run in self._in_flight.values():
+                    if run.future is not None:
+                        run.future.cancel()
+                self._in_flight.clear()
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join(timeout=1)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            pending: set[asyncio.Task[typing.Any]] = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+
+    def _run_watchdog(self) -> None:
+        """Report updates that overran their timeout (or STALL_THRESHOLD) once, with their stack, in the log"""
+        stop_event: threading.Event = self._widget_container.stop_event
+        while not stop_event.wait(self.WATCHDOG_INTERVAL):
+            now: float = time_module.monotonic()
+            with self._condition:
+                stalled: list[UpdateRun] = [
+                    run for run in self._in_flight.values()
+                    if not run.reported_stall and now - run.started > (run.timeout or self.STALL_THRESHOLD)
+                ]
+                for run in stalled:
+                    run.reported_stall = True
+            for run in stalled:
+                self._log_stalled_update(run, now - run.started)
+
+    def _log_stalled_update(self, run: UpdateRun, duration: float) -> None:
+        self._widget_container.log_messages.add_log_message(LogMessage(
+            f'Update of widget "{run.widget.name}" stalled for {duration:.1f}s, stack:\n{run.format_stack()}',
+            LogLevels.WARNING.key,
+            LogErrorFoundBy.RUNTIME.value
+        ))
+
+    def _call_update(self, run: UpdateRun) -> list[str]:
+        """Runs on a pool worker"""
+        run.thread_ident = threading.get_ident()
+        return run.widget.update(self._widget_container)
+
+    async def _await_update(self, run: UpdateRun) -> list[str]:
+        """Coroutine update functions are awaited, plain ones run on the worker pool; both within run.timeout"""
+        if run.widget.has_async_update():
+            run.task = asyncio.ensure_future(run.widget.update_async(self._widget_container))
+        else:
+            run.call = self._pool.submit(self._call_update, run)
+            run.task = asyncio.wrap_future(run.call)
+        update: asyncio.Future[list[str]] = run.task
+        update.add_done_callback(lambda future: future.cancelled() or future.exception())  # Never log unretrieved
+        try:
+            done, _pending = await asyncio.wait({update}, timeout=run.timeout)
+        finally:
+            if not update.done():
+                update.cancel()  # Overran, or the scheduler was stopped
+        if not done:
+            with self._condition:
+                report: bool = not run.reported_stall
+                run.reported_stall = True
+            if report:
+                self._log_stalled_update(run, time_module.monotonic() - run.started)
+            if run.thread_ident is not None:
+                self._pool.abandon_worker(run.thread_ident)  # The call can't be interrupted, free its slot
+            raise WidgetUpdateTimeout(typing.cast(int | float, run.timeout))
+        return update.result()
+
+    async def _run_update(self, run: UpdateRun) -> None:
+        widget: Widget = run.widget
+        widget_container: WidgetContainer = self._widget_container
+        next_update: float = run.started + widget.interval  # type: ignore[operator]  # See widget.updatable()
+        error: LogMessages | str | None = None
+        widget.circuit_breaker.before_attempt()
+        try:
+            draw_data: list[str] = await self._await_update(run)
+            widget.circuit_breaker.record_success()
+            widget.publish(draw_data)
+            widget.last_updated = run.started
+        except WidgetNoUpdateFunction:
+            pass
+        except ConfigSpecificException as e:
+            error = e.log_messages
+        except Exception as e:
+            error = str(e)
+
+        if error is not None:
+            next_update = time_module.monotonic() + widget.circuit_breaker.record_failure(widget_container.base_config)
+            # Keep the last good lines
+            widget.publish(widget.snapshot.lines, error, widget.circuit_breaker.status())
+        widget_container.wake_up()
+
+        if run.call is not None and not run.call.done():
+            # Abandoned after a timeout, but still running: keep the widget out of the queue until the call returned
+            run.call.add_done_callback(lambda _call: self._finish_update(run, next_update))
+        else:
+            self._finish_update(run, next_update)
+
+    def _finish_update(self, run: UpdateRun, next_update: float) -> None:
+        with self._condition:
+            if self._in_flight.get(run.widget) is not run:
+                return  # The scheduler was stopped meanwhile
+            del self._in_flight[run.widget]
+            if run.widget in self._active_widgets and run.widget not in self._entries:
+                self._push(run.widget, next_update)
+
+
+# endregion Scheduler
+
+# region Persistence
+
+class SnapshotStore:
+    """Keeps the last successful update of every widget on disk (lines and its persistent_keys of internal_data).
+
+    At startup, they are restored as stale snapshots, so widgets show their last data instead of "Loading..." until
+    their first update finishes. Entries of widgets whose configuration changed since are ignored. The file is
+    pickled (internal_data can hold any object, e.g. parsed feed entries), so it's only ever read from the user's
+    own config directory. Every entry is pickled on its own, a widget whose data can't be pickled only loses its own
+    snapshot.
+    """
+    FORMAT_VERSION: int = 2
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path: pathlib.Path = path
+        self._entries: dict[str, dict[str, typing.Any]] = {}
+
+    def restore(self, widgets: list[Widget]) -> None:
+        self._entries = self._load()
+        for widget in widgets:
+            entry: dict[str, typing.Any] | None = self._entries.get(str(widget.name))
+            if entry is None or entry['config_hash'] != widget.config.config_hash or not widget.updatable():
+                continue
+            widget.internal_data.update(entry['internal_data'])
+            widget.snapshot = WidgetSnapshot(entry['lines'], None, '', 1, entry['timestamp'], stale=True)
+
+    def save(self, widgets: list[Widget], log_messages: LogMessages | None = None) -> None:
+        entries: dict[str, dict[str, typing.Any]] = {}
+        for widget in widgets:
+            snapshot: WidgetSnapshot = widget.snapshot
+            if snapshot.stale or snapshot.error is not None or not snapshot.lines:
+                # Nothing new, keep the previous entry (if the configuration is still the same)
+                previous: dict[str, typing.Any] | None = self._entries.get(str(widget.name))
+                if previous is not None and previous['config_hash'] == widget.config.config_hash:
+                    entries[str(widget.name)] = previous
+                continue
+            entries[str(widget.name)] = {
+                'config_hash': widget.config.config_hash,
+                'lines': snapshot.lines,
+                'timestamp': snapshot.timestamp,
+                'internal_data': {
+                    key: widget.internal_data[key] for key in widget.persistent_keys if key in widget.internal_data
+                },
+            }
+
+        pickled_entries: dict[str, bytes] = {}
+        for name, entry in list(entries.items()):
+            try:
+                pickled_entries[name] = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:  # PicklingError, TypeError, AttributeError, RecursionError, ...
+                del entries[name]  # This widget shows "Loading..." next time
+                if log_messages is not None:
+                    log_messages.add_log_message(LogMessage(
+                        f'Data of "{name}" widget could not be saved ({type(e).__name__}: {e})',
+                        LogLevels.WARNING.key
+                    ))
+
+        temporary_path: pathlib.Path = self.path.with_suffix('.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                pickle.dump((self.FORMAT_VERSION, pickled_entries), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.path)
+        except OSError:
+            try:
+                temporary_path.unlink()
+            except OSError:
+                pass
+            # Not persisted, widgets show "Loading..." next time
+        self._entries = entries
+
+    def _load(self) -> dict[str, dict[str, typing.Any]]:
+        try:
+            with open(self.path, 'rb') as file:
+                format_version, pickled_entries = pickle.load(file)
+        except Exception:  # Missing, truncated or written by an incompatible version
+            return {}
+        if format_version != self.FORMAT_VERSION or not isinstance(pickled_entries, dict):
+            return {}
+
+        entries: dict[str, dict[str, typing.Any]] = {}
+        for name, pickled_entry in pickled_entries.items():
+            try:
+                entries[name] = pickle.loads(pickled_entry)
+            except Exception:  # E.g. refers to a class that no longer exists, only this widget starts empty
+                continue
+        return entries
+
+
+FileSignature = tuple[int, int, int] | None  # Inode, mtime (ns), size; None if the file doesn't exist
+
+
+def file_signature(path: pathlib.Path) -> FileSignature:
+    """Changes whenever the file is written or replaced"""
+    try:
+        stat: os.stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class JournalStore:
+    """A JSON object (dict[str, typing.Any]) kept in memory, stored as the JSON file itself plus an append-only journal
+    next to it (path + '.journal', one ["set", key, value] / ["del", key] line per change).
+
+    A change costs one appended line, regardless of the amount of entries. After compact_after journal lines, the
+    whole object is written to a temporary file and atomically renamed over the JSON file (and the journal removed),
+    so a crash can't truncate it; An incomplete last journal line is ignored. Both files are only read again when
+    their inode, mtime or size changed (e.g. edited by hand or by another twidgets instance), see refresh().
+    """
+    def __init__(self, path: pathlib.Path, compact_after: int = 1000) -> None:
+        self.path: pathlib.Path = path
+        self.journal_path: pathlib.Path = path.with_name(path.name + '.journal')
+        self.compact_after: int = compact_after
+        self.data: dict[str, typing.Any] = {}
+        self._journal_lines: int = 0
+        self._signatures: tuple[FileSignature, FileSignature] | None = None  # Of the files, as last read / written
+
+    def refresh(self) -> bool:
+        """Reload if the files changed since they were last read / written, returns whether they were reloaded"""
+        signatures: tuple[FileSignature, FileSignature] = (
+            file_signature(self.path), file_signature(self.journal_path)
+        )
+        if signatures == self._signatures:
+            return False
+        self._load()
+        return True
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r') as file:
+                data: typing.Any = json.load(file)
+        except (OSError, ValueError):
+            data = {}
+        self.data = data if isinstance(data, dict) else {}
+
+        self._journal_lines = 0
+        corrupt: bool = False
+        try:
+            with open(self.journal_path, 'r') as file:
+                for line in file:
+                    try:
+                        entry: typing.Any = json.loads(line)
+                        if entry[0] == 'set':
+                            self.data[str(entry[1])] = entry[2]
+                        elif entry[0] == 'del':
+                            self.data.pop(str(entry[1]), None)
+                    except (ValueError, IndexError, TypeError, KeyError):
+                        corrupt = True  # Interrupted write, changes after it can't be trusted either
+                        break
+                    self._journal_lines += 1
+        except OSError:
+            pass
+        self._signatures = file_signature(self.path), file_signature(self.journal_path)
+        if corrupt:
+            self.compact()  # Rewrite without the broken line, so new changes aren't appended after it
+
+    def set(self, key: str, value: typing.Any) -> None:
+        self.data[key] = value
+        self._append(['set', key, value])
+
+    def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+        self._append(['del', key])
+
+    def _append(self, entry: list[typing.Any]) -> None:
+        if self._journal_lines >= self.compact_after:
+            self.compact()
+            return
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, 'a') as file:
+            file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self._journal_lines += 1
+        self._signatures = self._signatures[0] if self._signatures else None, file_signature(self.journal_path)
+
+    def compact(self) -> None:
+        temporary_path: pathlib.Path = self.path.with_name(self.path.name + '.tmp')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_path, 'w') as file:
+            json.dump(self.data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)  # The journal is replayed onto the new file if removing it fails
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._journal_lines = 0
+        self._signatures = file_signature(self.path), None
+
+
+class ConfigCache:
+    """Parsed configuration files (base.yaml, widget configs), so unchanged YAML is never parsed twice.
+
+    Entries are keyed by path and only used while the file's inode, mtime and size are unchanged. They are kept for
+    the whole process (see shared(), reloads don't parse anything) and pickled to path (warm starts don't either).
+    Entries are stored pickled, every load returns a new copy.
+    """
+    FORMAT_VERSION: int = 1
+    _shared: ConfigCache | None = None
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path: pathlib.Path | None = path  # None: Only kept in memory
+        self._entries: dict[str, tuple[FileSignature, bytes]] | None = None  # Read from path on first use
+        self._changed: bool = False
+
+    @classmethod
+    def shared(cls, path: pathlib.Path) -> ConfigCache:
+        if cls._shared is None or cls._shared.path != path:
+            cls._shared = cls(path)
+        return cls._shared
+
+    def load(
+            self, path: pathlib.Path, parse: typing.Callable[[pathlib.Path], dict[typing.Any, typing.Any]]
+    ) -> dict[typing.Any, typing.Any]:
+        """The parsed file, parse(path) only runs if the file changed since it was cached"""
+        if self._entries is None:
+            self._entries = self._read()
+        signature: FileSignature = file_signature(path)  # Before parsing, a concurrent edit parses again
+        entry: tuple[FileSignature, bytes] | None = self._entries.get(str(path))
+        if entry is not None and signature is not None and entry[0] == signature:
+            try:
+                return typing.cast(dict[typing.Any, typing.Any], pickle.loads(entry[1]))
+            except Exception:
+                pass  # Written by an incompatible version, parse again
+
+        data: dict[typing.Any, typing.Any] = parse(path)  # Errors aren't cached
+        self._entries[str(path)] = signature, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        self._changed = True
+        return data
+
+    def save(self) -> None:
+        if self.path is None or not self._changed or self._entries is None:
+            return
+        temporary_path: pathlib.Path = self.path.with_suffix('.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                pickle.dump((self.FORMAT_VERSION, self._entries), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.path)
+            self._changed = False
+        except OSError:
+            pass  # Parsed again next time
+
+    def _read(self) -> dict[str, tuple[FileSignature, bytes]]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, 'rb') as file:
+                format_version, entries = pickle.load(file)
+        except Exception:  # Missing, truncated or written by an incompatible version
+            return {}
+        if format_version != self.FORMAT_VERSION or not isinstance(entries, dict):
+            return {}
+        return entries
+
+
+class WidgetState(typing.NamedTuple):
+    """What a widget carries over to the next WidgetContainer on a reload (see ReloadCache)"""
+    module: types.ModuleType | None
+    config_hash: str
+    secrets_hash: str
+    snapshot: WidgetSnapshot
+    internal_data: dict[typing.Any, typing.Any]
+    last_updated: int | float | None
+    circuit_breaker: CircuitBreaker
+
+
+class ReloadCache:
+    """Survives reloads (RestartException) within one process: widget modules whose source file didn't change are
+    not imported again, and widgets built from them with an unchanged configuration keep their data, internal_data,
+    update time and backoff state. So the scheduler doesn't fetch everything again after a reload.
+    """
+    _shared: ReloadCache | None = None
+
+    def __init__(self) -> None:
+        self._modules: dict[pathlib.Path, tuple[tuple[int, int], types.ModuleType]] = {}
+        self._widget_states: dict[str, WidgetState] = {}
+
+    @classmethod
+    def shared(cls) -> ReloadCache:
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def module(self, path: pathlib.Path) -> types.ModuleType | None:
+        """The module imported from path before, None if it was edited since (or never imported)"""
+        cached: tuple[tuple[int, int], types.ModuleType] | None = self._modules.get(path)
+        if cached is None or cached[0] != self._signature(path):
+            return None
+        return cached[1]
+
+    def store_module(self, path: pathlib.Path, module: types.ModuleType) -> None:
+        self._modules[path] = (self._signature(path), module)
+
+    def save_widgets(self, widgets: list[Widget], secrets_hash: str) -> None:
+        self._widget_states = {
+            str(widget.name): WidgetState(
+                widget.module, widget.config.config_hash, secrets_hash, widget.snapshot,
+                widget.internal_data, widget.last_updated, widget.circuit_breaker
+            ) for widget in widgets
+        }
+
+    def restore_widgets(self, widgets: list[Widget], secrets_hash: str) -> list[Widget]:
+        """Hand the saved state to widgets with unchanged source, configuration and secrets, returns those widgets"""
+        restored: list[Widget] = []
+        for widget in widgets:
+            state: WidgetState | None = self._widget_states.pop(str(widget.name), None)
+            if state is None or state.module is None or state.module is not widget.module \
+                    or state.config_hash != widget.config.config_hash or state.secrets_hash != secrets_hash:
+                continue
+            widget.snapshot = state.snapshot
+            widget.internal_data = state.internal_data
+            widget.last_updated = state.last_updated
+            widget.circuit_breaker = state.circuit_breaker
+            restored.append(widget)
+        self._widget_states = {}
+        return restored
+
+    @staticmethod
+    def _signature(path: pathlib.Path) -> tuple[int, int]:
+        try:
+            stat: os.stat_result = path.stat()
+        except OSError:
+            return -1, -1
+        return stat.st_mtime_ns, stat.st_size
+
+
+# endregion Persistence
+
 # region Custom Exceptions
 
 # Twidget Exception Superclass
@@ -1309,6 +2872,17 @@ class WidgetNoUpdateFunction(ConfigException):
     """Raised to signal that no update function is available"""
 
 
+# Update Exceptions
+class WidgetUpdateTimeout(TWidgetException):
+    """Raised when an update function overran the widget's update_timeout"""
+    def __init__(self, timeout: int | float) -> None:
+        self.timeout: int | float = timeout
+        super().__init__(str(timeout))
+
+    def __str__(self) -> str:
+        return f'Update timed out after {self.timeout}s'
+
+
 # Unknown & Debug Exceptions
 class UnknownException(TWidgetException):
     """Raised instead of Exception to keep log messages and the initial exception that caused UnknownException"""
@@ -1360,13 +2934,18 @@ class LogLevels(enum.Enum):
 
 class LogMessage:
     def __init__(self, message: str, level: int, error_found_by: str | None = None) -> None:
-        self.log_time: datetime.datetime = datetime.datetime.now()
+        self.log_time: datetime.datetime = datetime.datetime.now()  # First seen
+        self.last_seen: datetime.datetime = self.log_time
+        self.count: int = 1  # Occurrences, equal messages are merged by LogMessages
         self.message: str = message
         self.level: int = level
         self.error_found_by: str | None = error_found_by
 
     def __str__(self) -> str:
-        return f'{self.log_time.strftime("%H:%M:%S")}: {self.message} (found {self.error_found_by})'
+        text: str = f'{self.log_time.strftime("%H:%M:%S")}: {self.message} (found {self.error_found_by})'
+        if self.count > 1:
+            text += f' ({self.count}x, last at {self.last_seen.strftime("%H:%M:%S")})'
+        return text
 
     def __repr__(self) -> str:
         return self.message
@@ -1378,6 +2957,9 @@ class LogMessage:
             return True
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.message, self.level))
+
     def is_error(self) -> bool:
         if self.level == LogLevels.ERROR.key:
             return True
@@ -1385,15 +2967,29 @@ class LogMessage:
 
 
 class LogMessages:
-    def __init__(self, log_messages: list[LogMessage] | None = None) -> None:
-        if log_messages is None:
-            self.log_messages: list[LogMessage] = []
-        else:
-            self.log_messages = log_messages
+    """Log messages in insertion order, indexed by (message, level).
+
+    Adding an equal message again counts it as another occurrence instead of storing a duplicate. At most
+    max_log_messages are kept, the least recently seen message is dropped first.
+    """
+    DEFAULT_MAX_LOG_MESSAGES: int = 1000
+
+    def __init__(self, log_messages: list[LogMessage] | None = None, max_log_messages: int | None = None) -> None:
+        self._log_messages: dict[LogMessage, LogMessage] = {}  # Copies of the added messages, by last occurrence
+        self._lock: threading.Lock = threading.Lock()  # Messages are added by the scheduler thread as well
+        self.max_log_messages: int = max_log_messages or self.DEFAULT_MAX_LOG_MESSAGES
+        self.evicted: int = 0
+        for log_message in log_messages or []:
+            self.add_log_message(log_message)
+
+    @property
+    def log_messages(self) -> list[LogMessage]:
+        return list(self._log_messages.values())
 
     def __add__(self, other: LogMessages) -> LogMessages:
-        new_log: LogMessages = LogMessages()
-        new_log.log_messages = self.log_messages + other.log_messages
+        new_log: LogMessages = LogMessages(max_log_messages=max(self.max_log_messages, other.max_log_messages))
+        for log_message in [*self, *other]:
+            new_log.add_log_message(log_message)
         return new_log
 
     def __eq__(self, other: object) -> bool:
@@ -1407,35 +3003,45 @@ class LogMessages:
         return self.log_messages != other.log_messages
 
     def __contains__(self, item: LogMessage) -> bool:
-        for log_message in list(self.log_messages):
-            if log_message == item:
-                return True
-        return False
+        return item in self._log_messages
 
     def __iter__(self) -> collections.abc.Iterator[LogMessage]:
-        return iter(self.log_messages)
+        return iter(self.log_messages)  # Copy, other threads may add messages meanwhile
+
+    def __len__(self) -> int:
+        return len(self._log_messages)
 
     def add_log_message(self, message: LogMessage) -> None:
-        if message not in self.log_messages:
-            self.log_messages.append(message)
+        """Every call counts as message.count new occurrence(s). Stores a copy, message itself is never changed (it
+        may be part of other LogMessages as well)"""
+        with self._lock:
+            existing: LogMessage | None = self._log_messages.pop(message, None)
+            if existing is None:
+                existing = copy.copy(message)
+            else:
+                existing.count += message.count
+                existing.last_seen = max(existing.last_seen, message.last_seen)
+            self._log_messages[existing] = existing
+
+            while len(self._log_messages) > self.max_log_messages:
+                oldest: LogMessage = next(iter(self._log_messages))
+                del self._log_messages[oldest]
+                self.evicted += 1
 
     def print_log_messages(self, heading: str) -> None:
-        if not self.log_messages:
+        if not self._log_messages:
             return
 
         print(heading, end='')
-        log_messages_by_level: dict[int, list[LogMessage]] = {}
-        for message in self.log_messages:
-            if message.level in log_messages_by_level.keys():
-                log_messages_by_level[message.level].append(message)
-            else:
-                log_messages_by_level[message.level] = [message]
-
-        for level in sorted(log_messages_by_level.keys()):
-            if log_messages_by_level[level]:
-                print(f'\n{LogLevels.from_key(level).label}:')
-                for message in log_messages_by_level[level]:
-                    print(message)
+        sorted_messages: list[LogMessage] = sorted(
+            self._log_messages.values(), key=lambda log_message: (log_message.level, log_message.log_time)
+        )
+        for level, messages in itertools.groupby(sorted_messages, key=lambda log_message: log_message.level):
+            print(f'\n{LogLevels.from_key(level).label}:')
+            for message in messages:
+                print(message)
+        if self.evicted:
+            print(f'\n({self.evicted} older messages were dropped)')
 
     def contains_error(self) -> bool:
         for message in self.log_messages:
@@ -1444,7 +3050,7 @@ class LogMessages:
         return False
 
     def is_empty(self) -> bool:
-        if self.log_messages:
+        if self._log_messages:
             return False
         return True
 
@@ -1456,6 +3062,7 @@ class LogMessages:
 class WidgetLoader:
     def __init__(self, widget_container: WidgetContainer) -> None:
         self._test_env = widget_container.test_env
+        self._reload_cache: ReloadCache = widget_container.reload_cache
         if self._test_env:
             self.PY_WIDGET_DIR = widget_container.SCRIPT_DIR_PY_WIDGET_DIR
         else:
@@ -1463,52 +3070,66 @@ class WidgetLoader:
 
     def discover_custom_widgets(self) -> list[str]:
         """Discover user-defined widgets in ~/.config/twidgets/py_widgets/*_widget.py"""
-        widget_names: list[str] = []
-        if not self.PY_WIDGET_DIR.exists():
-            return widget_names
-
-        for file in self.PY_WIDGET_DIR.iterdir():
-            if file.is_file() and file.name.endswith('_widget.py'):
-                widget_name = file.stem.replace('_widget', '')
-                widget_names.append(widget_name)
+        return [module_name.replace('_widget', '') for module_name in self.widget_files()]
 
-        return widget_names
-
-    def load_custom_widget_modules(self) -> dict[str, types.ModuleType]:
-        """Load custom widgets dynamically from files"""
-        modules: dict[str, types.ModuleType] = {}
+    def widget_files(self) -> dict[str, pathlib.Path]:
+        """Source files of all widgets by module name (e.g. 'clock_widget'), nothing is imported"""
         if not self.PY_WIDGET_DIR.exists():
-            return modules
+            return {}
+        return {
+            file.stem: file for file in self.PY_WIDGET_DIR.iterdir()
+            if file.is_file() and file.name.endswith('_widget.py')
+        }
 
-        for file in self.PY_WIDGET_DIR.iterdir():
-            widget_name = ''
-            try:
-                if file.is_file() and file.name.endswith('_widget.py'):
-                    # widget_name = file.stem.replace('_widget', '')
-                    widget_name = file.stem
-
-                    spec = importlib.util.spec_from_file_location(widget_name, file)
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[widget_name] = module
-                        spec.loader.exec_module(module)
-                        modules[widget_name] = module
-            except Exception as e:
-                raise WidgetSourceFileException(LogMessages(
-                    [LogMessage(f'Error loading widget {widget_name}: {e}', LogLevels.ERROR.key)]
-                ))
+    def load_widget_configs(self, widget_container: WidgetContainer) -> dict[str, Config]:
+        """Configs of all widgets by module name, read before any widget module is imported"""
+        return {
+            module_name: widget_container.config_loader.load_widget_config(
+                widget_container, module_name, LogErrorFoundBy.RUNTIME.value
+            ) for module_name in self.widget_files()
+        }
 
+    def load_custom_widget_modules(self, module_names: list[str] | None = None) -> dict[str, types.ModuleType]:
+        """Load custom widgets dynamically from files, only module_names if given (e.g. the enabled widgets)"""
+        modules: dict[str, types.ModuleType] = {}
+        for module_name, file in self.widget_files().items():
+            if module_names is not None and module_name not in module_names:
+                continue
+            module: types.ModuleType | None = self.load_custom_widget_module(module_name, file)
+            if module is not None:
+                modules[module_name] = module
         return modules
 
+    def load_custom_widget_module(self, module_name: str, file: pathlib.Path) -> types.ModuleType | None:
+        try:
+            module: types.ModuleType | None = self._reload_cache.module(file)
+            if module is not None:  # Unchanged since the last (re)load
+                sys.modules[module_name] = module
+                return module
+
+            spec = importlib.util.spec_from_file_location(module_name, file)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                self._reload_cache.store_module(file, module)
+                return module
+        except Exception as e:
+            raise WidgetSourceFileException(LogMessages(
+                [LogMessage(f'Error loading widget {module_name}: {e}', LogLevels.ERROR.key)]
+            ))
+        return None
+
     @staticmethod
-    def build_widgets(widget_container: WidgetContainer, modules: dict[str, types.ModuleType]) -> list[Widget]:
+    def build_widgets(
+            widget_container: WidgetContainer, modules: dict[str, types.ModuleType], configs: dict[str, Config]
+    ) -> list[Widget]:
         widgets: dict[str, Widget] = {}
         for name, module in modules.items():
-            widget_config: Config = widget_container.config_loader.load_widget_config(
-                widget_container, name, LogErrorFoundBy.RUNTIME.value
-            )
+            widget_config: Config = configs[name]
             try:
-                widgets[name] = module.build(widget_container.stdscr, widget_config)
+                widgets[name] = module.build(widget_container.compositor, widget_config)
+                widgets[name].module = module
             except Exception:
                 raise WidgetSourceFileException(
                     LogMessages([LogMessage(
@@ -1520,11 +3141,20 @@ class WidgetLoader:
 
 
 class ConfigLoader:
+    """Every configuration file is parsed at most once (see ConfigCache) and validated once per WidgetContainer: The
+    ConfigScanner, the WidgetContainer and the WidgetLoader share the same BaseConfig / Config objects.
+    """
+    # libyaml's parser (written in C) if PyYAML was built with it, several times faster than the pure Python one
+    YAML_LOADER: typing.Any = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
     def __init__(self, widget_container: WidgetContainer) -> None:
         self.SCRIPT_DIR = widget_container.SCRIPT_DIR
         self.CONFIG_DIR = widget_container.ROOT_CONFIG_DIR
         self.PER_WIDGET_CONFIG_DIR = widget_container.ROOT_PER_WIDGET_CONFIG_DIR
         self._test_env = widget_container.test_env
+        self.config_cache: ConfigCache = widget_container.config_cache
+        self._base_config: tuple[BaseConfig, LogMessages] | None = None
+        self._widget_configs: dict[str, Config] = {}
         if self._test_env:
             dotenv.load_dotenv(self.SCRIPT_DIR / 'config' / f'secrets.env.example')
         else:
@@ -1536,19 +3166,46 @@ class ConfigLoader:
         else:
             dotenv.load_dotenv(self.CONFIG_DIR / 'secrets.env', override=True)
 
+    def secrets_hash(self) -> str:
+        """Changes whenever secrets.env changes"""
+        path: pathlib.Path = self.CONFIG_DIR / 'secrets.env'
+        if self._test_env:
+            path = self.SCRIPT_DIR / 'config' / 'secrets.env.example'
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return ''
+
     @staticmethod
     def get_secret(name: str, default: typing.Any = None) -> str | None:
         return os.getenv(name, default)
 
-    @staticmethod
-    def load_yaml(path: pathlib.Path) -> dict[typing.Any, typing.Any]:
+    @classmethod
+    def parse_yaml(cls, path: pathlib.Path) -> dict[typing.Any, typing.Any]:
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=cls.YAML_LOADER) or {}
         except yaml.scanner.ScannerError:
             raise YAMLParseException(f'Config for path "{path}" not valid YAML')
 
+    def load_yaml(self, path: pathlib.Path) -> dict[typing.Any, typing.Any]:
+        return self.config_cache.load(path, self.parse_yaml)
+
     def load_base_config(self, log_messages: LogMessages, error_found_by: str) -> BaseConfig:
+        """Validated on the first call, every call adds the log messages of that validation to log_messages (labelled
+        with its own error_found_by)"""
+        if self._base_config is None:
+            base_log_messages: LogMessages = LogMessages()
+            self._base_config = self._load_base_config(base_log_messages, error_found_by), base_log_messages
+
+        base_config, base_log_messages = self._base_config
+        for log_message in base_log_messages:
+            found_by_caller: LogMessage = copy.copy(log_message)
+            found_by_caller.error_found_by = error_found_by
+            log_messages.add_log_message(found_by_caller)
+        return base_config
+
+    def _load_base_config(self, log_messages: LogMessages, error_found_by: str) -> BaseConfig:
         base_path = self.CONFIG_DIR / 'base.yaml'
         if self._test_env:
             # Fallback completely to BaseStandardFallbackConfig
@@ -1567,8 +3224,19 @@ class ConfigLoader:
         )
 
     def load_widget_config(self, widget_container: WidgetContainer, widget_name: str, error_found_by: str) -> Config:
+        """Validated on the first call, later calls return the same Config.
+
+        Validation messages are logged once, labelled with the error_found_by of the first call (usually the
+        ConfigScanner, which is the one that found them); later calls don't log them again.
+        """
         config_name: str = widget_name.replace('_widget', '')
+        config: Config | None = self._widget_configs.get(config_name)
+        if config is None:
+            config = self._load_widget_config(widget_container, config_name, error_found_by)
+            self._widget_configs[config_name] = config
+        return config
 
+    def _load_widget_config(self, widget_container: WidgetContainer, config_name: str, error_found_by: str) -> Config:
         if self._test_env:
             path = self.SCRIPT_DIR / 'config' / 'widgets' / f'{config_name}.yaml'
             if not path.exists():
@@ -0,0 +1,275 @@
+from __future__ import annotations  # Allows forward references in type hints
+import hashlib
+import json
+import os
+import pathlib
+import requests
+import requests.adapters
+import urllib3.util
+import atexit
+import threading
+import time as time_module
+import typing
+
+
+# region HTTP
+
+class HttpClient:
+    """HTTP client shared by all widgets (see WidgetContainer.http).
+
+    Keeps connections alive in per-host pools (at most MAX_CONNECTIONS_PER_HOST each), applies DEFAULT_TIMEOUT to
+    every request and retries idempotent requests on connection errors and 429 / 5xx responses. There's a single
+    instance per process (see shared()), so open connections survive reloads.
+    requests.Session isn't thread-safe (cookies, settings), so every thread gets a session of its own (see session);
+    they all share the adapter, whose connection pools are.
+    """
+    DEFAULT_TIMEOUT: tuple[float, float] = (3.05, 5)  # Connect, read (seconds)
+    MAX_HOSTS: int = 16  # Connection pools kept
+    MAX_CONNECTIONS_PER_HOST: int = 4
+    RETRIES: int = 2
+    RETRY_BACKOFF: float = 0.5  # Seconds, doubled for every retry
+    RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    _shared: HttpClient | None = None
+    _shared_lock: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.MAX_HOSTS,
+            pool_maxsize=self.MAX_CONNECTIONS_PER_HOST,
+            pool_block=True,  # Wait for a free connection instead of opening more
+            max_retries=urllib3.util.Retry(
+                total=self.RETRIES,
+                backoff_factor=self.RETRY_BACKOFF,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                raise_on_status=False,  # Return the last response, callers check the status
+            )
+        )
+        self._local: threading.local = threading.local()
+        self._sessions: list[requests.Session] = []
+
+        # Counters
+        self._lock: threading.Lock = threading.Lock()
+        self.requests_sent: int = 0
+        self.failed_requests: int = 0
+        self.bytes_received: int = 0
+        self.cache_hits: int = 0  # get_cached() answered from the cache (fresh or 304 Not Modified)
+
+        self.cache: HttpCache | None = None  # See configure_cache()
+
+    @classmethod
+    def shared(cls) -> HttpClient:
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    def configure_cache(self, directory: pathlib.Path, ttl: float, max_size: int) -> None:
+        """Cache responses of get_cached() in directory, the current cache is kept if the settings didn't change"""
+        with self._lock:
+            cache: HttpCache | None = self.cache
+            if cache is None or (cache.directory, cache.ttl, cache.max_size) != (directory, ttl, max_size):
+                self.cache = HttpCache(directory, ttl, max_size)
+
+    @property
+    def session(self) -> requests.Session:
+        """Session of the calling thread"""
+        session: requests.Session | None = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.DEFAULT_TIMEOUT)
+        try:
+            response: requests.Response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self.requests_sent += 1
+                self.failed_requests += 1
+            raise
+
+        received: int = 0 if kwargs.get('stream') else len(response.content)
+        with self._lock:
+            self.requests_sent += 1
+            self.bytes_received += received
+        return response
+
+    def get(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def get_cached(self, url: str, **kwargs: typing.Any) -> CachedResponse:
+        """GET through the HttpCache: no request at all while the cached response is fresh, a conditional request
+        afterward. Raises requests.exceptions.RequestException on failure (including HTTP error statuses)."""
+        cache: HttpCache | None = self.cache
+        entry: dict[str, typing.Any] | None = cache.lookup(url) if cache is not None else None
+        headers: dict[str, str] = dict(kwargs.pop('headers', None) or {})
+        response: requests.Response | None = None
+
+        if cache is not None and entry is not None:
+            cached_response: CachedResponse | None = None
+            if cache.is_fresh(entry, time_module.time()):
+                cached_response = cache.read(url, entry)
+            else:
+                conditional_headers: dict[str, str] = {}
+                if entry['etag']:
+                    conditional_headers['If-None-Match'] = entry['etag']
+                if entry['last_modified']:
+                    conditional_headers['If-Modified-Since'] = entry['last_modified']
+                response = self.get(url, headers={**headers, **conditional_headers}, **kwargs)
+                if response.status_code == 304:
+                    cached_response = cache.read(url, entry)
+                    if cached_response is not None:
+                        cache.revalidated(url)
+                    response = None  # Body missing on disk, fetch it again
+            if cached_response is not None:
+                with self._lock:
+                    self.cache_hits += 1
+                return cached_response
+
+        if response is None:
+            response = self.get(url, headers=headers, **kwargs)
+        response.raise_for_status()
+        if cache is None:
+            body: bytes = response.content
+            return CachedResponse(body, response.encoding, hashlib.sha256(body).hexdigest(), from_cache=False)
+        return cache.store(url, response)
+
+    def connections_opened(self) -> int:
+        """Connections opened by the pools that are still open"""
+        return sum(pool.num_connections for pool in self._pools())
+
+    def reused_connections(self) -> int:
+        """Requests (including retries) sent over an already open connection, for the pools that are still open"""
+        return sum(max(pool.num_requests - pool.num_connections, 0) for pool in self._pools())
+
+    def _pools(self) -> list[typing.Any]:
+        pools: typing.Any = self._adapter.poolmanager.pools
+        return [pool for pool in (pools.get(key) for key in pools.keys()) if pool is not None]
+
+    def close(self) -> None:
+        with self._lock:
+            sessions: list[requests.Session] = self._sessions
+            self._sessions = []
+        for session in sessions:
+            session.close()
+        self._adapter.close()  # Closed by the sessions as well, unless none was created
+        self._local = threading.local()
+
+
+class CachedResponse(typing.NamedTuple):
+    """Body of a GET request made through HttpClient.get_cached()"""
+    body: bytes
+    encoding: str | None
+    digest: str  # Hash of the body, equal digests mean an unchanged body
+    from_cache: bool  # Served from the HttpCache (still fresh or 304 Not Modified)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class HttpCache:
+    """Persistent cache for GET responses, revalidated with ETag / Last-Modified.
+
+    Bodies are stored as files in `directory`, their headers in index.json. Responses validated less than `ttl`
+    seconds ago are served without a request. If the bodies take more than `max_size` bytes, the least recently used
+    ones are removed.
+    """
+    INDEX_FILE: str = 'index.json'
+
+    def __init__(self, directory: pathlib.Path, ttl: float, max_size: int) -> None:
+        self.directory: pathlib.Path = directory
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self._lock: threading.Lock = threading.Lock()
+        self._index: dict[str, dict[str, typing.Any]] = self._load_index()
+
+    def lookup(self, url: str) -> dict[str, typing.Any] | None:
+        with self._lock:
+            entry: dict[str, typing.Any] | None = self._index.get(url)
+            return dict(entry) if entry is not None else None
+
+    def is_fresh(self, entry: dict[str, typing.Any], now: float) -> bool:
+        return bool(now - entry['validated'] < self.ttl)
+
+    def read(self, url: str, entry: dict[str, typing.Any]) -> CachedResponse | None:
+        try:
+            body: bytes = (self.directory / entry['file']).read_bytes()
+        except OSError:
+            return None  # Removed from disk, fetch it again
+        with self._lock:
+            if url in self._index:
+                self._index[url]['last_used'] = time_module.time()
+        return CachedResponse(body, entry['encoding'], entry['digest'], from_cache=True)
+
+    def revalidated(self, url: str) -> None:
+        """The server answered 304 Not Modified"""
+        with self._lock:
+            if url in self._index:
+                self._index[url]['validated'] = time_module.time()
+                self._save_index()
+
+    def store(self, url: str, response: requests.Response) -> CachedResponse:
+        body: bytes = response.content
+        digest: str = hashlib.sha256(body).hexdigest()
+        cached_response: CachedResponse = CachedResponse(body, response.encoding, digest, from_cache=False)
+        file_name: str = hashlib.sha256(url.encode()).hexdigest()
+        now: float = time_module.time()
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                (self.directory / file_name).write_bytes(body)
+            except OSError:
+                return cached_response  # Not cached
+            self._index[url] = {
+                'file': file_name,
+                'size': len(body),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'encoding': response.encoding,
+                'digest': digest,
+                'validated': now,
+                'last_used': now,
+            }
+            self._evict()
+            self._save_index()
+        return cached_response
+
+    def _evict(self) -> None:
+        size: int = sum(entry['size'] for entry in self._index.values())
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1]['last_used']):
+            if size <= self.max_size:
+                break
+            size -= entry['size']
+            del self._index[url]
+            try:
+                (self.directory / entry['file']).unlink()
+            except OSError:
+                pass
+
+    def _load_index(self) -> dict[str, dict[str, typing.Any]]:
+        try:
+            with open(self.directory / self.INDEX_FILE, 'r') as file:
+                index: typing.Any = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self) -> None:
+        temporary_path: pathlib.Path = self.directory / f'{self.INDEX_FILE}.tmp'
+        try:
+            with open(temporary_path, 'w') as file:
+                json.dump(self._index, file)
+            os.replace(temporary_path, self.directory / self.INDEX_FILE)  # Never leave a half written index
+        except OSError:
+            pass
+
+
+
+# endregion HTTP
@@ -0,0 +1,453 @@
+from __future__ import annotations  # Allows forward references in type hints
+import abc
+import array
+import heapq
+import os
+import psutil
+import shutil
+import sys
+import threading
+import time as time_module
+import typing
+
+
+# region Metrics
+
+class RingBuffer:
+    """Fixed size history of floats in a preallocated array, the oldest value is overwritten when full"""
+    def __init__(self, capacity: int) -> None:
+        self.capacity: int = max(capacity, 1)
+        self._values: array.array[float] = array.array('d', bytes(8 * self.capacity))  # Zeroed doubles
+        self._next: int = 0  # Index the next value is written to
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest(self, default: float = 0.0) -> float:
+        if not self._count:
+            return default
+        return self._values[self._next - 1]
+
+    def values(self, last: int | None = None) -> list[float]:
+        """The last `last` values (default: all), oldest first"""
+        count: int = self._count if last is None else min(last, self._count)
+        start: int = (self._next - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._values[start:start + count].tolist()
+        return self._values[start:].tolist() + self._values[:self._next].tolist()
+
+
+SPARKLINE_BLOCKS: str = ' ▁▂▃▄▅▆▇█'
+
+
+def sparkline(values: list[float], width: int, maximum: float | None = None) -> str:
+    """Block character graph of values, exactly `width` cells wide (right-aligned, newest value on the right).
+
+    If there are more values than cells, every cell shows the maximum of the values it covers, so short peaks stay
+    visible. Values are scaled to `maximum` (default: largest value).
+    """
+    if width <= 0:
+        return ''
+    if len(values) > width:
+        bucket_size: float = len(values) / width
+        values = [
+            max(values[int(cell * bucket_size):max(int((cell + 1) * bucket_size), int(cell * bucket_size) + 1)])
+            for cell in range(width)
+        ]
+    if maximum is None:
+        maximum = max(values, default=0.0)
+    levels: int = len(SPARKLINE_BLOCKS) - 1
+    graph: str = ''.join(
+        SPARKLINE_BLOCKS[min(max(round(value / maximum * levels), 0), levels)] if maximum > 0 else SPARKLINE_BLOCKS[0]
+        for value in values
+    )
+    return graph.rjust(width)
+
+
+class MetricsSampler:
+    """Samples metrics at a fixed rate on a background thread and keeps their history in RingBuffers.
+
+    sample_func returns gauges (recorded as they are) and counters (recorded as rates per second, using the real
+    monotonic time between two samples, not the configured rate). Memory per metric is constant (`capacity` values).
+    """
+    SampleFunction = typing.Callable[[], tuple[dict[str, float], dict[str, float]]]
+
+    def __init__(self, sample_func: SampleFunction, rate: float, capacity: int) -> None:
+        self._sample_func: MetricsSampler.SampleFunction = sample_func
+        self.period: float = 1 / rate
+        self.capacity: int = capacity
+        self.buffers: dict[str, RingBuffer] = {}
+        self._last_counters: dict[str, float] = {}
+        self._last_sample_time: float | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, stop_event: threading.Event) -> None:
+        """Start sampling until stop_event is set (again, with the same history, if a previous run was stopped)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._last_sample_time is None:
+            self.sample()  # First values right away
+        self._thread = threading.Thread(target=self._run, args=(stop_event,), name='twidgets-metrics', daemon=True)
+        self._thread.start()
+
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample(self) -> None:
+        gauges, counters = self._sample_func()
+        now: float = time_module.monotonic()
+        with self._lock:
+            for name, value in gauges.items():
+                self._buffer(name).append(value)
+            if self._last_sample_time is not None and now > self._last_sample_time:
+                elapsed: float = now - self._last_sample_time
+                for name, value in counters.items():
+                    previous: float | None = self._last_counters.get(name)
+                    if previous is not None:
+                        self._buffer(name).append(max(value - previous, 0.0) / elapsed)  # Counters may reset
+            self._last_counters = counters
+            self._last_sample_time = now
+
+    def latest(self, name: str, default: float = 0.0) -> float:
+        with self._lock:
+            buffer: RingBuffer | None = self.buffers.get(name)
+            return buffer.latest(default) if buffer is not None else default
+
+    def history(self, name: str, last: int | None = None) -> list[float]:
+        with self._lock:
+            buffer: RingBuffer | None = self.buffers.get(name)
+            return buffer.values(last) if buffer is not None else []
+
+    def names(self, prefix: str = '') -> list[str]:
+        """Sampled metrics starting with prefix"""
+        with self._lock:
+            return [name for name in self.buffers if name.startswith(prefix)]
+
+    def _buffer(self, name: str) -> RingBuffer:
+        buffer: RingBuffer | None = self.buffers.get(name)
+        if buffer is None:
+            buffer = self.buffers[name] = RingBuffer(self.capacity)
+        return buffer
+
+    def _run(self, stop_event: threading.Event) -> None:
+        next_sample: float = time_module.monotonic() + self.period
+        while not stop_event.wait(max(next_sample - time_module.monotonic(), 0)):
+            self.sample()
+            next_sample += self.period
+            if next_sample < time_module.monotonic():
+                next_sample = time_module.monotonic() + self.period  # Fell behind (e.g. suspended), don't catch up
+
+
+class MemoryUsage(typing.NamedTuple):
+    total: int  # Bytes
+    available: int
+    swap_total: int
+    swap_used: int
+
+
+class SystemMetrics(abc.ABC):
+    """CPU, memory, network and disk metrics (see create(): reads /proc directly on Linux, psutil elsewhere)"""
+    @staticmethod
+    def create() -> SystemMetrics:
+        if sys.platform.startswith('linux'):
+            try:
+                return LinuxSystemMetrics()
+            except OSError:
+                pass  # /proc not available (e.g. sandboxed)
+        return PsutilSystemMetrics()
+
+    @abc.abstractmethod
+    def cpu_percents(self) -> tuple[float, dict[int, float]]:
+        """Busy percentage of all CPUs and of every online core (by core number, cpuN) since the last call"""
+
+    def cpu_percent(self) -> float:
+        return self.cpu_percents()[0]
+
+    @abc.abstractmethod
+    def memory(self) -> MemoryUsage:
+        pass
+
+    @abc.abstractmethod
+    def network_interfaces(self) -> dict[str, tuple[int, int]]:
+        """Bytes sent & received per network interface"""
+
+    def network(self) -> tuple[int, int]:
+        """Total bytes sent & received by all network interfaces"""
+        interfaces: dict[str, tuple[int, int]] = self.network_interfaces()
+        return sum(sent for sent, _ in interfaces.values()), sum(recv for _, recv in interfaces.values())
+
+    @staticmethod
+    def disk_usage(path: str = '/') -> tuple[int, int]:
+        """Total & used bytes of the file system at path"""
+        usage = shutil.disk_usage(path)
+        return usage.total, usage.used
+
+    def close(self) -> None:
+        pass
+
+
+def online_cpus() -> list[int] | None:
+    """Numbers of the online cores (e.g. [0, 1, 3] with cpu2 offline), None if unknown (not on Linux)"""
+    try:
+        with open('/sys/devices/system/cpu/online', 'r', encoding='utf-8') as f:
+            ranges: str = f.read().strip()  # E.g. 0-1,3
+    except OSError:
+        return None
+    cores: list[int] = []
+    for part in filter(None, ranges.split(',')):
+        first, _, last = part.partition('-')
+        cores.extend(range(int(first), int(last or first) + 1))
+    return cores
+
+
+class PsutilSystemMetrics(SystemMetrics):
+    def cpu_percents(self) -> tuple[float, dict[int, float]]:
+        total: float = float(psutil.cpu_percent())
+        percents: list[float] = [float(percent) for percent in psutil.cpu_percent(percpu=True)]
+        # psutil lists the online cores only, so with an offline core their positions aren't their numbers
+        cores: list[int] | None = online_cpus()
+        if cores is None or len(cores) != len(percents):
+            cores = list(range(len(percents)))
+        return total, dict(zip(cores, percents))
+
+    def memory(self) -> MemoryUsage:
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return MemoryUsage(memory.total, memory.available, swap.total, swap.used)
+
+    def network_interfaces(self) -> dict[str, tuple[int, int]]:
+        return {
+            name: (counters.bytes_sent, counters.bytes_recv)
+            for name, counters in psutil.net_io_counters(pernic=True).items()
+        }
+
+
+class LinuxSystemMetrics(SystemMetrics):
+    """Reads /proc/stat, /proc/meminfo and /proc/net/dev without reopening them: the files stay open and are read
+    with preadv() into reusable buffers, only the fields needed are parsed (psutil opens & parses them on every call).
+    """
+    def __init__(self) -> None:
+        self._fds: dict[str, int] = {}
+        self._buffers: dict[str, bytearray] = {}
+        try:
+            for path in ('/proc/stat', '/proc/meminfo', '/proc/net/dev'):
+                self._fds[path] = os.open(path, os.O_RDONLY)
+                self._buffers[path] = bytearray(4096)
+        except OSError:
+            self.close()
+            raise
+        # Busy, total (in clock ticks) of all CPUs (None) & every core (by number)
+        self._last_cpu_times: dict[int | None, tuple[int, int]] = {}
+
+    def _read(self, path: str, until: bytes | None = None) -> bytes:
+        """Content of the file (up to the first occurrence of `until`, if given)"""
+        buffer: bytearray = self._buffers[path]
+        while True:
+            size: int = os.preadv(self._fds[path], [buffer], 0)
+            if size < len(buffer) or (until is not None and buffer.find(until, 0, size) != -1):
+                return bytes(memoryview(buffer)[:size])
+            buffer = self._buffers[path] = bytearray(len(buffer) * 2)  # Didn't fit, kept for the next read
+
+    def _cpu_times(self) -> dict[int | None, tuple[int, int]]:
+        # Leading lines: cpu  user nice system idle iowait irq softirq steal guest guest_nice, then cpu0, cpu1, ...
+        # Offline cores have no line (cpu0, cpu1, cpu3), so cores are keyed by their number, not their position.
+        # The (long) intr line after them isn't needed
+        cpu_times: dict[int | None, tuple[int, int]] = {}
+        for line in self._read('/proc/stat', until=b'\nintr').split(b'\n'):
+            if not line.startswith(b'cpu'):
+                break
+            parts: list[bytes] = line.split()
+            fields: list[int] = [int(field) for field in parts[1:9]]
+            total: int = sum(fields)
+            cpu: int | None = int(parts[0][3:]) if len(parts[0]) > 3 else None
+            cpu_times[cpu] = (total - fields[3] - fields[4], total)  # Idle & iowait aren't busy
+        return cpu_times
+
+    def cpu_percents(self) -> tuple[float, dict[int, float]]:
+        cpu_times: dict[int | None, tuple[int, int]] = self._cpu_times()
+        last: dict[int | None, tuple[int, int]] = self._last_cpu_times
+        self._last_cpu_times = cpu_times
+        percents: dict[int | None, float] = {}
+        for cpu, (busy, total) in cpu_times.items():
+            last_busy, last_total = last.get(cpu, (busy, total))  # First call, or the core just came online
+            percents[cpu] = round((busy - last_busy) * 100 / (total - last_total), 1) if total > last_total else 0.0
+        return percents.pop(None, 0.0), typing.cast(dict[int, float], percents)
+
+    def memory(self) -> MemoryUsage:
+        content: bytes = self._read('/proc/meminfo')
+        values: dict[bytes, int] = {}
+        for key in (b'MemTotal:', b'MemAvailable:', b'SwapTotal:', b'SwapFree:'):
+            start: int = content.find(key)
+            if start == -1:
+                values[key] = 0
+                continue
+            values[key] = int(content[start + len(key):content.find(b'kB', start)]) * 1024
+        return MemoryUsage(
+            values[b'MemTotal:'], values[b'MemAvailable:'],
+            values[b'SwapTotal:'], values[b'SwapTotal:'] - values[b'SwapFree:']
+        )
+
+    def network_interfaces(self) -> dict[str, tuple[int, int]]:
+        interfaces: dict[str, tuple[int, int]] = {}
+        for line in self._read('/proc/net/dev').split(b'\n')[2:]:  # Two header lines
+            name, separator, counters = line.partition(b':')
+            if not separator:
+                continue
+            fields: list[bytes] = counters.split()
+            interfaces[name.strip().decode()] = int(fields[8]), int(fields[0])
+        return interfaces
+
+    def close(self) -> None:
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds = {}
+
+
+class ProcessSample(typing.NamedTuple):
+    pid: int
+    user: str
+    command: str
+    cpu_percent: float  # Of one core, like top
+    rss: int  # Bytes
+
+
+class ProcessScanner:
+    """Top-N processes by CPU or memory usage, scanned incrementally.
+
+    Every step() reads the next slice of the process list (a whole scan is spread over `scan_steps` steps), so the
+    cost per step stays bounded on hosts with thousands of processes. Static fields (command line, user) are read
+    once per process, CPU usage is the delta to the previous sample of that process. Reads /proc directly on Linux,
+    uses psutil elsewhere.
+    """
+    def __init__(self, top: int = 10, sort: str = 'cpu', scan_steps: int = 1) -> None:
+        self.top: int = top
+        self.sort: str = sort  # 'cpu' or 'memory'
+        self.scan_steps: int = max(scan_steps, 1)
+        self.proc: bool = sys.platform.startswith('linux') and os.path.isdir('/proc')
+        self.clock_ticks: int = os.sysconf('SC_CLK_TCK') if self.proc else 100
+        self.page_size: int = os.sysconf('SC_PAGE_SIZE') if self.proc else 4096
+
+        self._pending: list[int] = []  # PIDs left in the current scan
+        self._step_size: int = 0
+        self._samples: dict[int, ProcessSample] = {}  # Latest sample of every live process
+        self._cpu_times: dict[int, tuple[float, float]] = {}  # PID -> (CPU seconds, monotonic time)
+        self._static: dict[int, tuple[int, str, str]] = {}  # PID -> (start time, user, command)
+        self._users: dict[int, str] = {}  # UID -> name
+
+    def step(self) -> list[ProcessSample]:
+        """Scans the next slice of processes and returns the current top-N"""
+        if not self._pending:
+            self._start_scan()
+        batch: list[int] = self._pending[-self._step_size:]
+        del self._pending[-self._step_size:]
+
+        for pid in batch:
+            try:
+                sample: ProcessSample | None = self._read(pid)
+            except (OSError, ValueError, IndexError, psutil.Error):
+                sample = None  # Exited (or no permission)
+            if sample is None:
+                self._forget(pid)
+            else:
+                self._samples[pid] = sample
+        return self.top_processes()
+
+    def top_processes(self) -> list[ProcessSample]:
+        key: typing.Callable[[ProcessSample], float] = (
+            (lambda sample: sample.rss) if self.sort == 'memory' else (lambda sample: sample.cpu_percent)
+        )
+        return heapq.nlargest(self.top, self._samples.values(), key=key)  # Bounded heap of size top
+
+    def _start_scan(self) -> None:
+        pids: list[int] = (
+            [int(name) for name in os.listdir('/proc') if name.isdigit()] if self.proc else psutil.pids()
+        )
+        alive: set[int] = set(pids)
+        for pid in [pid for pid in self._samples if pid not in alive]:
+            self._forget(pid)
+        self._pending = pids
+        self._step_size = -(-len(pids) // self.scan_steps)  # Ceiling division
+
+    def _forget(self, pid: int) -> None:
+        self._samples.pop(pid, None)
+        self._cpu_times.pop(pid, None)
+        self._static.pop(pid, None)
+
+    def _cpu_percent(self, pid: int, cpu_seconds: float) -> float:
+        now: float = time_module.monotonic()
+        previous: tuple[float, float] | None = self._cpu_times.get(pid)
+        self._cpu_times[pid] = cpu_seconds, now
+        if previous is None or now <= previous[1]:
+            return 0.0
+        return round(max(cpu_seconds - previous[0], 0.0) * 100 / (now - previous[1]), 1)
+
+    def _user(self, uid: int) -> str:
+        user: str | None = self._users.get(uid)
+        if user is None:
+            try:
+                import pwd  # Unix only
+                user = pwd.getpwuid(uid).pw_name
+            except (ImportError, KeyError):
+                user = str(uid)
+            self._users[uid] = user
+        return user
+
+    def _read(self, pid: int) -> ProcessSample | None:
+        if not self.proc:
+            return self._read_psutil(pid)
+
+        fd: int = os.open(f'/proc/{pid}/stat', os.O_RDONLY)
+        try:
+            stat: bytes = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+        # pid (comm) state ppid ... - comm may contain spaces & parentheses
+        comm_end: int = stat.rfind(b')')
+        fields: list[bytes] = stat[comm_end + 2:].split()
+        cpu_seconds: float = (int(fields[11]) + int(fields[12])) / self.clock_ticks  # utime + stime
+        start_time: int = int(fields[19])
+        rss: int = int(fields[21]) * self.page_size
+
+        static: tuple[int, str, str] | None = self._static.get(pid)
+        if static is None or static[0] != start_time:  # New process (or the PID got reused)
+            with open(f'/proc/{pid}/cmdline', 'rb') as file:
+                command: str = file.read().replace(b'\0', b' ').strip().decode(errors='replace')
+            if not command:  # Kernel thread
+                command = '[' + stat[stat.find(b'(') + 1:comm_end].decode(errors='replace') + ']'
+            static = start_time, self._user(os.stat(f'/proc/{pid}').st_uid), command
+            self._static[pid] = static
+            self._cpu_times.pop(pid, None)
+
+        return ProcessSample(pid, static[1], static[2], self._cpu_percent(pid, cpu_seconds), rss)
+
+    def _read_psutil(self, pid: int) -> ProcessSample | None:
+        process: psutil.Process = psutil.Process(pid)
+        with process.oneshot():
+            cpu_times = process.cpu_times()
+            start_time: int = int(process.create_time())
+            rss: int = process.memory_info().rss
+
+            static: tuple[int, str, str] | None = self._static.get(pid)
+            if static is None or static[0] != start_time:
+                try:
+                    command: str = ' '.join(process.cmdline()) or process.name()
+                    user: str = process.username()
+                except psutil.AccessDenied:
+                    command, user = process.name(), '?'
+                static = start_time, user, command
+                self._static[pid] = static
+                self._cpu_times.pop(pid, None)
+
+        return ProcessSample(
+            pid, static[1], static[2], self._cpu_percent(pid, cpu_times.user + cpu_times.system), rss
+        )
+
+
+# endregion Metrics
@@ -1,9 +1,10 @@
 import os
-import typing
+import time as time_module
 from twidgets.core.base import (
     # Essentials
-    Widget,
+    FloatingWidget,
     WidgetContainer,
+    WidgetSnapshot,
     CursesWindowType,
 
     # Logging
@@ -55,77 +56,84 @@ def main_curses(stdscr: CursesWindowType) -> None:
 
     while True:
         try:
-            key: int = widget_container.stdscr.getch()  # Keypresses
+            for key in widget_container.read_pending_keys():  # Keypresses
+                widget_container.handle_mouse_input(key)
 
-            widget_container.handle_mouse_input(key)
-
-            widget_container.handle_key_input(key)
+                widget_container.handle_key_input(key)
 
             if widget_container.stop_event.is_set():
                 break
 
-            widgets_by_z: dict[int, list[Widget]] = widget_container.return_widgets_ordered_by_z_index()
+            now: float = time_module.time()
+            screen_changed: bool = False
+
+            # Main drawing loop (only redraw what changed, the compositor stacks the windows by z-index)
+            for widget in widget_container.return_render_order():
+                if isinstance(widget, FloatingWidget):
+                    if widget.dirty:
+                        widget.draw(widget_container)
+                        widget.noutrefresh()
+                        screen_changed = True
+                    continue
 
-            # Main drawing loop (refresh all widgets)
-            for widget in (
-                    w
-                    for z in sorted(widgets_by_z)
-                    for w in widgets_by_z[z]
-            ):
+                snapshot: WidgetSnapshot = widget.snapshot  # Immutable, read once without locking
+                # Errors are logged once per snapshot, not on every redraw of it
+                new_snapshot: bool = snapshot.generation != widget.drawn_generation
                 try:
                     if widget_container.stop_event.is_set():
                         break
 
-                    if not widget.updatable():
-                        widget.draw_function(widget_container)
-                        widget.noutrefresh()
+                    if not widget_container.widget_requires_redraw(widget, now):
                         continue
 
-                    if widget.draw_data:
-                        with widget.lock:
-                            data_copy: list[str] = widget.draw_data.copy()
-                            error_copy: dict[str, typing.Any] = widget.error_data.copy()
-                        if '__error__' in error_copy:
-                            if isinstance(error_copy['__error__'], LogMessages):
-                                for log_message in list(error_copy['__error__']):
-                                    widget_container.display_error(widget, [str(log_message)])
-                                    if log_message not in list(widget_container.log_messages):
-                                        widget_container.log_messages.add_log_message(log_message)
-                            else:
-                                widget_container.display_error(widget, [error_copy['__error__']])
+                    if not widget.updatable():
+                        widget.draw_function(widget_container)
+                    elif snapshot.error is not None:
+                        # Breaker state & next retry (see CircuitBreaker)
+                        retry_status: list[str] = [snapshot.retry_status] if snapshot.retry_status else []
+                        if isinstance(snapshot.error, LogMessages):
+                            for log_message in snapshot.error:
+                                widget_container.display_error(widget, [str(log_message)] + retry_status)
+                                if new_snapshot:
+                                    widget_container.log_messages.add_log_message(log_message)
                         else:
-                            widget.draw_function(widget_container, data_copy)
-                    # else: Data still loading; Or the function is intended to return []
-                    # In that case, make the function instead return ['Success'] or similar
+                            widget_container.display_error(widget, [snapshot.error] + retry_status)
+                    elif snapshot.lines:
+                        widget.draw_function(widget_container, list(snapshot.lines))
+                    else:
+                        # Data still loading; Or the function is intended to return []
+                        # In that case, make the function instead return ['Success'] or similar
+                        continue
                 except ConfigSpecificException as e:
-                    for log_message in list(e.log_messages):
+                    for log_message in e.log_messages:
                         widget_container.display_error(widget, [str(log_message)])
-                        if log_message not in list(widget_container.log_messages):
+                        if new_snapshot:
                             widget_container.log_messages.add_log_message(log_message)
                 except Exception as e:
                     if hasattr(e, 'log_messages'):
-                        for log_message in list(e.log_messages):
+                        for log_message in e.log_messages:
                             widget_container.display_error(widget, [str(log_message)])
-                            if log_message not in list(widget_container.log_messages):
+                            if new_snapshot:
                                 widget_container.log_messages.add_log_message(log_message)
                     else:
                         new_log_message: LogMessage = LogMessage(
                             f'{str(e)} (widget "{widget.name}")', LogLevels.ERROR.key
                         )
 
-                        if new_log_message not in list(widget_container.log_messages):
+                        if new_snapshot:
                             widget_container.log_messages.add_log_message(new_log_message)
                         # If the widget failed, show the error inside the widget
                         widget_container.display_error(widget, [str(e)])
 
+                widget.mark_clean(now, snapshot)
+                screen_changed = True
                 widget.noutrefresh()
 
-            # Refresh all floating widgets
-            # Draw last, so they show on top
-            for floating_widget in widget_container.return_all_floating_windows():
-                floating_widget.draw(widget_container)
-                floating_widget.noutrefresh()
-            widget_container.update_screen()
+            if screen_changed:
+                widget_container.update_screen()
+
+            # Sleep until input arrives, the scheduler published new data or a time-based redraw is due
+            widget_container.wait_for_events(widget_container.next_redraw_timeout(time_module.time()))
         except (
                 RestartException,
                 ConfigScanFoundError,